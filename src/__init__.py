@@ -3,7 +3,23 @@ Src Package
 Clean Architecture Telegram Görsel Otomasyon Botu
 """
 
-from .container import get_container, Container
-from .presentation import run_bot
+import importlib
 
-__all__ = ["get_container", "Container", "run_bot"]
+# Dışa aktarılan isim → tanımlandığı alt modül (ilk erişimde yüklenir)
+_LAZY_EXPORTS = {
+    "get_container": ".container",
+    "Container": ".container",
+    "run_bot": ".presentation",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
@@ -27,6 +27,7 @@ from .dtos import (
 )
 
 from .services import ProgressNotifierService
+from .services.browser_executor import BROWSER_SESSION_LOCK, run_in_browser_thread
 
 __all__ = [
     # Use Cases
@@ -48,5 +49,7 @@ __all__ = [
     "BotImageRequest",
     # Services
     "ProgressNotifierService",
+    "BROWSER_SESSION_LOCK",
+    "run_in_browser_thread",
 ]
 
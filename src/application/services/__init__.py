@@ -3,7 +3,9 @@ Application Services
 İş mantığı servisleri
 """
 
+from datetime import timedelta
 from typing import Optional
+import asyncio
 import time
 import logging
 
@@ -18,6 +20,13 @@ class ProgressNotifierService(IProgressNotifier):
     Telegram mesajlarını güncellemek için kullanılır.
     """
     
+    # Mesaj ayırıcı ve ilerleme başlığı (sabit)
+    _SEPARATOR = "━" * 24
+    _HEADER = ("🤖 AI Görsel Otomasyon", _SEPARATOR)
+    
+    # 429 cezası için beklenecek en uzun süre (saniye)
+    MAX_RETRY_AFTER = 30
+    
     # Adım bilgileri
     STEPS = [
         {"status": ProcessStatus.DOWNLOADING, "emoji": "📥", "name": "Dosya indiriliyor"},
@@ -31,6 +40,47 @@ class ProgressNotifierService(IProgressNotifier):
         {"status": ProcessStatus.DOWNLOADING_RESULT, "emoji": "📥", "name": "Görsel indiriliyor"},
     ]
     
+    # Yalnızca bu adımlar mesajı düzenler; aradaki kısa adımlar bir sonraki
+    # kilometre taşında görünür (her adımda edit_text çağrılmaz)
+    MILESTONES = frozenset({
+        ProcessStatus.DOWNLOADING,
+        ProcessStatus.ANALYZING,
+        ProcessStatus.PROMPT_RECEIVED,
+        ProcessStatus.GENERATING,
+        ProcessStatus.DOWNLOADING_RESULT,
+    })
+    
+    # Adım satırları bir kez oluşturulur: (tamamlandı, aktif, bekliyor)
+    _RENDERED_STEPS = tuple(
+        (f"✅ {step['name']}", f"▶️ {step['name']}...", f"⬜ {step['name']}")
+        for step in STEPS
+    )
+    
+    # Tamamlama mesajı şablonları (ayırıcı gömülü, yalnızca değişkenler doldurulur)
+    _SUCCESS_MULTI_TEMPLATE = (
+        "🎉 {total} GÖRSEL OLUŞTURULDU!\n"
+        f"{_SEPARATOR}\n\n"
+        "✅ Tüm görseller başarıyla oluşturuldu\n\n"
+        "⏱️ Toplam süre: {elapsed} saniye\n"
+        "⚡ Ortalama: {average}s/görsel\n\n"
+        "📎 Görselleriniz aşağıda 👇"
+    )
+    _SUCCESS_SINGLE_TEMPLATE = (
+        "🎉 İŞLEM TAMAMLANDI!\n"
+        f"{_SEPARATOR}\n\n"
+        "✅ Görsel başarıyla oluşturuldu\n\n"
+        "⏱️ Toplam süre: {elapsed} saniye\n\n"
+        "📎 Görseliniz aşağıda 👇"
+    )
+    _FAILURE_TEMPLATE = (
+        "❌ İŞLEM BAŞARISIZ\n"
+        f"{_SEPARATOR}\n\n"
+        "⚠️ {details}\n"
+        "{completed_info}\n"
+        "⏱️ Geçen süre: {elapsed}s\n\n"
+        "🔄 Tekrar denemek için yeni bir fotoğraf gönderin."
+    )
+    
     def __init__(
         self,
         update_callback,  # async def callback(text: str) -> None
@@ -41,11 +91,15 @@ class ProgressNotifierService(IProgressNotifier):
         self.current_image = 0
         self.completed_images = 0
         self.current_step = 0
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.extra_info = ""
-        self._last_update = 0
+        self._last_update = 0.0
         self._min_update_interval = 1.5  # Minimum 1.5 saniye ara
+        self._pending_flush: Optional[asyncio.Task] = None  # Ertelenmiş güncelleme
+        self._send_lock = asyncio.Lock()  # Düzenlemeler sırayla gider
         self._is_completed = False  # Tamamlandı flag'i
+        self._suppress_until = 0.0  # Rate limit (429) cezası bitene kadar düzenleme yok
+        self._last_rendered = ""  # Son gönderilen ilerleme metni
     
     def _get_step_index(self, status: ProcessStatus) -> int:
         """Status'tan step index bul"""
@@ -55,38 +109,36 @@ class ProgressNotifierService(IProgressNotifier):
         return self.current_step
     
     def _build_message(self) -> str:
-        """İlerleme mesajını oluştur"""
-        lines = ["🤖 **AI Görsel Otomasyon**", "━" * 24]
+        """İlerleme mesajını oluştur (düz metin - biçimlendirme ayrıştırması yok)"""
+        lines = list(self._HEADER)
         
         # Çoklu görsel bilgisi
         if self.total_images > 1:
-            lines.append(f"🎯 Hedef: **{self.total_images} görsel**")
+            lines.append(f"🎯 Hedef: {self.total_images} görsel")
             if self.current_image > 0:
                 lines.append(f"📸 İşleniyor: Görsel {self.current_image}/{self.total_images}")
             if self.completed_images > 0:
                 lines.append(f"✅ Tamamlanan: {self.completed_images}/{self.total_images}")
             lines.append("")
         
-        for i, step in enumerate(self.STEPS):
-            if i < self.current_step:
-                lines.append(f"✅ ~~{step['name']}~~")
-            elif i == self.current_step:
-                lines.append(f"▶️ **{step['name']}...**")
-            else:
-                lines.append(f"⬜ {step['name']}")
+        current = self.current_step
+        lines.extend(
+            done if i < current else active if i == current else pending
+            for i, (done, active, pending) in enumerate(self._RENDERED_STEPS)
+        )
         
         if self.extra_info:
             lines.append("")
-            lines.append(f"💡 _{self.extra_info}_")
+            lines.append(f"💡 {self.extra_info}")
         
-        elapsed = int(time.time() - self.start_time)
+        elapsed = int(time.monotonic() - self.start_time)
         lines.append("")
         lines.append(f"⏱️ Geçen süre: {elapsed}s")
         
         return "\n".join(lines)
     
     async def notify_step(self, status: ProcessStatus, extra_info: str = "") -> None:
-        """Adımı bildir - rate limiting ile"""
+        """Adımı bildir - yalnızca kilometre taşlarında, rate limiting ile"""
         # Tamamlandıysa güncelleme yapma
         if self._is_completed:
             return
@@ -94,16 +146,8 @@ class ProgressNotifierService(IProgressNotifier):
         self.current_step = self._get_step_index(status)
         self.extra_info = extra_info
         
-        # Rate limiting kontrolü
-        current_time = time.time()
-        if current_time - self._last_update < self._min_update_interval:
-            return
-        self._last_update = current_time
-        
-        try:
-            await self.update_callback(self._build_message())
-        except Exception as e:
-            logger.debug(f"Mesaj güncellenemedi: {e}")
+        if status in self.MILESTONES:
+            await self._publish()
     
     async def notify_image_progress(self, current: int, total: int) -> None:
         """Görsel üretim ilerlemesini bildir - rate limiting ile"""
@@ -115,16 +159,64 @@ class ProgressNotifierService(IProgressNotifier):
         self.total_images = total
         self.completed_images = current  # Tamamlanan sayısını güncelle
         
-        # Rate limiting kontrolü
-        current_time = time.time()
-        if current_time - self._last_update < self._min_update_interval:
+        await self._publish()
+    
+    async def _publish(self) -> None:
+        """
+        Güncel durumu gönder - rate limiting ile.
+        Aralık dolmadan gelen güncellemeler tek bir ertelenmiş gönderimde
+        birleştirilir; son durum kaybolmaz.
+        """
+        if self._pending_flush is not None:
+            return  # Ertelenmiş gönderim en güncel mesajı oluşturacak
+        
+        now = time.monotonic()
+        wait = max(
+            self._min_update_interval - (now - self._last_update),
+            self._suppress_until - now,
+        )
+        if wait > 0:
+            self._pending_flush = asyncio.create_task(self._flush_after(wait))
+            return
+        
+        await self._send_progress()
+    
+    async def _flush_after(self, delay: float) -> None:
+        """Bekleyip birikmiş son durumu gönder"""
+        await asyncio.sleep(delay)
+        self._pending_flush = None
+        if not self._is_completed:
+            await self._send_progress()
+    
+    async def _send_progress(self) -> None:
+        """İlerleme mesajını oluşturup gönder (metin değişmediyse atla)"""
+        text = self._build_message()
+        if text == self._last_rendered:
             return
-        self._last_update = current_time
         
-        try:
-            await self.update_callback(self._build_message())
-        except Exception as e:
-            logger.debug(f"Mesaj güncellenemedi: {e}")
+        self._last_update = time.monotonic()
+        async with self._send_lock:
+            if self._is_completed:
+                return
+            try:
+                await self.update_callback(text)
+                self._last_rendered = text
+            except Exception as e:
+                # Telegram "message is not modified" → mesaj zaten bu metinde
+                if "not modified" in str(e).lower():
+                    self._last_rendered = text
+                    return
+                self._note_rate_limit(e)
+                logger.debug(f"Mesaj güncellenemedi: {e}")
+    
+    def _note_rate_limit(self, error: Exception) -> None:
+        """429 hatasındaki retry_after süresince düzenlemeleri durdur"""
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is None:
+            return
+        if isinstance(retry_after, timedelta):
+            retry_after = retry_after.total_seconds()
+        self._suppress_until = time.monotonic() + min(retry_after, self.MAX_RETRY_AFTER)
     
     async def notify_complete(self, success: bool, details: str = "") -> None:
         """Tamamlanma durumunu bildir - sadece bir kez çağrılır"""
@@ -133,41 +225,40 @@ class ProgressNotifierService(IProgressNotifier):
             return
         self._is_completed = True
         
-        elapsed = int(time.time() - self.start_time)
+        # Bekleyen ilerleme güncellemesi tamamlama mesajını ezmesin
+        if self._pending_flush is not None:
+            self._pending_flush.cancel()
+            self._pending_flush = None
+        
+        elapsed = int(time.monotonic() - self.start_time)
         
         if success:
             if self.total_images > 1:
-                text = (
-                    f"🎉 **{self.total_images} GÖRSEL OLUŞTURULDU!**\n"
-                    "━" * 24 + "\n\n"
-                    f"✅ Tüm görseller başarıyla oluşturuldu\n\n"
-                    f"⏱️ Toplam süre: **{elapsed} saniye**\n"
-                    f"⚡ Ortalama: **{elapsed // self.total_images}s/görsel**\n\n"
-                    "📎 Görselleriniz aşağıda 👇"
+                text = self._SUCCESS_MULTI_TEMPLATE.format(
+                    total=self.total_images,
+                    elapsed=elapsed,
+                    average=elapsed // self.total_images,
                 )
             else:
-                text = (
-                    "🎉 **İŞLEM TAMAMLANDI!**\n"
-                    "━" * 24 + "\n\n"
-                    "✅ Görsel başarıyla oluşturuldu\n\n"
-                    f"⏱️ Toplam süre: **{elapsed} saniye**\n\n"
-                    "📎 Görseliniz aşağıda 👇"
-                )
+                text = self._SUCCESS_SINGLE_TEMPLATE.format(elapsed=elapsed)
         else:
             completed_info = ""
             if self.completed_images > 0:
                 completed_info = f"\n✅ {self.completed_images} görsel başarıyla oluşturuldu\n"
             
-            text = (
-                "❌ **İŞLEM BAŞARISIZ**\n"
-                "━" * 24 + "\n\n"
-                f"⚠️ {details}\n"
-                f"{completed_info}\n"
-                f"⏱️ Geçen süre: {elapsed}s\n\n"
-                "🔄 Tekrar denemek için yeni bir fotoğraf gönderin."
+            text = self._FAILURE_TEMPLATE.format(
+                details=details,
+                completed_info=completed_info,
+                elapsed=elapsed,
             )
         
-        try:
-            await self.update_callback(text)
-        except Exception as e:
-            logger.debug(f"Tamamlama mesajı güncellenemedi: {e}")
+        # Yolda olan ilerleme düzenlemesi bitsin; son mesaj tamamlama olsun
+        async with self._send_lock:
+            # Aktif rate limit cezası varsa bitmesini bekle, sonra gönder
+            wait = self._suppress_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                await self.update_callback(text)
+            except Exception as e:
+                logger.debug(f"Tamamlama mesajı güncellenemedi: {e}")
@@ -0,0 +1,24 @@
+"""
+Tarayıcı Yürütücüsü
+Selenium çağrılarını event loop dışında, tek bir iş parçacığında çalıştırır.
+Çok adımlı akışlar BROWSER_SESSION_LOCK ile sıraya girer.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, TypeVar
+import asyncio
+
+T = TypeVar("T")
+
+# Selenium thread-safe değil: tüm tarayıcı çağrıları tek worker'da sıralanır
+_BROWSER_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser")
+
+# Tek Chrome oturumu: çok adımlı tarayıcı akışları birbirine karışmasın
+BROWSER_SESSION_LOCK = asyncio.Lock()
+
+
+async def run_in_browser_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Bloklayan tarayıcı çağrısını ortak worker'da çalıştır ve sonucu bekle"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BROWSER_EXECUTOR, partial(func, *args, **kwargs))
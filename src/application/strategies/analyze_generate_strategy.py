@@ -15,6 +15,7 @@ from ...domain import (
     DomainException,
 )
 from ..dtos import ImageProcessResult
+from ..services.browser_executor import run_in_browser_thread
 from .base_strategy import WorkflowStrategy, WorkflowContext
 
 if TYPE_CHECKING:
@@ -52,7 +53,7 @@ class AnalyzeAndGenerateStrategy(WorkflowStrategy):
     
     async def execute(self, context: WorkflowContext) -> ImageProcessResult:
         """Analiz → Generate akışını çalıştır"""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             logger.info(f"Strateji başlatılıyor: {self.get_name()}")
@@ -65,7 +66,7 @@ class AnalyzeAndGenerateStrategy(WorkflowStrategy):
             )
             
             if not self.browser_service.is_running():
-                self.browser_service.start()
+                await run_in_browser_thread(self.browser_service.start)
             
             # 2. Analiz
             await self._notify_progress(
@@ -74,7 +75,8 @@ class AnalyzeAndGenerateStrategy(WorkflowStrategy):
                 "Görsel analiz ediliyor..."
             )
             
-            extracted_prompt = self.ai_service.analyze_image(
+            extracted_prompt = await run_in_browser_thread(
+                self.ai_service.analyze_image,
                 context.original_image,
                 context.system_prompt
             )
@@ -94,7 +96,9 @@ class AnalyzeAndGenerateStrategy(WorkflowStrategy):
                     f"Görsel oluşturuluyor ({i + 1}/{context.request.target_count})..."
                 )
                 
-                generated_image = self.ai_service.generate_image(extracted_prompt)
+                generated_image = await run_in_browser_thread(
+                    self.ai_service.generate_image, extracted_prompt
+                )
                 context.add_generated_image(generated_image)
                 
                 if context.progress_notifier:
@@ -104,7 +108,7 @@ class AnalyzeAndGenerateStrategy(WorkflowStrategy):
                     )
             
             # Sonuç
-            duration = int(time.time() - start_time)
+            duration = int(time.monotonic() - start_time)
             
             return ImageProcessResult(
                 success=True,
@@ -115,7 +119,7 @@ class AnalyzeAndGenerateStrategy(WorkflowStrategy):
             
         except DomainException as e:
             logger.error(f"Strateji hatası: {e}")
-            duration = int(time.time() - start_time)
+            duration = int(time.monotonic() - start_time)
             
             return ImageProcessResult(
                 success=False,
@@ -126,7 +130,7 @@ class AnalyzeAndGenerateStrategy(WorkflowStrategy):
         finally:
             # Tarayıcıyı kapat
             try:
-                self.browser_service.stop()
+                await run_in_browser_thread(self.browser_service.stop)
             except Exception as e:
                 logger.warning(f"Tarayıcı kapatılırken hata: {e}")
     
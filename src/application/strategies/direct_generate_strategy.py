@@ -13,6 +13,7 @@ from ...domain import (
     DomainException,
 )
 from ..dtos import ImageProcessResult
+from ..services.browser_executor import run_in_browser_thread
 from .base_strategy import WorkflowStrategy, WorkflowContext
 
 logger = logging.getLogger(__name__)
@@ -46,7 +47,7 @@ class DirectGenerateStrategy(WorkflowStrategy):
     
     async def execute(self, context: WorkflowContext) -> ImageProcessResult:
         """Doğrudan generate akışını çalıştır"""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         # Prompt kontrolü
         if not context.system_prompt:
@@ -67,7 +68,7 @@ class DirectGenerateStrategy(WorkflowStrategy):
             )
             
             if not self.browser_service.is_running():
-                self.browser_service.start()
+                await run_in_browser_thread(self.browser_service.start)
             
             # 2. Doğrudan görsel oluştur
             prompt = context.system_prompt
@@ -80,7 +81,9 @@ class DirectGenerateStrategy(WorkflowStrategy):
                     f"Görsel oluşturuluyor ({i + 1}/{context.request.target_count})..."
                 )
                 
-                generated_image = self.ai_service.generate_image(prompt)
+                generated_image = await run_in_browser_thread(
+                    self.ai_service.generate_image, prompt
+                )
                 context.add_generated_image(generated_image)
                 
                 if context.progress_notifier:
@@ -90,7 +93,7 @@ class DirectGenerateStrategy(WorkflowStrategy):
                     )
             
             # Sonuç
-            duration = int(time.time() - start_time)
+            duration = int(time.monotonic() - start_time)
             
             return ImageProcessResult(
                 success=True,
@@ -101,7 +104,7 @@ class DirectGenerateStrategy(WorkflowStrategy):
             
         except DomainException as e:
             logger.error(f"Strateji hatası: {e}")
-            duration = int(time.time() - start_time)
+            duration = int(time.monotonic() - start_time)
             
             return ImageProcessResult(
                 success=False,
@@ -111,7 +114,7 @@ class DirectGenerateStrategy(WorkflowStrategy):
         
         finally:
             try:
-                self.browser_service.stop()
+                await run_in_browser_thread(self.browser_service.stop)
             except Exception as e:
                 logger.warning(f"Tarayıcı kapatılırken hata: {e}")
     
@@ -14,6 +14,7 @@ from ...domain import (
     ProcessStatus,
     AIServiceError,
 )
+from ..services.browser_executor import run_in_browser_thread
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +64,7 @@ class AnalyzeImageUseCase:
                 )
             
             if not self.browser_service.is_running():
-                self.browser_service.start()
+                await run_in_browser_thread(self.browser_service.start)
             
             # Analiz yap
             if progress_notifier:
@@ -72,7 +73,9 @@ class AnalyzeImageUseCase:
                     "Görsel analiz ediliyor..."
                 )
             
-            extracted_prompt = self.ai_service.analyze_image(image, system_prompt)
+            extracted_prompt = await run_in_browser_thread(
+                self.ai_service.analyze_image, image, system_prompt
+            )
             
             if progress_notifier:
                 await progress_notifier.notify_step(
@@ -13,6 +13,7 @@ from ...domain import (
     ProcessStatus,
     ImageGenerationError,
 )
+from ..services.browser_executor import run_in_browser_thread
 
 logger = logging.getLogger(__name__)
 
@@ -60,10 +61,10 @@ class GenerateImageUseCase:
                     )
                 
                 # Yeni oturum başlat (her görsel için)
-                self.ai_service.start_new_session()
+                await run_in_browser_thread(self.ai_service.start_new_session)
                 
                 # Görsel oluştur
-                image = self.ai_service.generate_image(prompt)
+                image = await run_in_browser_thread(self.ai_service.generate_image, prompt)
                 generated_images.append(image)
                 
                 logger.info(f"Görsel {i}/{count} oluşturuldu: {image.path}")
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from ...domain.entities import ImageEntity, ProcessContext, ProcessStatus
 from ...domain.interfaces import IAIService, IBotGateway
+from ..services.browser_executor import run_in_browser_thread
 
 class GenerateImagesUseCase:
     """
@@ -16,14 +17,16 @@ class GenerateImagesUseCase:
             # 1. Analiz
             context.status = ProcessStatus.ANALYZING
             await self.bot_gateway.send_message(chat_id, "🧠 Görsel analiz ediliyor...")
-            extracted_prompt = self.ai_service.analyze_image(context.original_image, system_prompt)
+            extracted_prompt = await run_in_browser_thread(
+                self.ai_service.analyze_image, context.original_image, system_prompt
+            )
             context.extracted_prompt = extracted_prompt
 
             # 2. Üretim
             context.status = ProcessStatus.GENERATING
             for i in range(context.target_count):
                 await self.bot_gateway.send_message(chat_id, f"🎨 Görsel {i+1}/{context.target_count} oluşturuluyor...")
-                generated_image = self.ai_service.generate_image(extracted_prompt)
+                generated_image = await run_in_browser_thread(self.ai_service.generate_image, extracted_prompt)
                 context.generated_images.append(generated_image)
                 await self.bot_gateway.send_image(chat_id, generated_image, f"Görsel {i+1} hazır!")
 
@@ -4,6 +4,7 @@ Görsel analizi + Görsel oluşturma orkestratörü
 """
 
 from typing import List, Optional
+import asyncio
 import logging
 import time
 
@@ -19,6 +20,7 @@ from ...domain import (
     DomainException,
 )
 from ..dtos import ImageProcessRequest, ImageProcessResult
+from ..services.browser_executor import BROWSER_SESSION_LOCK, run_in_browser_thread
 from .analyze_image import AnalyzeImageUseCase
 from .generate_image import GenerateImageUseCase
 
@@ -31,6 +33,9 @@ class ProcessImageWorkflowUseCase:
     SOLID - Tek Sorumluluk: Use case'leri koordine eder.
     """
     
+    # Başarılı işten sonra açık kalan tarayıcı bu kadar boşta kalırsa kapatılır (saniye)
+    BROWSER_IDLE_TIMEOUT = 300
+    
     def __init__(
         self,
         ai_service: IAIService,
@@ -44,6 +49,8 @@ class ProcessImageWorkflowUseCase:
         # Alt use case'ler - Composition
         self.analyze_use_case = AnalyzeImageUseCase(ai_service, browser_service)
         self.generate_use_case = GenerateImageUseCase(ai_service)
+        
+        self._idle_close: Optional[asyncio.Task] = None
     
     async def execute(
         self,
@@ -62,7 +69,19 @@ class ProcessImageWorkflowUseCase:
         Returns:
             İşlem sonucu
         """
-        start_time = time.time()
+        # Tek tarayıcı oturumu: aynı anda yalnızca bir iş akışı çalışır
+        async with BROWSER_SESSION_LOCK:
+            self._cancel_idle_close()
+            return await self._execute_locked(request, system_prompt, progress_notifier)
+    
+    async def _execute_locked(
+        self,
+        request: ImageProcessRequest,
+        system_prompt: str,
+        progress_notifier: Optional[IProgressNotifier],
+    ) -> ImageProcessResult:
+        """İş akışı gövdesi - BROWSER_SESSION_LOCK tutulurken çağrılır"""
+        start_time = time.monotonic()
         
         # Context oluştur
         session = SessionEntity(chat_id=request.chat_id, user_id=request.user_id)
@@ -74,6 +93,9 @@ class ProcessImageWorkflowUseCase:
             target_count=request.target_count,
         )
         
+        # Başarılı işten sonra tarayıcı sıcak kalır; hata sonrası temiz başlangıç
+        keep_browser = False
+        
         try:
             logger.info(f"İş akışı başlatılıyor: {session.session_id}")
             
@@ -97,9 +119,10 @@ class ProcessImageWorkflowUseCase:
                 context.add_generated_image(img)
             
             context.mark_completed()
+            keep_browser = True
             
             # Sonuç DTO'su oluştur
-            duration = int(time.time() - start_time)
+            duration = int(time.monotonic() - start_time)
             
             return ImageProcessResult(
                 success=True,
@@ -112,7 +135,7 @@ class ProcessImageWorkflowUseCase:
             logger.error(f"İş akışı hatası: {e}")
             context.mark_failed(str(e))
             
-            duration = int(time.time() - start_time)
+            duration = int(time.monotonic() - start_time)
             return ImageProcessResult(
                 success=False,
                 error_message=str(e),
@@ -120,8 +143,46 @@ class ProcessImageWorkflowUseCase:
             )
         
         finally:
-            # Tarayıcıyı kapat
+            # Hata olduysa tarayıcıyı kapat; bir sonraki iş yeniden açar
+            if keep_browser:
+                self._schedule_idle_close()
+            else:
+                await self._stop_browser()
+    
+    async def warm_up_browser(self) -> None:
+        """
+        Tarayıcıyı iş gelmeden önce başlat (zaten açıksa bir şey yapmaz).
+        İş hiç gelmezse (iptal, yanıtsız kullanıcı) boşta kapatma devreye girer.
+        """
+        async with BROWSER_SESSION_LOCK:
+            self._cancel_idle_close()
             try:
-                self.browser_service.stop()
-            except Exception as e:
-                logger.warning(f"Tarayıcı kapatılırken hata: {e}")
+                if not self.browser_service.is_running():
+                    await run_in_browser_thread(self.browser_service.start)
+            finally:
+                self._schedule_idle_close()
+    
+    def _schedule_idle_close(self) -> None:
+        """Boşta kapatma zamanlayıcısını başlat (kilit tutulurken çağrılır)"""
+        self._idle_close = asyncio.create_task(self._close_when_idle())
+    
+    def _cancel_idle_close(self) -> None:
+        """Yeni iş geldi - bekleyen boşta kapatmayı iptal et"""
+        if self._idle_close is not None:
+            self._idle_close.cancel()
+            self._idle_close = None
+    
+    async def _close_when_idle(self) -> None:
+        """Süre boyunca yeni iş gelmezse tarayıcıyı kapat"""
+        await asyncio.sleep(self.BROWSER_IDLE_TIMEOUT)
+        async with BROWSER_SESSION_LOCK:
+            self._idle_close = None
+            logger.info("Tarayıcı boşta, kapatılıyor...")
+            await self._stop_browser()
+    
+    async def _stop_browser(self) -> None:
+        """Tarayıcıyı worker thread'de kapat"""
+        try:
+            await run_in_browser_thread(self.browser_service.stop)
+        except Exception as e:
+            logger.warning(f"Tarayıcı kapatılırken hata: {e}")
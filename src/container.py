@@ -4,6 +4,7 @@ ContainerBuilder pattern ile OCP uyumlu DI yönetimi.
 """
 
 from typing import Optional, Dict, Any, Type
+from pathlib import Path
 import logging
 
 from .infrastructure import (
@@ -31,6 +32,10 @@ from .domain import IConfigProvider
 
 logger = logging.getLogger(__name__)
 
+# Çalışan WebDriver oturumunun saklandığı dosyanın eki. Dosya profil dizininin
+# yanında tutulur; Chrome'un kullandığı profil dizinine yazılmaz.
+BROWSER_SESSION_SUFFIX = ".webdriver_session.json"
+
 
 class ContainerBuilder:
     """
@@ -122,7 +127,8 @@ class Container:
         # 2. Infrastructure - Browser
         self.browser_service = SeleniumBrowserService(
             profile_path=self.config.chrome_profile_path,
-            download_dir=self.config.images_dir
+            download_dir=self.config.images_dir,
+            session_file=self._browser_session_file(self.config.chrome_profile_path),
         )
         
         # 3. AI Provider Registry
@@ -169,6 +175,12 @@ class Container:
         
         logger.info("DI Container hazır")
     
+    @staticmethod
+    def _browser_session_file(profile_path: str) -> str:
+        """Profilin oturum dosyası - profil dizininin kardeşi (chrome_profile.webdriver_session.json)"""
+        profile = Path(profile_path)
+        return str(profile.with_name(profile.name + BROWSER_SESSION_SUFFIX))
+    
     def _setup_ai_registry(
         self, 
         custom_providers: Optional[Dict[str, Type[BaseAIProvider]]]
@@ -49,6 +49,8 @@ class PluginRegistry(Generic[T], ABC):
         self._plugins: Dict[str, Type[T]] = {}
         self._instances: Dict[str, T] = {}
         self._metadata: Dict[str, PluginMetadata] = {}
+        # Önceliğe göre sıralı plugin isimleri (register/clear ile geçersizleşir)
+        self._priority_order: Optional[List[str]] = None
     
     @abstractmethod
     def _get_plugin_package(self) -> str:
@@ -78,6 +80,7 @@ class PluginRegistry(Generic[T], ABC):
         
         self._plugins[name] = plugin_class
         self._metadata[name] = metadata
+        self._priority_order = None
         logger.info(f"Plugin kaydedildi: {name} (v{metadata.version})")
     
     def discover(self) -> int:
@@ -159,20 +162,23 @@ class PluginRegistry(Generic[T], ABC):
         Returns:
             Plugin instance veya None
         """
-        candidates = [
-            (name, meta) 
-            for name, meta in self._metadata.items() 
-            if meta.supports(feature)
-        ]
+        for name in self._by_priority():
+            if self._metadata[name].supports(feature):
+                return self.get(name, **kwargs)
         
-        if not candidates:
-            return None
-        
-        # Önceliğe göre sırala
-        candidates.sort(key=lambda x: x[1].priority, reverse=True)
-        best_name = candidates[0][0]
-        
-        return self.get(best_name, **kwargs)
+        return None
+    
+    def _by_priority(self) -> List[str]:
+        """Plugin isimleri, en öncelikli ilk (sonuç önbelleğe alınır)"""
+        if self._priority_order is None:
+            self._priority_order = [
+                name for name, _ in sorted(
+                    self._metadata.items(),
+                    key=lambda x: x[1].priority,
+                    reverse=True
+                )
+            ]
+        return self._priority_order
     
     def list_plugins(self) -> List[str]:
         """Kayıtlı plugin isimlerini listele"""
@@ -187,3 +193,4 @@ class PluginRegistry(Generic[T], ABC):
         self._plugins.clear()
         self._instances.clear()
         self._metadata.clear()
+        self._priority_order = None
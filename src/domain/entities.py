@@ -10,6 +10,9 @@ from typing import List, Optional
 from pathlib import Path
 import uuid
 
+# Desteklenen görsel uzantıları (küçük harf)
+VALID_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.gif'})
+
 
 class ProcessStatus(Enum):
     """İşlem durumu enum'u"""
@@ -54,8 +57,7 @@ class ImageEntity:
     
     def is_valid_image(self) -> bool:
         """Geçerli görsel formatı mı?"""
-        valid_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.gif'}
-        return self.extension in valid_extensions
+        return self.extension in VALID_IMAGE_EXTENSIONS
 
 
 @dataclass
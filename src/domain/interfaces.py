@@ -32,6 +32,21 @@ class IBrowserService(ABC):
         """Tarayıcı çalışıyor mu?"""
         pass
     
+    @abstractmethod
+    def is_page_ready(self) -> bool:
+        """Açık sayfa yüklenmesini tamamladı mı?"""
+        pass
+    
+    @abstractmethod
+    def is_alive(self) -> bool:
+        """Çalışan tarayıcı hâlâ yanıt veriyor mu?"""
+        pass
+    
+    @abstractmethod
+    def add_stop_listener(self, callback: Callable[[Optional[str]], None]) -> None:
+        """Tarayıcı kapanınca oturum kimliğiyle çağrılacak fonksiyonu kaydet"""
+        pass
+    
     @abstractmethod
     def get_cookies(self) -> list:
         """Çerezleri döndür"""
@@ -159,3 +174,8 @@ class IConfigProvider(ABC):
     @abstractmethod
     def prompt_text(self) -> str:
         pass
+    
+    @property
+    @abstractmethod
+    def drop_pending_updates(self) -> bool:
+        pass
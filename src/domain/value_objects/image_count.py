@@ -4,6 +4,7 @@ Görsel sayısı için tip güvenliği ve doğrulama sağlar.
 """
 
 from dataclasses import dataclass
+from typing import Optional
 
 
 # Class-level sabitler
@@ -38,6 +39,22 @@ class ImageCount:
         except ValueError as e:
             raise ValueError(f"Geçersiz görsel sayısı: {value}") from e
     
+    @classmethod
+    def try_parse(cls, value: str) -> Optional["ImageCount"]:
+        """
+        String'den ImageCount oluştur, geçersizse None döndür.
+        Kullanıcı girdisi için exception'sız hızlı yol.
+        """
+        stripped = value.strip()
+        if not stripped.isdecimal():
+            return None
+        
+        count = int(stripped)
+        if count < _MIN_COUNT or count > _MAX_COUNT:
+            return None
+        
+        return cls(count)
+    
     def __int__(self) -> int:
         return self.value
     
@@ -4,8 +4,11 @@ IClipboardService implementasyonu
 """
 
 import subprocess
+import shutil
 import io
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 import logging
 
 from PIL import Image
@@ -14,6 +17,9 @@ from ...domain import IClipboardService, ClipboardError
 
 logger = logging.getLogger(__name__)
 
+# xclip PATH'te mi? (import sırasında bir kez kontrol edilir)
+_XCLIP_INSTALLED = shutil.which('xclip') is not None
+
 
 class ClipboardService(IClipboardService):
     """
@@ -21,6 +27,35 @@ class ClipboardService(IClipboardService):
     Linux'ta xclip kullanır.
     """
     
+    # Clipboard için PNG sıkıştırma seviyesi (1 = en hızlı deflate)
+    PNG_COMPRESS_LEVEL = 1
+    
+    # Dönüşüm + xclip yazımı için paylaşılan iş parçacığı havuzu
+    ENCODER_WORKERS = 2
+    _encoder_pool: Optional[ThreadPoolExecutor] = None
+    
+    def __init__(self):
+        self._encoder_pool = self._get_encoder_pool()
+    
+    @classmethod
+    def _get_encoder_pool(cls) -> ThreadPoolExecutor:
+        """Havuzu ilk serviste oluştur; yeniden oluşturulan servisler paylaşır"""
+        if cls._encoder_pool is None:
+            cls._encoder_pool = ThreadPoolExecutor(
+                max_workers=cls.ENCODER_WORKERS,
+                thread_name_prefix="clipboard",
+            )
+            # İş parçacığını önceden başlat - ilk kopyalamada bekleme olmasın
+            cls._encoder_pool.submit(lambda: None)
+        return cls._encoder_pool
+    
+    def copy_image_async(self, image_path: str) -> "Future[bool]":
+        """
+        Görseli arka planda clipboard'a kopyala.
+        Bloklayan davranış gerekiyorsa dönen Future'ın .result()'ı çağrılır.
+        """
+        return self._encoder_pool.submit(self.copy_image, image_path)
+    
     def copy_image(self, image_path: str) -> bool:
         """
         Görseli sistem clipboard'ına kopyala.
@@ -49,7 +84,7 @@ class ClipboardService(IClipboardService):
         
         img = Image.open(image_path)
         png_buffer = io.BytesIO()
-        img.save(png_buffer, format='PNG')
+        img.save(png_buffer, format='PNG', compress_level=self.PNG_COMPRESS_LEVEL)
         png_buffer.seek(0)
         
         process = subprocess.Popen(
@@ -68,8 +103,10 @@ class ClipboardService(IClipboardService):
         """PNG dosyasını doğrudan clipboard'a kopyala"""
         logger.debug(f"Doğrudan kopyalama: {image_path}")
         
-        cmd = f'xclip -selection clipboard -t image/png -i "{image_path}"'
-        subprocess.run(cmd, shell=True, check=True)
+        subprocess.run(
+            ['xclip', '-selection', 'clipboard', '-t', 'image/png', '-i', str(image_path)],
+            check=True
+        )
         
         logger.info("Fotoğraf clipboard'a kopyalandı")
         return True
@@ -77,12 +114,4 @@ class ClipboardService(IClipboardService):
     @staticmethod
     def check_xclip_installed() -> bool:
         """xclip'in yüklü olup olmadığını kontrol et"""
-        try:
-            subprocess.run(
-                ['xclip', '-version'],
-                capture_output=True,
-                check=True
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        return _XCLIP_INSTALLED
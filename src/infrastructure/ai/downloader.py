@@ -18,7 +18,9 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from ...domain import IImageDownloader, DownloadError
-from .gemini.scripts import GeminiScripts
+from ..utils import ensure_dir
+from .gemini.scripts import GeminiScripts, GeminiScriptRunner
+from .gemini.selectors import GeminiSelectors
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +31,23 @@ class ImageDownloaderService(IImageDownloader):
     Birden fazla yöntem dener: requests, buton, Chrome indirme.
     """
     
-    def __init__(self, driver: webdriver.Chrome, download_dir: str):
+    def __init__(
+        self,
+        driver: webdriver.Chrome,
+        download_dir: str,
+        scripts: Optional[GeminiScriptRunner] = None,
+    ):
         self.driver = driver
-        self.download_dir = Path(download_dir)
-        self.download_dir.mkdir(parents=True, exist_ok=True)
+        self._scripts = scripts or GeminiScriptRunner(driver)
+        self.download_dir = ensure_dir(download_dir)
+        
+        # Tarayıcı user agent'ı - oturum boyunca değişmez, ilk indirmede alınır
+        self._user_agent: Optional[str] = None
+    
+    @staticmethod
+    def _next_file_name() -> str:
+        """Benzersiz görsel dosya adı üret (yeniden başlatmalar arasında da çakışmaz)"""
+        return f"generated_{uuid.uuid4().hex}.png"
     
     def download(self) -> Optional[str]:
         """
@@ -77,7 +92,7 @@ class ImageDownloaderService(IImageDownloader):
     def _find_image_url(self) -> Optional[str]:
         """JavaScript ile görsel URL'sini bul"""
         try:
-            return self.driver.execute_script(GeminiScripts.FIND_IMAGE_URL)
+            return self._scripts.run("FIND_IMAGE_URL", GeminiSelectors.GENERATED_IMAGE_XPATH)
         except Exception:
             return None
     
@@ -88,6 +103,16 @@ class ImageDownloaderService(IImageDownloader):
             return f"{base_url}=s4096"
         return url
     
+    def _save_content(self, content: bytes) -> Path:
+        """İndirilen içeriği yeni bir dosyaya kaydet"""
+        file_name = self._next_file_name()
+        file_path = self.download_dir / file_name
+        
+        with open(file_path, 'wb') as f:
+            f.write(content)
+        
+        return file_path
+    
     def _download_via_requests(self, url: str) -> str:
         """Requests kütüphanesi ile indir"""
         logger.info("Selenium çerezleri ile indiriliyor...")
@@ -99,9 +124,10 @@ class ImageDownloaderService(IImageDownloader):
             session.cookies.set(cookie['name'], cookie['value'])
         
         # Headers ayarla
-        user_agent = self.driver.execute_script(GeminiScripts.GET_USER_AGENT)
+        if self._user_agent is None:
+            self._user_agent = self.driver.execute_script(GeminiScripts.GET_USER_AGENT)
         headers = {
-            'User-Agent': user_agent,
+            'User-Agent': self._user_agent,
             'Referer': 'https://gemini.google.com/',
             'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
         }
@@ -114,11 +140,7 @@ class ImageDownloaderService(IImageDownloader):
             raise DownloadError(f"HTTP hatası: {response.status_code}")
         
         # Kaydet
-        file_name = f"generated_{uuid.uuid4().hex[:8]}.png"
-        file_path = self.download_dir / file_name
-        
-        with open(file_path, 'wb') as f:
-            f.write(response.content)
+        file_path = self._save_content(response.content)
         
         logger.info(f"Görsel indirildi: {file_path}")
         return str(file_path)
@@ -139,25 +161,37 @@ class ImageDownloaderService(IImageDownloader):
         except Exception:
             pass
         
-        # İndirme butonlarını dene
-        download_selectors = [
-            'button[aria-label="Tam boyutlu resmi indir"]',
-            'button[aria-label*="indir"]',
-            'button[aria-label*="download"]',
-        ]
+        # İndirme butonunu bul - varyantlar öncelik sırasıyla tek çağrıda
+        download_button = self._scripts.find_first(GeminiSelectors.DOWNLOAD_BUTTONS)
+        if not download_button:
+            raise DownloadError("İndirme butonu bulunamadı")
         
-        for selector in download_selectors:
+        self.driver.execute_script("arguments[0].click();", download_button)
+        time.sleep(5)
+        logger.info("İndirme butonu tıklandı")
+        
+        return self._find_chrome_download()
+    
+    # Chrome indirmesi sayılacak görsel uzantıları ve dosya yaşı sınırı
+    IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.webp')
+    RECENT_DOWNLOAD_SECONDS = 30
+    
+    def _scan_images(self, search_dirs):
+        """Tüm dizinleri tek geçişte tara: (ctime, yol) çiftleri"""
+        for search_dir in search_dirs:
             try:
-                download_button = self.driver.find_element(By.CSS_SELECTOR, selector)
-                self.driver.execute_script("arguments[0].click();", download_button)
-                time.sleep(5)
-                logger.info("İndirme butonu tıklandı")
-                
-                return self._find_chrome_download()
-            except Exception:
+                entries = os.scandir(search_dir)
+            except OSError:
                 continue
-        
-        raise DownloadError("İndirme butonu bulunamadı")
+            
+            with entries:
+                for entry in entries:
+                    if not entry.name.lower().endswith(self.IMAGE_SUFFIXES):
+                        continue
+                    try:
+                        yield entry.stat().st_ctime, entry.path
+                    except OSError:
+                        continue
     
     def _find_chrome_download(self) -> str:
         """Chrome'un indirdiği en son dosyayı bul"""
@@ -167,28 +201,18 @@ class ImageDownloaderService(IImageDownloader):
             Path.home() / "Downloads"
         ]
         
-        latest_file = None
-        latest_time = 0
+        newest = max(self._scan_images(search_dirs), default=None)
         
-        for search_dir in search_dirs:
-            if not search_dir.exists():
-                continue
-            
-            for f in search_dir.iterdir():
-                if f.suffix.lower() in ['.png', '.jpg', '.jpeg', '.webp']:
-                    file_time = f.stat().st_ctime
-                    
-                    # Son 30 saniye içinde oluşturulmuş
-                    if time.time() - file_time < 30 and file_time > latest_time:
-                        latest_time = file_time
-                        latest_file = f
-        
-        if not latest_file:
+        # Son 30 saniye içinde oluşturulmuş olmalı
+        cutoff = time.time() - self.RECENT_DOWNLOAD_SECONDS
+        if not newest or newest[0] <= cutoff:
             raise DownloadError("İndirilen dosya bulunamadı")
         
+        latest_file = Path(newest[1])
+        
         # Gerekirse taşı
         if latest_file.parent != self.download_dir:
-            new_name = f"generated_{uuid.uuid4().hex[:8]}.png"
+            new_name = self._next_file_name()
             new_path = self.download_dir / new_name
             shutil.move(str(latest_file), str(new_path))
             logger.info(f"Dosya taşındı: {new_path}")
@@ -4,19 +4,24 @@ Refactored - SRP uyumlu alt modüller
 """
 
 from .selectors import GeminiSelectors
-from .scripts import GeminiScripts
+from .scripts import GeminiScripts, GeminiScriptRunner
 from .timeouts import GeminiTimeouts
+from .network_log import GeminiNetworkLog
 from .navigator import GeminiNavigator
 from .uploader import GeminiImageUploader
 from .prompt_manager import GeminiPromptManager
 from .image_generator import GeminiImageGenerator
+from .modules import GeminiModules
 
 __all__ = [
     "GeminiSelectors",
     "GeminiScripts",
+    "GeminiScriptRunner",
     "GeminiTimeouts",
+    "GeminiNetworkLog",
     "GeminiNavigator",
     "GeminiImageUploader",
     "GeminiPromptManager",
     "GeminiImageGenerator",
+    "GeminiModules",
 ]
@@ -4,17 +4,17 @@ Görsel oluşturma işlemleri.
 SRP: Sadece görsel oluşturma sorumluluğu.
 """
 
-import time
 import logging
 from typing import TYPE_CHECKING, Optional
-from pathlib import Path
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from ....domain import ImageGenerationError, ImageEntity
+from ...utils import ensure_dir, wait_with_retry
 from .selectors import GeminiSelectors
+from .scripts import GeminiScriptRunner
 from .timeouts import GeminiTimeouts
 from ..downloader import ImageDownloaderService
 
@@ -30,18 +30,32 @@ class GeminiImageGenerator:
     Tek Sorumluluk: AI ile görsel oluşturma ve indirme.
     """
     
-    def __init__(self, driver: "webdriver.Chrome", download_dir: str):
+    # Araçlar menüsünde görüntü oluşturma seçeneğinin metni
+    IMAGE_OPTION_KEYWORDS = ['görüntü oluştur', 'create image']
+    
+    def __init__(
+        self,
+        driver: "webdriver.Chrome",
+        download_dir: str,
+        scripts: Optional[GeminiScriptRunner] = None,
+    ):
         self.driver = driver
-        self.download_dir = Path(download_dir)
-        self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.download_dir = ensure_dir(download_dir)
         self.downloader: Optional[ImageDownloaderService] = None
+        self._scripts = scripts or GeminiScriptRunner(driver)
+        self._wait = WebDriverWait(
+            driver,
+            GeminiTimeouts.BUTTON_CLICK,
+            poll_frequency=GeminiTimeouts.POLL_INTERVAL,
+        )
     
     def _ensure_downloader(self) -> None:
         """Downloader'ın hazır olduğundan emin ol"""
         if not self.downloader:
             self.downloader = ImageDownloaderService(
                 self.driver, 
-                str(self.download_dir)
+                str(self.download_dir),
+                scripts=self._scripts,
             )
     
     def select_image_generation_tool(self) -> bool:
@@ -49,52 +63,53 @@ class GeminiImageGenerator:
         logger.info("Görüntü oluşturma aracı seçiliyor...")
         
         try:
-            wait = WebDriverWait(self.driver, GeminiTimeouts.BUTTON_CLICK)
-            time.sleep(GeminiTimeouts.MEDIUM_WAIT)
-            
-            # Araçlar butonunu bul
-            tools_button = None
-            for selector in GeminiSelectors.TOOLS_BUTTON_VARIANTS:
-                try:
-                    tools_button = wait.until(EC.element_to_be_clickable(
-                        (By.CSS_SELECTOR, selector)
-                    ))
-                    break
-                except Exception:
-                    continue
-            
-            if not tools_button:
+            # Araçlar butonunu bul - tüm varyantlar tek selektörde
+            try:
+                tools_button = self._wait.until(EC.element_to_be_clickable(
+                    (By.CSS_SELECTOR, GeminiSelectors.TOOLS_BUTTON_ANY)
+                ))
+            except Exception:
                 logger.error("Araçlar butonu bulunamadı!")
                 return False
             
             # Araçlar butonuna tıkla
             self.driver.execute_script("arguments[0].click();", tools_button)
-            time.sleep(GeminiTimeouts.MEDIUM_WAIT)
             
-            # Seçenekleri bul
+            # Menü açılana kadar seçenekleri bul
             options = []
-            for selector in GeminiSelectors.OPTION_SELECTORS:
-                options = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if options:
-                    break
+            
+            def menu_open() -> bool:
+                nonlocal options
+                options = self._find_menu_options()
+                return bool(options)
+            
+            wait_with_retry(
+                menu_open,
+                timeout=GeminiTimeouts.MEDIUM_WAIT,
+                interval=GeminiTimeouts.POLL_INTERVAL,
+                description="Araçlar menüsü",
+            )
             
             if not options:
                 logger.error("Menü seçenekleri bulunamadı!")
                 return False
             
-            # Görüntü oluşturun seçeneğini bul
-            for option in options:
-                option_text = option.text.strip().lower()
-                if 'görüntü oluştur' in option_text or 'create image' in option_text:
-                    self.driver.execute_script("arguments[0].click();", option)
-                    time.sleep(GeminiTimeouts.SHORT_WAIT)
-                    logger.info("✓ Görüntü oluşturma aracı seçildi!")
-                    return True
+            # Görüntü oluşturun seçeneğini bul - metinler sayfa içinde taranır
+            index = self._scripts.run(
+                "FIND_OPTION_INDEX",
+                GeminiSelectors.OPTION_ANY,
+                self.IMAGE_OPTION_KEYWORDS,
+            )
+            if index is not None and 0 <= index < len(options):
+                self.driver.execute_script("arguments[0].click();", options[index])
+                self._wait_for_menu_close()
+                logger.info("✓ Görüntü oluşturma aracı seçildi!")
+                return True
             
             # Fallback
             if len(options) > 2:
                 self.driver.execute_script("arguments[0].click();", options[2])
-                time.sleep(GeminiTimeouts.SHORT_WAIT)
+                self._wait_for_menu_close()
                 logger.info("✓ Görüntü oluşturma aracı seçildi (fallback)")
                 return True
             
@@ -104,6 +119,19 @@ class GeminiImageGenerator:
             logger.error(f"Görüntü oluşturma aracı seçilemedi: {e}")
             return False
     
+    def _find_menu_options(self) -> list:
+        """Açık menüdeki seçenekleri döndür"""
+        return self.driver.find_elements(By.CSS_SELECTOR, GeminiSelectors.OPTION_ANY)
+    
+    def _wait_for_menu_close(self) -> bool:
+        """Seçim sonrası menünün kapanmasını bekle"""
+        return wait_with_retry(
+            lambda: not self._find_menu_options(),
+            timeout=GeminiTimeouts.SHORT_WAIT,
+            interval=GeminiTimeouts.POLL_INTERVAL,
+            description="Menü kapanışı",
+        )
+    
     def wait_for_image_generation(
         self, 
         timeout: int = GeminiTimeouts.IMAGE_GENERATION
@@ -118,7 +146,12 @@ class GeminiImageGenerator:
                 (By.CSS_SELECTOR, GeminiSelectors.IMAGE_BUTTON)
             ))
             
-            time.sleep(GeminiTimeouts.RESPONSE_CHECK)
+            wait_with_retry(
+                lambda: self._scripts.run("CHECK_IMAGE_LOADED"),
+                timeout=GeminiTimeouts.RESPONSE_CHECK,
+                interval=GeminiTimeouts.POLL_INTERVAL,
+                description="Görsel yüklenmesi",
+            )
             logger.info("Görsel oluşturuldu!")
             
         except Exception as e:
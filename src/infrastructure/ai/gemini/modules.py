@@ -0,0 +1,91 @@
+"""
+Gemini Modules
+Aynı sürücüye bağlı Gemini alt modüllerinin paylaşılan kümesi.
+Facade (GeminiAIService) ve provider (GeminiProvider) aynı örnekleri kullanır.
+"""
+
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from ....domain import IBrowserService
+from .scripts import GeminiScriptRunner
+from .network_log import GeminiNetworkLog
+from .navigator import GeminiNavigator
+from .uploader import GeminiImageUploader
+from .prompt_manager import GeminiPromptManager
+from .image_generator import GeminiImageGenerator
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+
+class _GeminiSession:
+    """
+    Bir tarayıcı oturumunun paylaşılan durumu.
+    Script runner ve ağ log okuyucusu oturumda tektir; modül kümeleri ayarlara göre tutulur.
+    """
+    
+    __slots__ = ("scripts", "network", "modules")
+    
+    def __init__(self, driver: "webdriver.Chrome"):
+        self.scripts = GeminiScriptRunner(driver)
+        self.network = GeminiNetworkLog(driver)
+        # (gemini_url, download_dir) → GeminiModules
+        self.modules: Dict[Tuple[str, str], "GeminiModules"] = {}
+
+
+class GeminiModules:
+    """
+    Bir sürücü için navigator, uploader, prompt manager ve image generator.
+    Sürücü kapanıp yenisi açıldığında yeni küme oluşturulur.
+    """
+    
+    __slots__ = (
+        "navigator",
+        "uploader",
+        "prompt_manager",
+        "image_generator",
+    )
+    
+    # session_id → oturum durumu. Durum sürücüyü tuttuğu için sürücü anahtar olamaz;
+    # tarayıcı kapanınca forget() (kapanış dinleyicisi) kaydı siler
+    _sessions: Dict[str, _GeminiSession] = {}
+    
+    def __init__(
+        self,
+        driver: "webdriver.Chrome",
+        gemini_url: str,
+        download_dir: str,
+        session: _GeminiSession,
+    ):
+        self.navigator = GeminiNavigator(driver, gemini_url, session.scripts)
+        self.uploader = GeminiImageUploader(driver, session.scripts)
+        self.prompt_manager = GeminiPromptManager(driver, session.scripts, session.network)
+        self.image_generator = GeminiImageGenerator(driver, download_dir, session.scripts)
+    
+    @classmethod
+    def for_browser(
+        cls,
+        browser_service: IBrowserService,
+        gemini_url: str,
+        download_dir: str,
+    ) -> "GeminiModules":
+        """Tarayıcının açık sürücüsü ve ayarlar için paylaşılan modül kümesi"""
+        browser_service.add_stop_listener(cls.forget)
+        driver = browser_service.driver
+        
+        session = cls._sessions.get(driver.session_id)
+        if session is None:
+            session = _GeminiSession(driver)
+            cls._sessions[driver.session_id] = session
+        
+        key = (gemini_url, download_dir)
+        modules = session.modules.get(key)
+        if modules is None:
+            modules = cls(driver, gemini_url, download_dir, session)
+            session.modules[key] = modules
+        return modules
+    
+    @classmethod
+    def forget(cls, session_id: Optional[str]) -> None:
+        """Kapatılan oturumun durumunu bırak (sürücü serbest kalsın)"""
+        cls._sessions.pop(session_id, None)
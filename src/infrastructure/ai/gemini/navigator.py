@@ -6,14 +6,16 @@ SRP: Sadece navigasyon sorumluluğu.
 
 import time
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from ....domain import NavigationError
+from ...utils import wait_with_retry
 from .selectors import GeminiSelectors
+from .scripts import GeminiScriptRunner
 from .timeouts import GeminiTimeouts
 
 if TYPE_CHECKING:
@@ -28,21 +30,59 @@ class GeminiNavigator:
     Tek Sorumluluk: Sayfa yükleme ve navigasyon.
     """
     
-    def __init__(self, driver: "webdriver.Chrome", gemini_url: str):
+    # Başarılı login kontrolünün aynı URL için geçerli kalacağı süre (saniye)
+    LOGIN_CACHE_TTL = 30
+    
+    def __init__(
+        self,
+        driver: "webdriver.Chrome",
+        gemini_url: str,
+        scripts: Optional[GeminiScriptRunner] = None,
+    ):
         self.driver = driver
         self.gemini_url = gemini_url
+        self._scripts = scripts or GeminiScriptRunner(driver)
+        # (url, zaman) - son başarılı login kontrolü
+        self._last_login_check: Optional[Tuple[str, float]] = None
     
     def navigate_to_gemini(self) -> None:
         """Gemini sayfasına git"""
         logger.info("Gemini'ye gidiliyor...")
         
+        self._last_login_check = None
         try:
             self.driver.get(self.gemini_url)
-            time.sleep(GeminiTimeouts.PAGE_LOAD)
+            self.wait_for_page_ready(GeminiTimeouts.PAGE_LOAD)
             logger.info("Gemini sayfası açıldı")
         except Exception as e:
             raise NavigationError("Gemini'ye gidilemedi", details=str(e))
     
+    def is_on_gemini(self) -> bool:
+        """Sekme zaten yüklenmiş bir Gemini sayfasında mı?"""
+        try:
+            return (
+                self.driver.current_url.startswith(self.gemini_url)
+                and self.driver.execute_script("return document.readyState") == "complete"
+            )
+        except Exception:
+            return False
+    
+    def open_empty_chat(self) -> None:
+        """
+        Boş bir Gemini sohbetine geç.
+        Sayfa zaten açıksa yeniden yüklemek yerine SPA içinde yeni sohbet açılır.
+        """
+        if not self.is_on_gemini():
+            self.navigate_to_gemini()
+            return
+        
+        responses = self._scripts.run("PROBE_RESPONSES") or {}
+        if responses.get("count") == 0:
+            logger.debug("Gemini zaten boş sohbette, navigasyon atlandı")
+            return
+        
+        self.start_new_chat()
+    
     def is_logged_in(self) -> bool:
         """
         Gemini oturumunun açık olup olmadığını kontrol et.
@@ -51,42 +91,31 @@ class GeminiNavigator:
             True eğer kullanıcı giriş yapmışsa
         """
         try:
-            # Prompt alanı varsa giriş yapılmış demektir
-            prompt_selectors = [
-                'div[role="textbox"]',
-                '.ql-editor',
-                'rich-textarea',
-                '[contenteditable="true"]',
-            ]
+            current_url = self.driver.current_url
+            
+            # Aynı URL'de yakın zamanda doğrulandıysa DOM'a tekrar bakma
+            if self._last_login_check:
+                cached_url, checked_at = self._last_login_check
+                if (cached_url == current_url
+                        and time.monotonic() - checked_at < self.LOGIN_CACHE_TTL):
+                    logger.debug("Login kontrolü: Önbellekten")
+                    return True
             
-            for selector in prompt_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        logger.debug(f"Login kontrolü: Prompt alanı bulundu ({selector})")
-                        return True
-                except Exception:
-                    continue
+            # Tüm selektörleri tek bir JS çağrısında kontrol et
+            state = self._probe_page()
             
-            # Login butonları veya sayfası varsa giriş yapılmamış
-            login_indicators = [
-                'button[data-mdc-dialog-action="sign-in"]',
-                '[aria-label="Google hesabıyla oturum aç"]',
-                '[aria-label="Sign in with Google"]',
-                'a[href*="accounts.google.com"]',
-            ]
+            if state.get("prompt"):
+                logger.debug("Login kontrolü: Prompt alanı bulundu")
+                self._last_login_check = (current_url, time.monotonic())
+                return True
             
-            for selector in login_indicators:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        logger.debug(f"Login kontrolü: Login butonu bulundu ({selector})")
-                        return False
-                except Exception:
-                    continue
+            self._last_login_check = None
+            
+            if state.get("login"):
+                logger.debug("Login kontrolü: Login butonu bulundu")
+                return False
             
             # Sayfa URL'sini kontrol et
-            current_url = self.driver.current_url
             if 'accounts.google.com' in current_url:
                 logger.debug("Login kontrolü: Google login sayfasında")
                 return False
@@ -113,7 +142,6 @@ class GeminiNavigator:
             current_url = self.driver.current_url
             if 'gemini.google.com' not in current_url:
                 self.navigate_to_gemini()
-                time.sleep(GeminiTimeouts.PAGE_LOAD)
             
             # Login kontrolü
             if self.is_logged_in():
@@ -126,35 +154,68 @@ class GeminiNavigator:
     
     def refresh_page(self) -> None:
         """Sayfayı yenile"""
+        self._last_login_check = None
         self.driver.refresh()
-        time.sleep(GeminiTimeouts.PAGE_READY)
+        self.wait_for_page_ready(GeminiTimeouts.PAGE_READY)
+    
+    def _probe_page(self) -> dict:
+        """Prompt alanı / login göstergesi durumunu tek çağrıda al"""
+        return self._scripts.run(
+            "PROBE_LOGIN_STATE",
+            GeminiSelectors.LOGGED_IN_INDICATORS,
+            GeminiSelectors.LOGIN_INDICATORS,
+        ) or {}
+    
+    def wait_for_page_ready(self, timeout: float) -> bool:
+        """Prompt alanı veya login ekranı görünene kadar bekle (en fazla timeout)"""
+        def ready() -> bool:
+            state = self._probe_page()
+            return bool(state.get("prompt") or state.get("login"))
+        
+        return wait_with_retry(
+            ready,
+            timeout=timeout,
+            interval=GeminiTimeouts.POLL_INTERVAL,
+            description="Gemini sayfası hazır",
+        )
+    
+    def _wait_for_empty_chat(self, timeout: float) -> bool:
+        """Yeni sohbet açılana kadar bekle: yanıt yok, prompt alanı hazır"""
+        def empty() -> bool:
+            responses = self._scripts.run("PROBE_RESPONSES") or {}
+            return responses.get("count") == 0 and self._probe_page().get("prompt")
+        
+        return wait_with_retry(
+            empty,
+            timeout=timeout,
+            interval=GeminiTimeouts.POLL_INTERVAL,
+            description="Yeni sohbet",
+        )
     
     def start_new_chat(self) -> None:
         """Yeni sohbet başlat"""
         logger.info("Yeni sohbet başlatılıyor...")
         
         try:
-            for selector in GeminiSelectors.NEW_CHAT_VARIANTS:
-                try:
-                    new_chat = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    self.driver.execute_script("arguments[0].click();", new_chat)
-                    time.sleep(GeminiTimeouts.MEDIUM_WAIT)
-                    logger.info("Yeni sohbet başlatıldı")
-                    return
-                except Exception:
-                    continue
+            # Varyantlar öncelik sırasıyla tek JS çağrısında denenir
+            new_chat = self._scripts.find_first(GeminiSelectors.NEW_CHAT_VARIANTS)
+            if new_chat:
+                self.driver.execute_script("arguments[0].click();", new_chat)
+                self._wait_for_empty_chat(GeminiTimeouts.MEDIUM_WAIT)
+                logger.info("Yeni sohbet başlatıldı")
+                return
             
             # Fallback: URL ile yenile
             logger.info("Buton bulunamadı, URL ile yeni sohbet açılıyor...")
             self.driver.get(self.gemini_url)
-            time.sleep(GeminiTimeouts.MEDIUM_WAIT)
+            self.wait_for_page_ready(GeminiTimeouts.MEDIUM_WAIT)
             self.refresh_page()
             logger.info("Sayfa yenilendi")
             
         except Exception as e:
             logger.warning(f"Yeni sohbet hatası, yenileniyor: {e}")
             self.driver.get(self.gemini_url)
-            time.sleep(GeminiTimeouts.PAGE_READY)
+            self.wait_for_page_ready(GeminiTimeouts.PAGE_READY)
     
     def wait_for_element(
         self, 
@@ -0,0 +1,88 @@
+"""
+Gemini Network Log
+Chrome performans logundaki ağ olaylarını toplar.
+Log okununca boşaldığı için oturum başına tek okuyucu kullanılır (bkz. GeminiModules).
+"""
+
+import json
+import logging
+import re
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+logger = logging.getLogger(__name__)
+
+
+class GeminiNetworkLog:
+    """
+    CDP Network olaylarının (goog:loggingPrefs performance) özeti.
+    Tek Sorumluluk: takip edilen isteklerin tamamlanma durumu.
+    """
+    
+    # Tarayıcı istekler arasında açık kaldığından kayıtlar sınırlı tutulur
+    MAX_ENTRIES = 256
+    
+    def __init__(self, driver: "webdriver.Chrome"):
+        self.driver = driver
+        # Takip edilen desen → {requestId: tamamlandı mı} (geliş sırasıyla, en eski önce atılır)
+        self._tracked: Dict["re.Pattern", "OrderedDict[str, bool]"] = {}
+    
+    def poll(self) -> bool:
+        """
+        Yeni log kayıtlarını işle.
+        
+        Returns:
+            False eğer performans logu okunamıyorsa
+        """
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"Performans logu okunamadı: {e}")
+            return False
+        
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            
+            method = message.get("method")
+            params = message.get("params", {})
+            request_id = params.get("requestId")
+            
+            if method == "Network.responseReceived":
+                response_url = params.get("response", {}).get("url")
+                if response_url:
+                    self._record_response(response_url, request_id)
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                for requests in self._tracked.values():
+                    if request_id in requests:
+                        requests[request_id] = True
+        
+        return True
+    
+    def _record_response(self, url: str, request_id: str) -> None:
+        """Takip edilen desene uyan yanıtı dizine ekle"""
+        for pattern, requests in self._tracked.items():
+            if pattern.search(url):
+                requests[request_id] = False
+                self._trim(requests)
+    
+    def _trim(self, entries: "OrderedDict") -> None:
+        """En eski kayıtları at (MAX_ENTRIES sınırı)"""
+        while len(entries) > self.MAX_ENTRIES:
+            entries.popitem(last=False)
+    
+    def request_ids_matching(self, pattern: "re.Pattern") -> List[str]:
+        """
+        URL'si desene uyan isteklerin kimlikleri (yanıt sırasıyla).
+        Desen ilk çağrıda takibe alınır; sonraki yanıtlar geldikçe dizinlenir.
+        """
+        return list(self._tracked.setdefault(pattern, OrderedDict()))
+    
+    def is_finished(self, request_id: str) -> bool:
+        """Takip edilen istek tamamlandı mı (yanıt gövdesi tamamen alındı)?"""
+        return any(requests.get(request_id) for requests in self._tracked.values())
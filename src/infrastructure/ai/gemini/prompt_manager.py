@@ -4,17 +4,20 @@ Prompt gönderme ve yanıt alma işlemleri.
 SRP: Sadece metin etkileşimi sorumluluğu.
 """
 
-import time
+import re
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional, Set
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException
 
 from ....domain import AIServiceError, ResponseError
+from ...utils import wait_with_retry
 from .selectors import GeminiSelectors
-from .scripts import GeminiScripts
+from .scripts import GeminiScripts, GeminiScriptRunner
+from .network_log import GeminiNetworkLog
 from .timeouts import GeminiTimeouts
 
 if TYPE_CHECKING:
@@ -29,91 +32,191 @@ class GeminiPromptManager:
     Tek Sorumluluk: Metin tabanlı etkileşim.
     """
     
-    def __init__(self, driver: "webdriver.Chrome"):
+    # Geçerli sayılacak minimum yanıt uzunluğu
+    MIN_RESPONSE_LENGTH = 10
+    
+    # Model yanıtını akıtan Gemini uç noktası
+    STREAM_URL_PATTERN = re.compile(r"StreamGenerate")
+    
+    def __init__(
+        self,
+        driver: "webdriver.Chrome",
+        scripts: Optional[GeminiScriptRunner] = None,
+        network: Optional[GeminiNetworkLog] = None,
+    ):
         self.driver = driver
+        self._scripts = scripts or GeminiScriptRunner(driver)
+        # Performans logu okununca boşalır - oturumdaki tek okuyucu paylaşılır
+        self._network = network or GeminiNetworkLog(driver)
+        # Son prompt'tan önce görülmüş akış istekleri
+        self._seen_streams: Set[str] = set()
+        self._wait = WebDriverWait(
+            driver,
+            GeminiTimeouts.ELEMENT_CLICKABLE,
+            poll_frequency=GeminiTimeouts.POLL_INTERVAL,
+        )
     
     def send_prompt(self, prompt_text: str) -> None:
         """Prompt gönder"""
         logger.info("Prompt gönderiliyor...")
         
         try:
-            wait = WebDriverWait(self.driver, GeminiTimeouts.ELEMENT_CLICKABLE)
-            time.sleep(GeminiTimeouts.SHORT_WAIT)
+            self._wait.until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, GeminiSelectors.PROMPT_AREA)
+            ))
             
-            # JavaScript ile prompt yaz
-            self.driver.execute_script(GeminiScripts.WRITE_PROMPT, prompt_text)
-            time.sleep(GeminiTimeouts.MEDIUM_WAIT)
+            self._mark_streams()
             
-            # Gönder butonuna tıkla
-            send_button = wait.until(EC.element_to_be_clickable(
-                (By.CSS_SELECTOR, GeminiSelectors.SEND_BUTTON)
-            ))
-            self.driver.execute_script("arguments[0].click();", send_button)
+            # Yazma + gönderme tek sayfa içi çağrıda; olmazsa adım adım
+            if not self._submit_in_page(prompt_text):
+                self._submit_stepwise(prompt_text)
             
             logger.info("Prompt gönderildi!")
             
         except Exception as e:
             raise AIServiceError("Prompt gönderilemedi", details=str(e))
     
+    def _submit_in_page(self, prompt_text: str) -> bool:
+        """Prompt'u yaz ve gönder butonuna sayfa içinde tıkla (tek round-trip)"""
+        try:
+            return bool(self.driver.execute_async_script(
+                GeminiScripts.SUBMIT_PROMPT,
+                prompt_text,
+                GeminiSelectors.SEND_BUTTON,
+                GeminiTimeouts.ELEMENT_CLICKABLE * 1000,
+            ))
+        except WebDriverException as e:
+            logger.debug(f"Sayfa içi gönderim başarısız: {e}")
+            return False
+    
+    def _submit_stepwise(self, prompt_text: str) -> None:
+        """Prompt'u yaz, editöre düşmesini ve gönder butonunu bekleyip tıkla"""
+        self._scripts.run("WRITE_PROMPT", prompt_text)
+        wait_with_retry(
+            lambda: self._scripts.run("CHECK_PROMPT_WRITTEN"),
+            timeout=GeminiTimeouts.MEDIUM_WAIT,
+            interval=GeminiTimeouts.POLL_INTERVAL,
+            description="Prompt yazımı",
+        )
+        
+        send_button = self._wait.until(EC.element_to_be_clickable(
+            (By.CSS_SELECTOR, GeminiSelectors.SEND_BUTTON)
+        ))
+        self.driver.execute_script("arguments[0].click();", send_button)
+    
     def wait_for_response(self, timeout: int = GeminiTimeouts.RESPONSE_WAIT) -> None:
         """Cevabı bekle"""
         logger.info("Cevap bekleniyor...")
         
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            time.sleep(GeminiTimeouts.LONG_WAIT)
+            # Önce ağ olayı (akış isteğinin tamamlanması), yoksa DOM
+            if not self._wait_for_stream(timeout):
+                self._wait_for_stop_button(timeout)
             
-            # Stop butonunun kaybolmasını bekle
-            try:
-                wait.until_not(EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, GeminiSelectors.STOP_BUTTON)
-                ))
-            except Exception:
-                pass
-            
-            time.sleep(GeminiTimeouts.RESPONSE_CHECK)
+            self._wait_for_stable_response(GeminiTimeouts.RESPONSE_CHECK)
             logger.info("Cevap alındı!")
             
         except Exception as e:
             raise ResponseError("Cevap beklenirken hata", details=str(e))
     
+    def _mark_streams(self) -> None:
+        """Gönderim öncesi mevcut akış isteklerini kaydet"""
+        self._network.poll()
+        self._seen_streams = set(
+            self._network.request_ids_matching(self.STREAM_URL_PATTERN)
+        )
+    
+    def _new_streams(self) -> List[str]:
+        """Son gönderimden sonra başlayan akış istekleri"""
+        if not self._network.poll():
+            return []
+        return [
+            request_id
+            for request_id in self._network.request_ids_matching(self.STREAM_URL_PATTERN)
+            if request_id not in self._seen_streams
+        ]
+    
+    def _wait_for_stream(self, timeout: float) -> bool:
+        """
+        Yanıt akışı isteğinin (StreamGenerate) tamamlanmasını bekle.
+        
+        Returns:
+            False eğer akış isteği hiç görülmediyse (DOM kontrolüne düşülür)
+        """
+        if not wait_with_retry(
+            self._new_streams,
+            timeout=GeminiTimeouts.LONG_WAIT,
+            interval=GeminiTimeouts.POLL_INTERVAL,
+            description="Yanıt akışı başlangıcı",
+        ):
+            return False
+        
+        def streams_finished() -> bool:
+            # Boş liste (okunamayan log) tamamlanma sayılmaz
+            streams = self._new_streams()
+            return bool(streams) and all(self._network.is_finished(r) for r in streams)
+        
+        # Akış görüldü; tamamlanmasa bile timeout sonrası DOM beklemesi tekrarlanmaz
+        wait_with_retry(
+            streams_finished,
+            timeout=timeout,
+            interval=GeminiTimeouts.POLL_INTERVAL,
+            description="Yanıt akışı",
+        )
+        return True
+    
+    def _wait_for_stop_button(self, timeout: float) -> None:
+        """Stop butonunun görünüp kaybolmasını bekle (DOM tabanlı yedek yol)"""
+        wait_with_retry(
+            lambda: self.driver.find_elements(
+                By.CSS_SELECTOR, GeminiSelectors.STOP_BUTTON
+            ),
+            timeout=GeminiTimeouts.LONG_WAIT,
+            interval=GeminiTimeouts.POLL_INTERVAL,
+            description="Yanıt başlangıcı",
+        )
+        
+        try:
+            WebDriverWait(self.driver, timeout).until_not(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, GeminiSelectors.STOP_BUTTON)
+            ))
+        except Exception:
+            pass
+    
+    def _wait_for_stable_response(self, timeout: float) -> bool:
+        """Son yanıtın metin uzunluğu iki kontrol arasında değişmeyene kadar bekle"""
+        last_length = [-1]
+        
+        def stable() -> bool:
+            length = (self._scripts.run("PROBE_RESPONSES") or {}).get("length", 0)
+            settled = length > 0 and length == last_length[0]
+            last_length[0] = length
+            return settled
+        
+        return wait_with_retry(
+            stable,
+            timeout=timeout,
+            interval=GeminiTimeouts.STABLE_POLL,
+            description="Yanıt metni",
+            backoff=False,  # Kararlılık sabit aralıklı iki ölçüme dayanır
+        )
+    
     def get_response_text(self) -> str:
-        """Son cevabı al - birden fazla selector dener"""
+        """Son cevabı al - tüm selector varyantları tek JS çağrısında denenir"""
         logger.info("Cevap metni alınıyor...")
         
-        # Önce tag name olarak dene
         try:
-            responses = self.driver.find_elements(By.TAG_NAME, 'model-response')
-            if responses:
-                text_content = self.driver.execute_script(
-                    GeminiScripts.GET_RESPONSE_TEXT, 
-                    responses[-1]
-                )
-                if text_content and len(text_content.strip()) > 10:
-                    logger.info(f"Cevap alındı (tag): {text_content[:100]}...")
-                    return text_content.strip()
+            found = self._scripts.run(
+                "FIND_RESPONSE_TEXT",
+                GeminiSelectors.MODEL_RESPONSE_VARIANTS,
+                self.MIN_RESPONSE_LENGTH,
+            )
         except Exception as e:
-            logger.debug(f"Tag name ile yanıt alınamadı: {e}")
+            raise ResponseError("Yanıt alınamadı", details=str(e))
         
-        # CSS selector varyantlarını dene
-        for selector in GeminiSelectors.MODEL_RESPONSE_VARIANTS:
-            try:
-                # Tag name ise farklı selector kullan
-                if selector == 'model-response':
-                    continue  # Yukarıda denendi
-                
-                responses = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if responses:
-                    text_content = self.driver.execute_script(
-                        GeminiScripts.GET_RESPONSE_TEXT, 
-                        responses[-1]
-                    )
-                    if text_content and len(text_content.strip()) > 10:
-                        logger.info(f"Cevap alındı ({selector}): {text_content[:100]}...")
-                        return text_content.strip()
-            except Exception as e:
-                logger.debug(f"Selector {selector} ile yanıt alınamadı: {e}")
-                continue
+        if found:
+            text_content = found["text"]
+            logger.info(f"Cevap alındı ({found['selector']}): {text_content[:100]}...")
+            return text_content
         
         raise ResponseError("Yanıt bulunamadı - Gemini oturumunu kontrol edin")
-
@@ -3,39 +3,45 @@ Gemini JavaScript Kodları
 Tarayıcıda çalıştırılan JavaScript kodları
 """
 
+import logging
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+logger = logging.getLogger(__name__)
+
 
 class GeminiScripts:
     """Gemini sayfasında çalıştırılan JavaScript kodları"""
     
     # Görsel URL tespit scripti
+    # arguments[0]: yanıt içindeki son görseli seçen XPath
     FIND_IMAGE_URL = """
         // Son model yanıtını bul
         const responses = document.querySelectorAll('model-response');
         if (responses.length === 0) return null;
         const lastResponse = responses[responses.length - 1];
         
-        // 1. Strateji: Bilinen URL yapısı
-        let imgs = lastResponse.querySelectorAll('img[src*="googleusercontent.com/gg/"]');
+        // 1. Strateji: Bilinen URL yapısı (XPath ile doğrudan son görsel)
+        const known = document.evaluate(
+            arguments[0], lastResponse, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+        if (known) return known.src;
         
         // 2. Strateji: Fallback (boyut kontrolü)
-        if (imgs.length === 0) {
-            const allImgs = lastResponse.querySelectorAll('img');
-            const validImgs = [];
-            for (let img of allImgs) {
-                if (img.naturalWidth > 300 && img.naturalHeight > 300) {
-                    validImgs.push(img);
-                }
-            }
-            if (validImgs.length > 0) {
-                imgs = validImgs;
+        const validImgs = [];
+        for (let img of lastResponse.querySelectorAll('img')) {
+            if (img.naturalWidth > 300 && img.naturalHeight > 300) {
+                validImgs.push(img);
             }
         }
-
-        if (imgs.length === 0) return null;
+        if (validImgs.length === 0) return null;
         
         // Yanıt içindeki en son görseli al
-        const lastImg = imgs[imgs.length - 1];
-        return lastImg.src;
+        return validImgs[validImgs.length - 1].src;
     """
     
     # Prompt yazma scripti
@@ -53,27 +59,223 @@ class GeminiScripts:
         }
     """
     
-    # Yüklenen görsel kontrolü
+    # Prompt yaz + gönder butonu hazır olunca tıkla (execute_async_script)
+    # Tek round-trip: yazma, bekleme ve tıklama sayfa içinde yapılır
+    # arguments[0]: prompt, arguments[1]: gönder butonu selektörü,
+    # arguments[2]: timeout (ms), arguments[3]: callback
+    SUBMIT_PROMPT = """
+        const [text, sendSelector, timeoutMs, done] = arguments;
+        if (!document.querySelector('.ql-editor')) return done(false);
+        (function() {""" + WRITE_PROMPT + """})(text);
+        
+        const deadline = Date.now() + timeoutMs;
+        const trySend = () => {
+            const button = document.querySelector(sendSelector);
+            const editor = document.querySelector('.ql-editor');
+            const written = editor && editor.innerText.trim().length > 0;
+            if (written && button && !button.disabled
+                    && button.getAttribute('aria-disabled') !== 'true') {
+                button.click();
+                return done(true);
+            }
+            if (Date.now() > deadline) return done(false);
+            setTimeout(trySend, 50);
+        };
+        trySend();
+    """
+    
+    # Yüklenen görsel kontrolü - ilk eşleşmede durur
+    # arguments[0]: yüklenen görsel XPath'i
     CHECK_UPLOADED_IMAGE = """
-        const imgs = document.querySelectorAll('img[src*="blob:"], img[src*="data:"], .uploaded-image, .image-preview');
-        return imgs.length > 0;
+        return document.evaluate(
+            arguments[0], document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue !== null;
     """
     
-    # Yanıt metni alma (düşünme içeriği hariç)
-    GET_RESPONSE_TEXT = """
-        const response = arguments[0];
-        const clone = response.cloneNode(true);
-        
-        // Düşünme sürecini göster butonunu kaldır
-        const thoughtsButtons = clone.querySelectorAll('.thoughts-header-button, button.thoughts-header-button');
-        thoughtsButtons.forEach(btn => btn.remove());
-        
-        // Düşünme içeriğini de kaldır (varsa)
-        const thoughtsContent = clone.querySelectorAll('.thoughts-content, .thinking-content');
-        thoughtsContent.forEach(content => content.remove());
+    # Yanıt metni alma - tüm selektör varyantları tek çağrıda
+    # arguments[0]: selektör listesi (öncelik sırasıyla), arguments[1]: minimum uzunluk
+    FIND_RESPONSE_TEXT = """
+        const [selectors, minLength] = arguments;
+        for (const selector of selectors) {
+            const responses = document.querySelectorAll(selector);
+            if (responses.length === 0) continue;
+            
+            const clone = responses[responses.length - 1].cloneNode(true);
+            clone.querySelectorAll('.thoughts-header-button, button.thoughts-header-button')
+                .forEach(btn => btn.remove());
+            clone.querySelectorAll('.thoughts-content, .thinking-content')
+                .forEach(content => content.remove());
+            
+            const text = clone.innerText.trim();
+            if (text.length > minLength) {
+                return {text: text, selector: selector};
+            }
+        }
+        return null;
+    """
+    
+    # Login durumu tespiti (tek round-trip)
+    # arguments[0]: prompt alanı selektörleri, arguments[1]: login göstergeleri
+    PROBE_LOGIN_STATE = """
+        const [promptSelectors, loginSelectors] = arguments;
+        const has = sels => sels.some(s => document.querySelector(s) !== null);
+        return {prompt: has(promptSelectors), login: has(loginSelectors)};
+    """
+    
+    # Öncelik sırasıyla ilk eşleşen element ve selektörü (tek round-trip)
+    # arguments[0]: selektör listesi
+    FIND_FIRST_MATCH = """
+        for (const selector of arguments[0]) {
+            const element = document.querySelector(selector);
+            if (element) return {element: element, selector: selector};
+        }
+        return null;
+    """
+    
+    # Metni anahtar kelimelerden birini içeren ilk menü seçeneğinin indeksi
+    # arguments[0]: seçenek selektörü, arguments[1]: küçük harf anahtar kelimeler
+    FIND_OPTION_INDEX = """
+        const [selector, keywords] = arguments;
+        const options = document.querySelectorAll(selector);
+        for (let i = 0; i < options.length; i++) {
+            const text = options[i].innerText.trim().toLowerCase();
+            if (keywords.some(k => text.includes(k))) return i;
+        }
+        return -1;
+    """
+    
+    # Odak verilen elementin içinde mi? arguments[0]: element
+    CHECK_FOCUS = """
+        return arguments[0].contains(document.activeElement);
+    """
+    
+    # Editöre prompt yazıldı mı?
+    CHECK_PROMPT_WRITTEN = """
+        const editor = document.querySelector('.ql-editor');
+        return !!editor && editor.innerText.trim().length > 0;
+    """
+    
+    # Sayfadaki model yanıtı sayısı ve son yanıtın metin uzunluğu
+    PROBE_RESPONSES = """
+        const responses = document.querySelectorAll('model-response');
+        const last = responses[responses.length - 1];
+        return {count: responses.length, length: last ? last.innerText.length : 0};
+    """
+    
+    # Son yanıttaki görsel tamamen yüklendi mi?
+    CHECK_IMAGE_LOADED = """
+        const responses = document.querySelectorAll('model-response');
+        if (responses.length === 0) return false;
+        const imgs = responses[responses.length - 1].querySelectorAll('img');
+        const last = imgs[imgs.length - 1];
+        return !!last && last.complete && last.naturalWidth > 0;
+    """
+    
+    # Selektör DOM'a düşene kadar sayfa içinde bekle (execute_async_script)
+    # MutationObserver ile olay tabanlı - Python tarafında polling yok
+    # arguments[0]: selektör, arguments[1]: timeout (ms), arguments[2]: callback
+    WAIT_FOR_SELECTOR = """
+        const [selector, timeoutMs, done] = arguments;
+        if (document.querySelector(selector)) return done(true);
         
-        return clone.innerText.trim();
+        let timer = null;
+        const observer = new MutationObserver(() => {
+            if (document.querySelector(selector)) {
+                observer.disconnect();
+                clearTimeout(timer);
+                done(true);
+            }
+        });
+        observer.observe(document.body, {subtree: true, childList: true, attributes: true});
+        timer = setTimeout(() => { observer.disconnect(); done(false); }, timeoutMs);
     """
     
     # User agent alma
     GET_USER_AGENT = "return navigator.userAgent;"
+    
+    # Sayfaya bir kez yüklenip isimle çağrılan scriptler
+    COMPILED = (
+        "FIND_IMAGE_URL",
+        "WRITE_PROMPT",
+        "CHECK_UPLOADED_IMAGE",
+        "FIND_RESPONSE_TEXT",
+        "PROBE_LOGIN_STATE",
+        "FIND_FIRST_MATCH",
+        "FIND_OPTION_INDEX",
+        "CHECK_FOCUS",
+        "CHECK_PROMPT_WRITTEN",
+        "PROBE_RESPONSES",
+        "CHECK_IMAGE_LOADED",
+    )
+    
+    @classmethod
+    def build_installer(cls, namespace: str) -> str:
+        """COMPILED scriptlerini window altında fonksiyon olarak tanımlayan kod"""
+        functions = ",\n".join(
+            f"{name}: function() {{{getattr(cls, name)}}}"
+            for name in cls.COMPILED
+        )
+        return f"window.{namespace} = {{\n{functions}\n}};"
+
+
+class GeminiScriptRunner:
+    """
+    GeminiScripts'i sayfaya bir kez yükleyip isimle çalıştırır.
+    
+    Her execute_script çağrısında script gövdesinin yeniden gönderilip
+    derlenmesi yerine, fonksiyonlar her yeni dokümanda bir kez tanımlanır
+    (Page.addScriptToEvaluateOnNewDocument) ve kısa bir çağrı ile kullanılır.
+    """
+    
+    NAMESPACE = "__geminiScripts"
+    
+    _CALL = f"""
+        const ns = window.{NAMESPACE};
+        const name = arguments[0];
+        if (!ns || !ns[name]) return {{__missing__: true}};
+        return ns[name].apply(null, Array.prototype.slice.call(arguments, 1));
+    """
+    
+    def __init__(self, driver: "webdriver.Chrome"):
+        self.driver = driver
+        self._installer = GeminiScripts.build_installer(self.NAMESPACE)
+        self._register_on_new_document()
+    
+    def _register_on_new_document(self) -> None:
+        """Her yeni dokümanda scriptleri otomatik tanımla"""
+        try:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": self._installer}
+            )
+        except Exception as e:
+            logger.debug(f"Script kaydı yapılamadı: {e}")
+    
+    def _install(self) -> None:
+        """Scriptleri mevcut dokümana yükle"""
+        self.driver.execute_script(self._installer)
+    
+    def run(self, name: str, *args) -> Any:
+        """
+        GeminiScripts'teki script'i isimle çalıştır.
+        
+        Args:
+            name: GeminiScripts.COMPILED içindeki script adı
+            *args: Script'e geçirilecek argümanlar (arguments[0..])
+        """
+        result = self.driver.execute_script(self._CALL, name, *args)
+        
+        if isinstance(result, dict) and result.get("__missing__"):
+            self._install()
+            result = self.driver.execute_script(self._CALL, name, *args)
+        
+        return result
+    
+    def find_first(self, selectors: Sequence[str]) -> Optional["WebElement"]:
+        """
+        Selektör varyantlarından ilk eşleşen elementi tek çağrıda bul.
+        Varyantlar tanımlı öncelik sırasıyla denenir (özel olan genelden önce).
+        """
+        found = self.run("FIND_FIRST_MATCH", list(selectors))
+        return found["element"] if found else None
@@ -11,6 +11,22 @@ class GeminiSelectors:
     # Prompt alanı
     PROMPT_AREA = 'div[role="textbox"][aria-label="Buraya istem girin"], .ql-editor'
     
+    # Login kontrolü - prompt alanı varsa giriş yapılmış demektir
+    LOGGED_IN_INDICATORS = [
+        'div[role="textbox"]',
+        '.ql-editor',
+        'rich-textarea',
+        '[contenteditable="true"]',
+    ]
+    
+    # Login butonları veya sayfası varsa giriş yapılmamış
+    LOGIN_INDICATORS = [
+        'button[data-mdc-dialog-action="sign-in"]',
+        '[aria-label="Google hesabıyla oturum aç"]',
+        '[aria-label="Sign in with Google"]',
+        'a[href*="accounts.google.com"]',
+    ]
+    
     # Butonlar
     SEND_BUTTON = 'button.send-button, button[aria-label="Mesaj gönder"]'
     STOP_BUTTON = 'button[aria-label="Yanıtı durdur"]'
@@ -38,6 +54,7 @@ class GeminiSelectors:
         'button[class*="toolbox-drawer"]',
         'button.toolbox-drawer-button-with-label',
     ]
+    TOOLS_BUTTON_ANY = ", ".join(TOOLS_BUTTON_VARIANTS)
     
     IMAGE_GENERATION_OPTION = 'button.toolbox-drawer-item-list-button'
     OPTION_SELECTORS = [
@@ -45,6 +62,7 @@ class GeminiSelectors:
         'button[class*="toolbox-drawer-item"]',
         '.mat-mdc-list-item button',
     ]
+    OPTION_ANY = ", ".join(OPTION_SELECTORS)
     
     # Yeni sohbet
     NEW_CHAT_VARIANTS = [
@@ -56,6 +74,12 @@ class GeminiSelectors:
     
     # Görsel yükleme doğrulama
     UPLOADED_IMAGE = 'img[src*="blob:"], img[src*="data:"], .uploaded-image, .image-preview'
+    # Aynı eşleşme XPath olarak - ilk eşleşmede durur
+    UPLOADED_IMAGE_XPATH = (
+        '//*[(self::img and (contains(@src, "blob:") or contains(@src, "data:")))'
+        ' or contains(concat(" ", normalize-space(@class), " "), " uploaded-image ")'
+        ' or contains(concat(" ", normalize-space(@class), " "), " image-preview ")]'
+    )
     
     # İndirme butonları
     DOWNLOAD_BUTTONS = [
@@ -66,4 +90,5 @@ class GeminiSelectors:
     
     # Görsel URL tespiti
     GENERATED_IMAGE = 'img[src*="googleusercontent.com/gg/"]'
-
+    # Yanıt elementine göre son oluşturulan görsel (XPath)
+    GENERATED_IMAGE_XPATH = '(.//img[contains(@src, "googleusercontent.com/gg/")])[last()]'
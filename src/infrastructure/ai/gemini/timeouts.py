@@ -25,10 +25,11 @@ class GeminiTimeouts:
     RESPONSE_WAIT = 120
     RESPONSE_CHECK = 3
     
-    # Clipboard
-    CLIPBOARD_WAIT = 2
-    
     # Genel aralıklar
     SHORT_WAIT = 1
     MEDIUM_WAIT = 2
     LONG_WAIT = 5
+    
+    # DOM koşul kontrol aralıkları (sabit sleep yerine)
+    POLL_INTERVAL = 0.2
+    STABLE_POLL = 0.5
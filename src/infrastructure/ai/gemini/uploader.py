@@ -4,19 +4,24 @@ Görsel yükleme işlemleri.
 SRP: Sadece görsel yükleme sorumluluğu.
 """
 
-import time
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 
 from ....domain import AIServiceError
 from .selectors import GeminiSelectors
-from .scripts import GeminiScripts
+from .scripts import GeminiScripts, GeminiScriptRunner
 from .timeouts import GeminiTimeouts
 from ..clipboard import ClipboardService
 
@@ -32,36 +37,61 @@ class GeminiImageUploader:
     Tek Sorumluluk: Görsel yükleme ve doğrulama.
     """
     
-    def __init__(self, driver: "webdriver.Chrome"):
+    # Yapıştırma sonrası önizlemenin görünmesi için toplam süre
+    VERIFY_TIMEOUT = GeminiTimeouts.IMAGE_UPLOAD + GeminiTimeouts.IMAGE_VERIFY
+    
+    def __init__(
+        self,
+        driver: "webdriver.Chrome",
+        scripts: Optional[GeminiScriptRunner] = None,
+    ):
         self.driver = driver
+        self._scripts = scripts or GeminiScriptRunner(driver)
         self.clipboard_service = ClipboardService()
+        
+        # Bekleyiciler bir kez kurulur, tüm yüklemelerde paylaşılır
+        self._wait = WebDriverWait(
+            driver,
+            GeminiTimeouts.ELEMENT_VISIBLE,
+            poll_frequency=GeminiTimeouts.POLL_INTERVAL,
+            ignored_exceptions=(StaleElementReferenceException, NoSuchElementException),
+        )
+        self._focus_wait = WebDriverWait(
+            driver,
+            GeminiTimeouts.SHORT_WAIT,
+            poll_frequency=GeminiTimeouts.POLL_INTERVAL,
+        )
+        self._verify_wait = WebDriverWait(
+            driver,
+            self.VERIFY_TIMEOUT,
+            poll_frequency=GeminiTimeouts.POLL_INTERVAL,
+            ignored_exceptions=(WebDriverException,),
+        )
     
     def upload_image(self, image_path: str) -> None:
         """Görseli clipboard yöntemiyle yükle"""
         logger.info(f"Fotoğraf yükleniyor: {image_path}")
         
         try:
-            wait = WebDriverWait(self.driver, GeminiTimeouts.ELEMENT_VISIBLE)
-            
-            # Clipboard'a kopyala
-            self.clipboard_service.copy_image(image_path)
-            time.sleep(GeminiTimeouts.CLIPBOARD_WAIT)
+            # Clipboard'a kopyalama arka planda; bu sırada prompt alanına tıkla
+            copy_future = self.clipboard_service.copy_image_async(image_path)
             
-            # Prompt alanına tıkla
-            prompt_area = wait.until(EC.element_to_be_clickable(
+            prompt_area = self._wait.until(EC.element_to_be_clickable(
                 (By.CSS_SELECTOR, GeminiSelectors.PROMPT_AREA)
             ))
             prompt_area.click()
-            time.sleep(GeminiTimeouts.SHORT_WAIT)
+            self._wait_for_focus(prompt_area)
+            
+            # Yapıştırmadan önce kopyalamanın bitmesini bekle
+            # (xclip girdiyi okuyup çıktığında clipboard hazırdır)
+            copy_future.result()
             
             # Ctrl+V ile yapıştır
             actions = ActionChains(self.driver)
             actions.key_down(Keys.CONTROL).send_keys('v').key_up(Keys.CONTROL).perform()
             
+            # Doğrulama - önizleme görünür görünmez devam edilir
             logger.info("Fotoğraf yapıştırıldı, yüklenmesi bekleniyor...")
-            time.sleep(GeminiTimeouts.IMAGE_UPLOAD)
-            
-            # Doğrulama
             self._verify_upload()
             
         except AIServiceError:
@@ -69,18 +99,58 @@ class GeminiImageUploader:
         except Exception as e:
             raise AIServiceError("Fotoğraf yüklenemedi", details=str(e))
     
+    def _wait_for_focus(self, element) -> bool:
+        """Tıklanan alan odağı alana kadar bekle"""
+        try:
+            self._focus_wait.until(lambda _: self._scripts.run("CHECK_FOCUS", element))
+            return True
+        except TimeoutException:
+            logger.debug("Prompt alanı odak doğrulanamadı, devam ediliyor")
+            return False
+    
+    def _wait_for_upload_event(self, timeout: float) -> Optional[bool]:
+        """
+        Önizleme görselini sayfa içi MutationObserver ile bekle.
+        
+        Returns:
+            True/False - observer sonucu, None - script çalıştırılamadı
+        """
+        try:
+            return bool(self.driver.execute_async_script(
+                GeminiScripts.WAIT_FOR_SELECTOR,
+                GeminiSelectors.UPLOADED_IMAGE,
+                int(timeout * 1000),
+            ))
+        except WebDriverException as e:
+            logger.debug(f"Yükleme observer'ı çalışmadı: {e}")
+            return None
+    
     def _verify_upload(self) -> bool:
         """Yüklemenin başarılı olduğunu doğrula"""
-        for _ in range(GeminiTimeouts.IMAGE_VERIFY):
+        wait = self._verify_wait
+        
+        uploaded = self._wait_for_upload_event(self.VERIFY_TIMEOUT)
+        if uploaded is None:
+            # Observer kurulamadı - polling ile kontrol et
             try:
-                uploaded = self.driver.execute_script(GeminiScripts.CHECK_UPLOADED_IMAGE)
-                if uploaded:
-                    logger.info("Fotoğraf yüklendi ve doğrulandı!")
-                    time.sleep(GeminiTimeouts.MEDIUM_WAIT)
-                    return True
-            except Exception:
-                pass
-            time.sleep(GeminiTimeouts.SHORT_WAIT)
+                uploaded = wait.until(lambda _: self._scripts.run(
+                    "CHECK_UPLOADED_IMAGE", GeminiSelectors.UPLOADED_IMAGE_XPATH
+                ))
+            except TimeoutException:
+                uploaded = False
+        
+        if not uploaded:
+            logger.warning("Fotoğraf yüklemesi doğrulanamadı, devam ediliyor...")
+            return False
+        
+        logger.info("Fotoğraf yüklendi ve doğrulandı!")
+        
+        # Sonraki adımın ihtiyacı: gönder butonunun hazır olması
+        try:
+            wait.until(EC.element_to_be_clickable(
+                (By.CSS_SELECTOR, GeminiSelectors.SEND_BUTTON)
+            ))
+        except TimeoutException:
+            logger.debug("Gönder butonu henüz hazır değil")
         
-        logger.warning("Fotoğraf yüklemesi doğrulanamadı, devam ediliyor...")
-        return False
+        return True
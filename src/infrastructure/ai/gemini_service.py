@@ -12,10 +12,10 @@ Alt modüller:
 
 import logging
 from typing import Optional, Tuple
-from pathlib import Path
 
 from selenium import webdriver
 
+from ..utils import ensure_dir
 from ...domain import (
     IAIService,
     IBrowserService,
@@ -26,6 +26,7 @@ from .gemini import (
     GeminiImageUploader,
     GeminiPromptManager,
     GeminiImageGenerator,
+    GeminiModules,
 )
 
 logger = logging.getLogger(__name__)
@@ -45,8 +46,7 @@ class GeminiAIService(IAIService):
     ):
         self.browser_service = browser_service
         self.gemini_url = gemini_url
-        self.download_dir = Path(download_dir)
-        self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.download_dir = ensure_dir(download_dir)
         
         # Alt modüller (lazy initialization)
         self._navigator: Optional[GeminiNavigator] = None
@@ -61,21 +61,25 @@ class GeminiAIService(IAIService):
     
     def _ensure_browser(self) -> None:
         """Tarayıcının çalıştığından emin ol ve alt modülleri başlat"""
+        # Tarayıcı istekler arasında açık kalır; yanıt vermiyorsa temiz başlat
+        if self.browser_service.is_running() and not self.browser_service.is_alive():
+            logger.warning("Tarayıcı yanıt vermiyor, yeniden başlatılıyor...")
+            self.browser_service.stop()
+        
         if not self.browser_service.is_running():
             self.browser_service.start()
         
-        # Alt modülleri lazy olarak başlat
-        if not self._navigator:
-            self._navigator = GeminiNavigator(self.driver, self.gemini_url)
-        if not self._uploader:
-            self._uploader = GeminiImageUploader(self.driver)
-        if not self._prompt_manager:
-            self._prompt_manager = GeminiPromptManager(self.driver)
-        if not self._image_generator:
-            self._image_generator = GeminiImageGenerator(
-                self.driver, 
-                str(self.download_dir)
-            )
+        # Alt modüller sürücü başına paylaşılır; tarayıcı yeniden
+        # başlatıldıysa yeni sürücü için yeni küme gelir
+        modules = GeminiModules.for_browser(
+            self.browser_service,
+            self.gemini_url,
+            str(self.download_dir)
+        )
+        self._navigator = modules.navigator
+        self._uploader = modules.uploader
+        self._prompt_manager = modules.prompt_manager
+        self._image_generator = modules.image_generator
     
     def check_session(self) -> Tuple[bool, str]:
         """
@@ -107,7 +111,7 @@ class GeminiAIService(IAIService):
         self._ensure_browser()
         
         # Alt modüllere delege et
-        self._navigator.navigate_to_gemini()
+        self._navigator.open_empty_chat()
         self._uploader.upload_image(image.path)
         self._prompt_manager.send_prompt(prompt)
         self._prompt_manager.wait_for_response()
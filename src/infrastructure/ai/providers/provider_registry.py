@@ -58,14 +58,7 @@ class AIProviderRegistry(PluginRegistry[BaseAIProvider]):
         if not self._plugins:
             raise RuntimeError("Hiç AI provider kayıtlı değil. discover() çağrıldı mı?")
         
-        # Önceliğe göre sırala
-        sorted_by_priority = sorted(
-            self._metadata.items(),
-            key=lambda x: x[1].priority,
-            reverse=True
-        )
-        
-        best_name = sorted_by_priority[0][0]
+        best_name = self._by_priority()[0]
         return self.get(best_name, **kwargs)
     
     def get_for_analysis(self, **kwargs) -> Optional[BaseAIProvider]:
@@ -3,16 +3,33 @@ Telegram Bot Gateway
 IBotGateway implementasyonu
 """
 
-import os
-from typing import Optional
+import re
+import asyncio
+from pathlib import Path
+from typing import Dict, Optional
 import logging
 
 from telegram import Bot
+from telegram.request import HTTPXRequest
+from telegram.constants import ParseMode
 
 from ...domain import IBotGateway, ImageEntity, BotGatewayError
+from ..utils import write_bytes
 
 logger = logging.getLogger(__name__)
 
+# Markdown sözdizimi içeren metinleri ayırt etmek için (import'ta bir kez derlenir)
+_MARKDOWN_RE = re.compile(r'[*_`\[]')
+
+
+def _parse_mode(text: Optional[str]) -> Optional[ParseMode]:
+    """Metin Markdown içeriyorsa 'Markdown', düz metinse None"""
+    return ParseMode.MARKDOWN if text and _MARKDOWN_RE.search(text) else None
+
+
+# Token başına tek Bot (ve tek HTTP bağlantı havuzu) - süreç boyunca paylaşılır
+_bots: Dict[str, Bot] = {}
+
 
 class TelegramBotGateway(IBotGateway):
     """
@@ -20,24 +37,47 @@ class TelegramBotGateway(IBotGateway):
     IBotGateway interface'ini implement eder.
     """
     
+    PREVIEW_CAPTION = "👆 _Önizleme_"
+    
+    # HTTP istemci ayarları (eşzamanlı gönderimler için bağlantı havuzu)
+    CONNECTION_POOL_SIZE = 16
+    POOL_TIMEOUT = 5.0
+    READ_TIMEOUT = 30.0
+    WRITE_TIMEOUT = 60.0
+    CONNECT_TIMEOUT = 10.0
+    
     def __init__(self, token: str):
         self.token = token
         self._bot: Optional[Bot] = None
     
     @property
     def bot(self) -> Bot:
-        """Lazy bot instance"""
+        """Lazy bot instance - aynı token için paylaşılır"""
         if not self._bot:
-            self._bot = Bot(token=self.token)
+            self._bot = _bots.get(self.token)
+            if self._bot is None:
+                self._bot = Bot(token=self.token, request=self._create_request())
+                _bots[self.token] = self._bot
         return self._bot
     
+    @classmethod
+    def _create_request(cls) -> HTTPXRequest:
+        """Bağlantı havuzu ve timeout'ları ayarlanmış HTTP istemcisi"""
+        return HTTPXRequest(
+            connection_pool_size=cls.CONNECTION_POOL_SIZE,
+            pool_timeout=cls.POOL_TIMEOUT,
+            read_timeout=cls.READ_TIMEOUT,
+            write_timeout=cls.WRITE_TIMEOUT,
+            connect_timeout=cls.CONNECT_TIMEOUT,
+        )
+    
     async def send_message(self, chat_id: str, text: str) -> None:
         """Mesaj gönder"""
         try:
             await self.bot.send_message(
                 chat_id=chat_id,
                 text=text,
-                parse_mode="Markdown"
+                parse_mode=_parse_mode(text)
             )
         except Exception as e:
             logger.error(f"Mesaj gönderilemedi: {e}")
@@ -51,26 +91,30 @@ class TelegramBotGateway(IBotGateway):
     ) -> None:
         """Görsel gönder"""
         try:
-            if not image.exists:
+            # Dosya bir kez, event loop dışında okunur; iki gönderimde de aynı içerik kullanılır
+            try:
+                data = await asyncio.to_thread(Path(image.path).read_bytes)
+            except FileNotFoundError:
                 raise BotGatewayError(f"Görsel bulunamadı: {image.path}")
             
-            with open(image.path, 'rb') as f:
-                # Hem doküman hem önizleme olarak gönder
-                await self.bot.send_document(
-                    chat_id=chat_id,
-                    document=f,
-                    filename=image.filename,
-                    caption=caption,
-                    parse_mode="Markdown"
-                )
+            # Hem doküman hem önizleme olarak gönder.
+            # Not: sendMediaGroup doküman ile fotoğrafı aynı albümde kabul
+            # etmez; bu yüzden iki ayrı istek, önizleme dokümanın altında kalsın
+            # diye sırayla gönderilir.
+            await self.bot.send_document(
+                chat_id=chat_id,
+                document=data,
+                filename=image.filename,
+                caption=caption,
+                parse_mode=_parse_mode(caption)
+            )
             
-            with open(image.path, 'rb') as f:
-                await self.bot.send_photo(
-                    chat_id=chat_id,
-                    photo=f,
-                    caption=f"👆 _Önizleme_",
-                    parse_mode="Markdown"
-                )
+            await self.bot.send_photo(
+                chat_id=chat_id,
+                photo=data,
+                caption=self.PREVIEW_CAPTION,
+                parse_mode=_parse_mode(self.PREVIEW_CAPTION)
+            )
                 
         except Exception as e:
             logger.error(f"Görsel gönderilemedi: {e}")
@@ -83,7 +127,7 @@ class TelegramBotGateway(IBotGateway):
                 chat_id=chat_id,
                 message_id=int(message_id),
                 text=text,
-                parse_mode="Markdown"
+                parse_mode=_parse_mode(text)
             )
         except Exception as e:
             logger.debug(f"Mesaj güncellenemedi: {e}")
@@ -92,7 +136,9 @@ class TelegramBotGateway(IBotGateway):
         """Bot'a gönderilen dosyayı indir"""
         try:
             file = await self.bot.get_file(file_id)
-            await file.download_to_drive(destination)
+            # Diske yazma thread'de - eşzamanlı indirmeler event loop'u bloklamaz
+            data = await file.download_as_bytearray()
+            await asyncio.to_thread(write_bytes, destination, data)
             return destination
         except Exception as e:
             logger.error(f"Dosya indirilemedi: {e}")
@@ -3,9 +3,17 @@ Selenium Browser Servisi
 IBrowserService implementasyonu
 """
 
+import json
+import threading
+from pathlib import Path
+from typing import Callable, ClassVar, List, Optional
+
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
 from webdriver_manager.chrome import ChromeDriverManager
 import logging
 
@@ -14,22 +22,87 @@ from ...domain import IBrowserService, BrowserError
 logger = logging.getLogger(__name__)
 
 
+class _AttachedChromeDriver(RemoteWebDriver):
+    """
+    Var olan bir WebDriver oturumuna bağlanan sürücü.
+    Yeni oturum açmaz, verilen session_id'yi kullanır.
+    webdriver.Chrome gibi goog logunu ve CDP komutlarını destekler.
+    """
+    
+    def __init__(self, command_executor: str, session_id: str):
+        self._attached_session_id = session_id
+        connection = ChromiumRemoteConnection(
+            remote_server_addr=command_executor,
+            vendor_prefix="goog",
+            browser_name="chrome",
+        )
+        super().__init__(command_executor=connection, options=Options())
+    
+    def start_session(self, capabilities: dict) -> None:
+        """Yeni oturum açmak yerine mevcut oturumu kullan"""
+        self.session_id = self._attached_session_id
+        # execute_cdp_cmd tarayıcı adını capabilities'den okur
+        self.caps = {"browserName": "chrome"}
+    
+    def get_log(self, log_type: str) -> list:
+        """Tarayıcı logunu al (ör. "performance")"""
+        return self.execute(Command.GET_LOG, {"type": log_type})["value"]
+
+
 class SeleniumBrowserService(IBrowserService):
     """
     Chrome tarayıcı yöneticisi.
     IBrowserService interface'ini implement eder.
     """
     
+    # chromedriver ile eşzamanlı HTTP bağlantı sayısı (urllib3 varsayılanı 1)
+    CONNECTION_POOL_SIZE = 10
+    
+    # Profil içindeki HTTP disk önbelleği boyutu (byte)
+    DISK_CACHE_SIZE = 100 * 1024 * 1024
+    
+    # ChromeDriverManager ile çözülen sürücü yolu - süreç boyunca bir kez
+    _driver_path: ClassVar[Optional[str]] = None
+    
     def __init__(
         self,
         profile_path: str = None,
         download_dir: str = None,
-        headless: bool = False
+        headless: bool = False,
+        session_file: str = None,
     ):
         self.profile_path = profile_path
         self.download_dir = download_dir
         self.headless = headless
+        self.session_file = Path(session_file) if session_file else None
         self.driver = None
+        # Eşzamanlı start() çağrıları tek Chrome başlatır
+        self._start_lock = threading.Lock()
+        # Kapanışta session_id ile çağrılır (sürücüye bağlı önbellekler için)
+        self._stop_listeners: List[Callable[[Optional[str]], None]] = []
+    
+    @classmethod
+    def from_existing_session(
+        cls,
+        session_id: str,
+        command_executor: str,
+        **kwargs
+    ) -> "SeleniumBrowserService":
+        """
+        Çalışan bir WebDriver oturumuna bağlan.
+        Chrome'u yeniden başlatma maliyetinden kaçınır.
+        
+        Raises:
+            BrowserError: Oturuma bağlanılamadığında
+        """
+        service = cls(**kwargs)
+        service._attach(session_id, command_executor)
+        return service
+    
+    @property
+    def session_id(self) -> Optional[str]:
+        """Aktif WebDriver oturum kimliği"""
+        return self.driver.session_id if self.driver else None
     
     def __enter__(self):
         """Context manager giriş"""
@@ -58,39 +131,152 @@ class SeleniumBrowserService(IBrowserService):
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
+        options.add_argument("--process-per-site")
+        
+        # Otomasyonu etkilemeyen arka plan özelliklerini kapat
+        options.add_argument(
+            "--disable-features=Translate,MediaRouter,OptimizationHints,site-per-process"
+        )
+        options.add_argument("--enable-features=NetworkServiceInProcess")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-sync")
+        options.add_argument(f"--disk-cache-size={self.DISK_CACHE_SIZE}")
         
         # Profil kilidi sorununu çöz
         options.add_argument("--remote-debugging-port=9222")
         options.add_argument("--disable-background-networking")
         
+        # Ağ olaylarını performans loguna yaz (yanıt akışının bitişini izlemek için)
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        
         # Başsız mod
         if self.headless:
             options.add_argument("--headless=new")
         
+        # Tarayıcı tercihleri - bildirim izin istekleri engellenir
+        prefs = {
+            "profile.default_content_setting_values.notifications": 2,
+        }
+        
         # İndirme ayarları
         if self.download_dir:
-            prefs = {
+            prefs.update({
                 "download.default_directory": self.download_dir,
                 "download.prompt_for_download": False,
-            }
-            options.add_experimental_option("prefs", prefs)
+            })
+        
+        options.add_experimental_option("prefs", prefs)
         
         return options
     
+    def _attach(self, session_id: str, command_executor: str) -> None:
+        """Var olan oturuma bağlan ve canlı olduğunu doğrula"""
+        try:
+            driver = _AttachedChromeDriver(command_executor, session_id)
+            _ = driver.current_url  # Oturum canlı mı?
+        except Exception as e:
+            raise BrowserError("Mevcut oturuma bağlanılamadı", details=str(e))
+        
+        self._tune_connection_pool(driver)
+        self.driver = driver
+        logger.info(f"Mevcut Chrome oturumuna bağlanıldı: {session_id}")
+    
+    def _tune_connection_pool(self, driver: RemoteWebDriver) -> None:
+        """
+        WebDriver bağlantı havuzunu genişlet.
+        Varsayılan havuz tek bağlantılıdır; eşzamanlı komutlar sıraya girer.
+        """
+        executor = driver.command_executor
+        conn = getattr(executor, "_conn", None)
+        if conn is None:  # keep-alive kapalı
+            return
+        
+        # Mevcut yöneticinin yalnızca havuz boyutu değişir; proxy ve sertifika
+        # ayarları korunur. clear() eski (tek bağlantılı) havuzları bırakır.
+        conn.connection_pool_kw["maxsize"] = self.CONNECTION_POOL_SIZE
+        conn.clear()
+    
+    def _attach_persisted_session(self) -> bool:
+        """Dosyada saklanan oturuma bağlanmayı dene"""
+        if not self.session_file or not self.session_file.exists():
+            return False
+        
+        data = {}
+        try:
+            data = json.loads(self.session_file.read_text(encoding="utf-8"))
+            self._attach(data["session_id"], data["command_executor"])
+            return True
+        except Exception as e:
+            logger.debug(f"Saklanan oturum kullanılamadı: {e}")
+            self._close_stale_session(data)
+            self._forget_session()
+            return False
+    
+    @staticmethod
+    def _close_stale_session(data: dict) -> None:
+        """
+        Kullanılamayan oturumu kapatmayı dene.
+        chromedriver hâlâ ayaktaysa Chrome profili kilitli tutar; yeni Chrome açılamaz.
+        """
+        try:
+            _AttachedChromeDriver(data["command_executor"], data["session_id"]).quit()
+        except Exception as e:
+            logger.debug(f"Eski oturum kapatılamadı: {e}")
+    
+    def _persist_session(self) -> None:
+        """Oturum bilgisini sonraki başlatmalar için sakla"""
+        if not self.session_file or not self.driver:
+            return
+        
+        try:
+            self.session_file.parent.mkdir(parents=True, exist_ok=True)
+            self.session_file.write_text(json.dumps({
+                "session_id": self.driver.session_id,
+                "command_executor": self.driver.command_executor.client_config.remote_server_addr,
+            }), encoding="utf-8")
+        except Exception as e:
+            logger.debug(f"Oturum bilgisi saklanamadı: {e}")
+    
+    def _forget_session(self) -> None:
+        """Saklanan oturum bilgisini sil"""
+        if self.session_file:
+            self.session_file.unlink(missing_ok=True)
+    
+    @classmethod
+    def _resolve_driver_path(cls) -> str:
+        """chromedriver yolunu ilk başlatmada çöz, sonra önbellekten kullan"""
+        if cls._driver_path is None:
+            cls._driver_path = ChromeDriverManager().install()
+        return cls._driver_path
+    
     def start(self) -> None:
         """Chrome tarayıcısını başlat"""
         if self.driver:
             logger.warning("Tarayıcı zaten çalışıyor")
             return
         
+        with self._start_lock:
+            # Kilidi beklerken başka bir çağrı başlatmış olabilir
+            if self.driver:
+                return
+            self._start_locked()
+    
+    def _start_locked(self) -> None:
+        """Chrome'u başlat (start kilidi altında çağrılır)"""
+        # Önce çalışan oturumu yeniden kullanmayı dene
+        if self._attach_persisted_session():
+            return
+        
         logger.info("Chrome başlatılıyor...")
         
         try:
             options = self._create_options()
-            service = Service(ChromeDriverManager().install())
+            service = Service(self._resolve_driver_path())
             
             self.driver = webdriver.Chrome(service=service, options=options)
+            self._tune_connection_pool(self.driver)
             self.driver.maximize_window()
+            self._persist_session()
             
             logger.info("Chrome başarıyla başlatıldı")
             
@@ -103,6 +289,7 @@ class SeleniumBrowserService(IBrowserService):
     def stop(self) -> None:
         """Tarayıcıyı kapat"""
         if self.driver:
+            session_id = self.driver.session_id
             try:
                 self.driver.quit()
                 logger.info("Tarayıcı kapatıldı")
@@ -110,6 +297,21 @@ class SeleniumBrowserService(IBrowserService):
                 logger.warning(f"Tarayıcı kapatılırken hata: {e}")
             finally:
                 self.driver = None
+                self._forget_session()
+                self._notify_stopped(session_id)
+    
+    def add_stop_listener(self, callback: Callable[[Optional[str]], None]) -> None:
+        """Tarayıcı kapanınca oturum kimliğiyle çağrılacak fonksiyonu kaydet (bir kez)"""
+        if callback not in self._stop_listeners:
+            self._stop_listeners.append(callback)
+    
+    def _notify_stopped(self, session_id: Optional[str]) -> None:
+        """Kapanışı dinleyicilere bildir - kapanan sürücü önbelleklerde kalmasın"""
+        for callback in self._stop_listeners:
+            try:
+                callback(session_id)
+            except Exception as e:
+                logger.warning(f"Kapanış dinleyicisi hata verdi: {e}")
     
     def navigate_to(self, url: str) -> None:
         """Belirtilen URL'ye git"""
@@ -121,6 +323,22 @@ class SeleniumBrowserService(IBrowserService):
         """Tarayıcı çalışıyor mu?"""
         return self.driver is not None
     
+    def is_alive(self) -> bool:
+        """Sürücü hâlâ yanıt veriyor mu? (Chrome çökmüş veya kapatılmış olabilir)"""
+        if not self.driver:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    def is_page_ready(self) -> bool:
+        """Açık sayfa yüklenmesini tamamladı mı? (document.readyState)"""
+        if not self.driver:
+            return False
+        return self.driver.execute_script("return document.readyState;") == "complete"
+    
     def get_cookies(self) -> list:
         """Selenium çerezlerini al"""
         if not self.driver:
@@ -3,8 +3,11 @@ Yapılandırma Servisi
 IConfigProvider implementasyonu
 """
 
+import importlib.util
 import os
+from functools import cached_property
 from pathlib import Path
+from typing import Optional, Tuple
 import logging
 
 from ...domain import IConfigProvider, ConfigurationError
@@ -20,52 +23,77 @@ class ConfigService(IConfigProvider):
     
     def __init__(self, project_root: Path = None):
         self._project_root = project_root or Path(__file__).parents[3]
-        self._prompt_text_cache: str = None
+        
+        # Ortam değişkenleri bir kez okunur
+        self._bot_token = self._load_bot_token()
+        self._gemini_url = os.environ.get(
+            "GEMINI_URL",
+            "https://gemini.google.com/app"
+        )
+        self._chrome_profile_path = os.environ.get(
+            "CHROME_PROFILE_PATH",
+            str(self._project_root / "chrome_profile")
+        )
+        self._images_dir = os.environ.get(
+            "IMAGES_DIR",
+            str(self._project_root / "images")
+        )
+        # Bot kapalıyken biriken update'ler başlangıçta atlansın mı
+        self._drop_pending_updates = os.environ.get(
+            "DROP_PENDING_UPDATES", "1"
+        ).strip().lower() not in ("0", "false", "no")
+        
+        # (mtime, metin) - prompt dosyası değişmedikçe yeniden okunmaz
+        self._prompt_cache: Optional[Tuple[Optional[float], str]] = None
     
-    @property
-    def bot_token(self) -> str:
-        """Telegram bot token'ı"""
+    def _load_bot_token(self) -> str:
+        """Token'ı ortamdan, yoksa eski config modülünden oku"""
         token = os.environ.get("TELEGRAM_BOT_TOKEN", "")
+        if token:
+            return token
         
-        # Fallback to old config if exists
-        if not token:
-            try:
-                import sys
-                sys.path.insert(0, str(self._project_root))
-                import config as old_config
-                token = old_config.BOT_TOKEN
-            except Exception:
-                pass
+        # Fallback to old config if exists - sys.path'e dokunmadan dosyadan yüklenir
+        legacy_config = self._project_root / "config.py"
+        if not legacy_config.is_file():
+            return ""
         
-        if not token:
+        try:
+            spec = importlib.util.spec_from_file_location("_legacy_config", legacy_config)
+            old_config = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(old_config)
+            return getattr(old_config, "BOT_TOKEN", "") or ""
+        except Exception as e:
+            logger.debug(f"Eski config okunamadı: {e}")
+            return ""
+    
+    @property
+    def bot_token(self) -> str:
+        """Telegram bot token'ı"""
+        if not self._bot_token:
             raise ConfigurationError("TELEGRAM_BOT_TOKEN ayarlanmamış")
         
-        return token
+        return self._bot_token
     
     @property
     def gemini_url(self) -> str:
         """Gemini URL'si"""
-        return os.environ.get(
-            "GEMINI_URL",
-            "https://gemini.google.com/app"
-        )
+        return self._gemini_url
     
     @property
     def chrome_profile_path(self) -> str:
         """Chrome profil yolu"""
-        default_path = str(self._project_root / "chrome_profile")
-        return os.environ.get("CHROME_PROFILE_PATH", default_path)
+        return self._chrome_profile_path
     
     @property
+    def drop_pending_updates(self) -> bool:
+        """Başlangıçta bekleyen update'ler atlanır (DROP_PENDING_UPDATES=0 ile kapatılır)"""
+        return self._drop_pending_updates
+    
+    @cached_property
     def images_dir(self) -> str:
-        """Görseller dizini"""
-        default_path = str(self._project_root / "images")
-        path = os.environ.get("IMAGES_DIR", default_path)
-        
-        # Dizini oluştur
-        Path(path).mkdir(parents=True, exist_ok=True)
-        
-        return path
+        """Görseller dizini (ilk erişimde bir kez oluşturulur)"""
+        Path(self._images_dir).mkdir(parents=True, exist_ok=True)
+        return self._images_dir
     
     @property
     def prompt_file(self) -> str:
@@ -74,17 +102,26 @@ class ConfigService(IConfigProvider):
     
     @property
     def prompt_text(self) -> str:
-        """Prompt metni"""
-        if self._prompt_text_cache:
-            return self._prompt_text_cache
-        
+        """
+        Prompt metni (yoksa boş metin).
+        Dosya yalnızca mtime değiştiğinde yeniden okunur - yeniden başlatmadan güncellenir.
+        """
         try:
-            with open(self.prompt_file, 'r', encoding='utf-8') as f:
-                self._prompt_text_cache = f.read()
-                return self._prompt_text_cache
+            mtime = os.stat(self.prompt_file).st_mtime
         except FileNotFoundError:
+            mtime = None
+        
+        if self._prompt_cache is not None and self._prompt_cache[0] == mtime:
+            return self._prompt_cache[1]
+        
+        if mtime is None:
             logger.warning(f"Prompt dosyası bulunamadı: {self.prompt_file}")
-            return ""
+            text = ""
+        else:
+            text = Path(self.prompt_file).read_text(encoding='utf-8')
+        
+        self._prompt_cache = (mtime, text)
+        return text
     
     def validate(self) -> list:
         """Yapılandırmayı doğrula, hata listesi döndür"""
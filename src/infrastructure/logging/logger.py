@@ -13,6 +13,10 @@ CONSOLE_FORMAT = "%(asctime)s │ %(levelname)-8s │ %(name)s │ %(message)s"
 FILE_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(funcName)s:%(lineno)d - %(message)s"
 DATE_FORMAT = "%H:%M:%S"
 
+# Formatter'lar bir kez oluşturulur, tüm handler'larda paylaşılır
+_CONSOLE_FORMATTER = logging.Formatter(CONSOLE_FORMAT, DATE_FORMAT)
+_FILE_FORMATTER = logging.Formatter(FILE_FORMAT)
+
 
 def setup_logger(
     name: str,
@@ -33,7 +37,7 @@ def setup_logger(
     # Konsol handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
-    console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT, DATE_FORMAT))
+    console_handler.setFormatter(_CONSOLE_FORMATTER)
     logger.addHandler(console_handler)
     
     # Dosya handler (opsiyonel)
@@ -43,7 +47,7 @@ def setup_logger(
         
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(level)
-        file_handler.setFormatter(logging.Formatter(FILE_FORMAT))
+        file_handler.setFormatter(_FILE_FORMATTER)
         logger.addHandler(file_handler)
     
     return logger
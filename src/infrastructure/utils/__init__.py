@@ -8,10 +8,13 @@ from .retry import (
     retry_on_exception,
     safe_wait,
 )
+from .paths import ensure_dir, write_bytes
 
 __all__ = [
     "RetryConfig",
     "wait_with_retry",
     "retry_on_exception",
     "safe_wait",
+    "ensure_dir",
+    "write_bytes",
 ]
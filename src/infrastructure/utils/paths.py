@@ -0,0 +1,54 @@
+"""
+Path Utility
+Dizin oluşturma ve dosya yazma yardımcıları - DRY prensibi
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Set, Union
+
+# Bu süreçte oluşturulduğu bilinen dizinler
+_ensured_dirs: Set[str] = set()
+_lock = threading.Lock()
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """
+    Dizinin var olduğundan emin ol.
+    Aynı dizin için mkdir süreç boyunca yalnızca bir kez çağrılır.
+    
+    Args:
+        path: Oluşturulacak dizin
+    
+    Returns:
+        Dizinin Path nesnesi
+    """
+    directory = Path(path)
+    key = str(directory)
+    
+    if key not in _ensured_dirs:
+        with _lock:
+            if key not in _ensured_dirs:
+                directory.mkdir(parents=True, exist_ok=True)
+                _ensured_dirs.add(key)
+    
+    return directory
+
+
+def write_bytes(path: Union[str, Path], data: bytes) -> None:
+    """
+    Bellekteki veriyi dosyaya doğrudan FD üzerinden yaz.
+    Tampon katmanı (BufferedWriter) atlanır; tek parça yazım için yeterli.
+    
+    Args:
+        path: Hedef dosya yolu
+        data: Yazılacak veri
+    """
+    fd = os.open(os.fspath(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
@@ -3,6 +3,7 @@ Retry Utility
 Merkezi retry/wait mekanizması - DRY prensibi
 """
 
+import random
 import time
 import logging
 from typing import Callable, TypeVar, Optional, Any
@@ -19,30 +20,39 @@ class RetryConfig:
     DEFAULT_DELAY = 1.0
     DEFAULT_BACKOFF = 2.0
     DEFAULT_MAX_DELAY = 30.0
+    # Koşul bekleme: ilk kontrol aralığı ve büyüme çarpanı
+    INITIAL_INTERVAL = 0.05
+    INTERVAL_GROWTH = 1.5
 
 
 def wait_with_retry(
     condition_fn: Callable[[], bool],
     timeout: float = 30.0,
     interval: float = 1.0,
-    description: str = "condition"
+    description: str = "condition",
+    backoff: bool = True,
 ) -> bool:
     """
     Koşul sağlanana kadar bekle.
     
+    Kontrol aralığı küçük başlar ve her denemede büyüyerek `interval`
+    değerine kadar çıkar; hızlı sağlanan koşullar beklemeden döner.
+    
     Args:
         condition_fn: True döndüğünde bekleyişi sonlandıran fonksiyon
         timeout: Maksimum bekleme süresi (saniye)
-        interval: Kontrol aralığı (saniye)
+        interval: Maksimum kontrol aralığı (saniye)
         description: Log mesajları için açıklama
+        backoff: False ise her kontrol arasında sabit `interval` beklenir
     
     Returns:
         True eğer koşul sağlandıysa, False eğer timeout olduysa
     """
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
+    current_interval = min(RetryConfig.INITIAL_INTERVAL, interval) if backoff else interval
     attempt = 0
     
-    while time.time() - start_time < timeout:
+    while True:
         attempt += 1
         try:
             if condition_fn():
@@ -51,7 +61,12 @@ def wait_with_retry(
         except Exception as e:
             logger.debug(f"{description} kontrol hatası: {e}")
         
-        time.sleep(interval)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        
+        time.sleep(min(current_interval, remaining))
+        current_interval = min(current_interval * RetryConfig.INTERVAL_GROWTH, interval)
     
     logger.warning(f"{description} timeout ({timeout}s)")
     return False
@@ -64,6 +79,7 @@ def retry_on_exception(
     max_delay: float = RetryConfig.DEFAULT_MAX_DELAY,
     exceptions: tuple = (Exception,),
     on_retry: Optional[Callable[[Exception, int], None]] = None,
+    jitter: bool = True,
 ):
     """
     Decorator: Hata durumunda yeniden dene.
@@ -75,6 +91,8 @@ def retry_on_exception(
         max_delay: Maksimum bekleme süresi
         exceptions: Yakalanacak exception türleri
         on_retry: Her retry'da çağrılacak callback
+        jitter: True ise bekleme [0, gecikme] aralığında rastgele seçilir
+            (eşzamanlı başarısız çağrılar aynı anda tekrar denemez)
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
@@ -96,7 +114,10 @@ def retry_on_exception(
                         if on_retry:
                             on_retry(e, attempt)
                         
-                        time.sleep(min(current_delay, max_delay))
+                        sleep_for = min(current_delay, max_delay)
+                        if jitter:
+                            sleep_for = random.uniform(0, sleep_for)
+                        time.sleep(sleep_for)
                         current_delay *= backoff
                     else:
                         logger.error(
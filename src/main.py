@@ -24,11 +24,6 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.presentation import run_bot
-from src.infrastructure.logging import get_logger
-
-logger = get_logger(__name__)
-
 
 def main():
     """Ana fonksiyon"""
@@ -50,6 +45,12 @@ def main():
     print("=" * 50)
     print()
     
+    # Telegram ve altyapı katmanı banner'dan sonra yüklenir
+    from src.infrastructure.logging import get_logger
+    from src.presentation import run_bot
+    
+    logger = get_logger(__name__)
+    
     try:
         run_bot()
     except KeyboardInterrupt:
@@ -2,13 +2,12 @@ import asyncio
 import logging
 from src.container import container
 from src.domain.entities import ProcessContext, ImageEntity
+from src.infrastructure.logging import setup_logger
 import config
 
-# Logging yapılandırması
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s │ %(levelname)-8s │ %(name)s │ %(message)s"
-)
+# Logging yapılandırması - kök logger merkezi modülle bir kez kurulur;
+# tüm modüllerin (getLogger(__name__)) INFO kayıtları buradan akar
+setup_logger("")
 logger = logging.getLogger("Main")
 
 async def main():
@@ -1,29 +1,35 @@
 """
 Presentation Layer
 Kullanıcı arayüzü (Telegram handlers)
+
+Alt modüller ilk erişimde yüklenir (PEP 562); paket importu
+telegram kütüphanesini yüklemez.
 """
 
-from .bot import run_bot, create_bot_application
-from .handlers import (
-    start_handler,
-    status_handler,
-    cancel_handler,
-    handle_photo,
-    handle_document,
-    handle_count,
-    WAITING_FOR_COUNT,
-)
-from .formatters import MessageBuilder
+import importlib
+
+# Dışa aktarılan isim → tanımlandığı alt modül
+_LAZY_EXPORTS = {
+    "run_bot": ".bot",
+    "create_bot_application": ".bot",
+    "start_handler": ".handlers",
+    "status_handler": ".handlers",
+    "cancel_handler": ".handlers",
+    "handle_photo": ".handlers",
+    "handle_document": ".handlers",
+    "handle_count": ".handlers",
+    "WAITING_FOR_COUNT": ".handlers",
+    "MessageBuilder": ".formatters",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
 
-__all__ = [
-    "run_bot",
-    "create_bot_application",
-    "start_handler",
-    "status_handler",
-    "cancel_handler",
-    "handle_photo",
-    "handle_document",
-    "handle_count",
-    "WAITING_FOR_COUNT",
-    "MessageBuilder",
-]
+def __getattr__(name: str):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
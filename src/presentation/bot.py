@@ -3,7 +3,7 @@ Bot Entry Point
 Telegram bot'unu başlatan ve yapılandıran modül
 """
 
-import os
+import importlib.util
 import logging
 
 from telegram import Update
@@ -20,16 +20,74 @@ from .handlers import (
     status_handler,
     cancel_handler,
     login_handler,
+    prompt_toggle_handler,
     handle_photo,
     handle_document,
     handle_count,
     WAITING_FOR_COUNT,
 )
+from ..application import run_in_browser_thread
 from ..container import get_container
 from ..infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Filtreler modül yüklenirken bir kez oluşturulur
+_PHOTO_FILTER = filters.PHOTO
+_DOC_IMG_FILTER = filters.Document.IMAGE
+_TEXT_NO_CMD = filters.TEXT & ~filters.COMMAND
+
+# Long polling: Telegram yeni update gelene kadar isteği açık tutar (saniye)
+POLL_TIMEOUT = 30
+
+# HTTP/2 eşzamanlı istekleri tek bağlantıda çoklar; h2 paketi (httpx[http2]) yoksa HTTP/1.1
+HTTP_VERSION = "2" if importlib.util.find_spec("h2") else "1.1"
+# Havuzdan bağlantı bekleme ve albüm yükleme süreleri (saniye)
+POOL_TIMEOUT = 5.0
+MEDIA_WRITE_TIMEOUT = 60.0
+
+# Yalnızca mesaj update'leri işlenir (komut, fotoğraf, doküman, metin)
+ALLOWED_UPDATES = [Update.MESSAGE]
+
+# Komut → handler eşlemesi (tek yerde tanımlanır)
+_COMMANDS = (
+    ("start", start_handler),
+    ("status", status_handler),
+    ("login", login_handler),
+    ("prompt", prompt_toggle_handler),
+)
+
+# Tarayıcı kilidini bekleyebilen komutlar update kuyruğunu bekletmez (block=False)
+_NON_BLOCKING_COMMANDS = frozenset({"login"})
+
+
+def _build_conversation_handler() -> ConversationHandler:
+    """
+    Fotoğraf → sayı akışının conversation handler'ı.
+    Sohbet durumunu tuttuğu için her Application kendi örneğini alır.
+    """
+    return ConversationHandler(
+        entry_points=[
+            MessageHandler(_PHOTO_FILTER, handle_photo),
+            MessageHandler(_DOC_IMG_FILTER, handle_document),
+        ],
+        states={
+            WAITING_FOR_COUNT: [
+                MessageHandler(_TEXT_NO_CMD, handle_count),
+            ],
+        },
+        fallbacks=[
+            CommandHandler("cancel", cancel_handler),
+        ],
+    )
+
+
+async def _close_browser(application: Application) -> None:
+    """Bot kapanırken istekler arasında açık tutulan tarayıcıyı kapat"""
+    container = application.bot_data.get('container')
+    if container:
+        await run_in_browser_thread(container.cleanup)
+
 
 def create_bot_application() -> Application:
     """Bot Application'ı oluştur ve yapılandır"""
@@ -37,31 +95,34 @@ def create_bot_application() -> Application:
     container = get_container()
     
     # Application oluştur
-    application = Application.builder().token(container.config.bot_token).build()
+    # Update'ler sırayla işlenir (ConversationHandler durumu yarışmaz);
+    # uzun iş akışı arka plan görevinde, login ise block=False ile çalışır
+    application = (
+        Application.builder()
+        .token(container.config.bot_token)
+        .http_version(HTTP_VERSION)
+        .pool_timeout(POOL_TIMEOUT)
+        .media_write_timeout(MEDIA_WRITE_TIMEOUT)
+        .get_updates_http_version(HTTP_VERSION)
+        .post_shutdown(_close_browser)
+        .build()
+    )
     
     # DI: Container'ı bot_data'ya enjekte et
     application.bot_data['container'] = container
     
     # Conversation handler
-    conv_handler = ConversationHandler(
-        entry_points=[
-            MessageHandler(filters.PHOTO, handle_photo),
-            MessageHandler(filters.Document.IMAGE, handle_document),
-        ],
-        states={
-            WAITING_FOR_COUNT: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, handle_count),
-            ],
-        },
-        fallbacks=[
-            CommandHandler("cancel", cancel_handler),
-        ],
-    )
+    conv_handler = _build_conversation_handler()
     
     # Handler'ları ekle
-    application.add_handler(CommandHandler("start", start_handler))
-    application.add_handler(CommandHandler("status", status_handler))
-    application.add_handler(CommandHandler("login", login_handler))
+    application.add_handlers(
+        [
+            CommandHandler(
+                command, callback, block=command not in _NON_BLOCKING_COMMANDS
+            )
+            for command, callback in _COMMANDS
+        ]
+    )
     application.add_handler(conv_handler)
     
     return application
@@ -79,11 +140,13 @@ def run_bot():
         for error in errors:
             logger.error(f"Yapılandırma hatası: {error}")
     
-    # Images klasörünü oluştur
-    os.makedirs(container.config.images_dir, exist_ok=True)
-    
     # Application oluştur ve çalıştır
     application = create_bot_application()
     
     logger.info("Bot çalışıyor! Fotoğraf bekleniyor...")
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    application.run_polling(
+        timeout=POLL_TIMEOUT,
+        allowed_updates=ALLOWED_UPDATES,
+        # Uzun kesintiden sonra biriken fotoğraflar tarayıcıyı boğmasın
+        drop_pending_updates=container.config.drop_pending_updates,
+    )
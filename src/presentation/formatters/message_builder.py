@@ -4,44 +4,55 @@ Mesaj formatlamaları için yardımcı sınıf
 """
 
 
+SEPARATOR = "━" * 24
+
+# Başlık şablonları - modül yüklenirken bir kez oluşturulur
+_HEADER_SUCCESS = "🎉 **{title}**\n" + SEPARATOR + "\n"
+_HEADER_ERROR = "❌ **{title}**\n" + SEPARATOR + "\n"
+_HEADER_INFO = "📊 **{title}**\n" + SEPARATOR + "\n"
+_HEADER_PROGRESS = "🤖 **{title}**\n" + SEPARATOR
+
+
 class MessageBuilder:
     """
     Telegram mesajları için builder.
     Tutarlı formatlama sağlar.
     """
     
-    SEPARATOR = "━" * 24
+    SEPARATOR = SEPARATOR
+    
+    # İlerleme adımı şablonları: tamamlanan / aktif / bekleyen
+    _DONE_FMT = "✅ ~~{}~~"
+    _CUR_FMT = "▶️ **{}...**"
+    _TODO_FMT = "⬜ {}"
     
     @classmethod
     def success(cls, title: str, body: str = "", footer: str = "") -> str:
         """Başarı mesajı oluştur"""
-        lines = [f"🎉 **{title}**", cls.SEPARATOR, ""]
+        text = _HEADER_SUCCESS.format(title=title)
         if body:
-            lines.append(body)
-            lines.append("")
+            text += "\n" + body + "\n"
         if footer:
-            lines.append(footer)
-        return "\n".join(lines)
+            text += "\n" + footer
+        return text
     
     @classmethod
     def error(cls, title: str, details: str = "", suggestion: str = "") -> str:
         """Hata mesajı oluştur"""
-        lines = [f"❌ **{title}**", cls.SEPARATOR, ""]
+        text = _HEADER_ERROR.format(title=title)
         if details:
-            lines.append(f"⚠️ {details}")
-            lines.append("")
+            text += "\n⚠️ " + details + "\n"
         if suggestion:
-            lines.append(f"💡 {suggestion}")
-        return "\n".join(lines)
+            text += "\n💡 " + suggestion
+        return text
     
     @classmethod
     def info(cls, title: str, items: list = None) -> str:
         """Bilgi mesajı oluştur"""
-        lines = [f"📊 **{title}**", cls.SEPARATOR, ""]
+        text = _HEADER_INFO.format(title=title)
         if items:
-            for item in items:
-                lines.append(item)
-        return "\n".join(lines)
+            text += "\n" + "\n".join(items)
+        return text
     
     @classmethod
     def progress(
@@ -53,22 +64,21 @@ class MessageBuilder:
         elapsed_seconds: int = 0,
     ) -> str:
         """İlerleme mesajı oluştur"""
-        lines = [f"🤖 **{title}**", cls.SEPARATOR]
-        
-        for i, step in enumerate(steps):
-            if i < current_step:
-                lines.append(f"✅ ~~{step}~~")
-            elif i == current_step:
-                lines.append(f"▶️ **{step}...**")
-            else:
-                lines.append(f"⬜ {step}")
+        text = _HEADER_PROGRESS.format(title=title)
+        if steps:
+            text += "\n" + "\n".join(
+                (
+                    cls._DONE_FMT if i < current_step
+                    else cls._CUR_FMT if i == current_step
+                    else cls._TODO_FMT
+                ).format(step)
+                for i, step in enumerate(steps)
+            )
         
         if extra_info:
-            lines.append("")
-            lines.append(f"💡 _{extra_info}_")
+            text += f"\n\n💡 _{extra_info}_"
         
         if elapsed_seconds > 0:
-            lines.append("")
-            lines.append(f"⏱️ Geçen süre: {elapsed_seconds}s")
+            text += f"\n\n⏱️ Geçen süre: {elapsed_seconds}s"
         
-        return "\n".join(lines)
+        return text
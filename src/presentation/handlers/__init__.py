@@ -1,19 +1,32 @@
 """
 Presentation Handlers
+
+Handler modülleri ilk erişimde yüklenir (PEP 562).
 """
 
-from .command_handlers import start_handler, status_handler, cancel_handler, login_handler
-from .photo_handlers import handle_photo, handle_document, WAITING_FOR_COUNT
-from .conversation_handlers import handle_count
+import importlib
+
+# Dışa aktarılan isim → tanımlandığı alt modül
+_LAZY_EXPORTS = {
+    "start_handler": ".command_handlers",
+    "status_handler": ".command_handlers",
+    "cancel_handler": ".command_handlers",
+    "login_handler": ".command_handlers",
+    "prompt_toggle_handler": ".command_handlers",
+    "handle_photo": ".photo_handlers",
+    "handle_document": ".photo_handlers",
+    "WAITING_FOR_COUNT": ".conversation_handlers",
+    "handle_count": ".conversation_handlers",
+}
+
+__all__ = list(_LAZY_EXPORTS)
 
-__all__ = [
-    "start_handler",
-    "status_handler",
-    "cancel_handler",
-    "login_handler",
-    "handle_photo",
-    "handle_document",
-    "handle_count",
-    "WAITING_FOR_COUNT",
-]
 
+def __getattr__(name: str):
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,25 @@
+"""
+Handler Bağımlılıkları
+Container'a handler'lardan erişim
+
+DI Pattern: Container create_bot_application içinde bot_data'ya enjekte edilir.
+"""
+
+from typing import TYPE_CHECKING
+
+from telegram.ext import ContextTypes
+
+from ...container import get_container
+
+if TYPE_CHECKING:
+    from ...container import Container
+
+
+def container_from_context(context: ContextTypes.DEFAULT_TYPE) -> "Container":
+    """Context'ten container al (bot_data'da yoksa global container)"""
+    try:
+        return context.bot_data['container']
+    except KeyError:
+        # Fallback - create_bot_application dışında kurulan uygulamalar için
+        container = context.bot_data['container'] = get_container()
+        return container
@@ -4,23 +4,27 @@ Command Handlers
 """
 
 import logging
-import asyncio
+import time
 
 from telegram import Update
-from telegram.ext import ContextTypes
+from telegram.ext import ContextTypes, ConversationHandler
+from telegram.constants import ParseMode
 
-logger = logging.getLogger(__name__)
+from ...application import BROWSER_SESSION_LOCK, run_in_browser_thread
+from ...infrastructure.utils import wait_with_retry
+from ._dependencies import container_from_context
 
+logger = logging.getLogger(__name__)
 
-async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Bot başlangıç komutu"""
-    welcome_text = """
+# Sabit mesaj metinleri - modül yüklenirken bir kez oluşturulur
+WELCOME_TEXT = """
 🤖 **AI Görüntü Otomasyon Botu**
 ━━━━━━━━━━━━━━━━━━━━━━
 
 📸 **Nasıl Çalışır?**
 1️⃣ Bana bir fotoğraf gönder
 2️⃣ Kaç adet görsel istediğini belirt (1-9)
+   _İpucu: sayıyı fotoğraf açıklamasına yazarsan hemen başlar_
 3️⃣ AI fotoğrafı analiz eder
 4️⃣ İstediğin sayıda görsel üretir
 5️⃣ Hepsini sana gönderir
@@ -29,20 +33,72 @@ async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
 /start - Bu mesajı göster
 /status - Bot durumunu kontrol et
 /login - Gemini oturumu aç
+/prompt - Kullanılan prompt'u gösterme ayarı
 /cancel - İşlemi iptal et
 
 🎯 Hadi başlayalım! Bir fotoğraf gönder.
 """
-    await update.message.reply_text(welcome_text, parse_mode="Markdown")
+
+STATUS_TEMPLATE = """
+📊 **Bot Durumu**
+━━━━━━━━━━━━━━━━
+
+🌐 Tarayıcı: {browser_status}
+📁 Klasör: `{images_dir}`
+🔗 Gemini: {gemini_url}
+
+✅ Bot aktif ve fotoğraf bekliyor!
+"""
+
+LOGIN_OPENING_TEXT = (
+    "🔐 **Gemini Oturumu Açılıyor...**\n\n"
+    "⏳ Chrome başlatılıyor, lütfen bekleyin..."
+)
+
+LOGIN_READY_TEXT = (
+    "✅ **Chrome Açıldı!**\n\n"
+    "📌 **Yapmanız gereken:**\n"
+    "1️⃣ Açılan Chrome penceresine gidin\n"
+    "2️⃣ Google hesabınızla giriş yapın\n"
+    "3️⃣ Gemini sayfasının yüklendiğinden emin olun\n\n"
+    "⚠️ Giriş yaptıktan sonra Chrome'u **kapatmayın**!\n"
+    "Bot bu oturumu kullanacak.\n\n"
+    "✅ Giriş tamamlandıktan sonra fotoğraf gönderebilirsiniz."
+)
+
+LOGIN_ERROR_TEMPLATE = (
+    "❌ **Hata!**\n\n"
+    "Chrome açılamadı: `{error}`\n\n"
+    "🔧 Çözüm: Chrome profilinin doğru yolda olduğundan emin olun."
+)
+
+# Art arda /login komutlarında tarayıcı tekrar başlatılmaz (saniye)
+LOGIN_COOLDOWN = 10
+# Login sayfasının hazır olmasını bekleme üst sınırı (saniye)
+LOGIN_READY_TIMEOUT = 5
+# chat_data anahtarı: iş akışı sonunda kullanılan prompt gönderilsin mi
+# (user_data her akış sonunda temizlendiği için chat_data'da tutulur)
+ECHO_PROMPT_KEY = 'echo_prompt'
+
+
+def _status_text(browser_status: str, images_dir: str, gemini_url: str) -> str:
+    """Durum mesajını şablondan oluştur"""
+    return STATUS_TEMPLATE.format_map({
+        "browser_status": browser_status,
+        "images_dir": images_dir,
+        "gemini_url": gemini_url,
+    })
+
+
+async def start_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Bot başlangıç komutu"""
+    await update.message.reply_text(WELCOME_TEXT, parse_mode=ParseMode.MARKDOWN)
 
 
 async def status_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Bot durumunu kontrol et"""
-    # Container'dan durum almak için import
-    from ...container import get_container
-    
     try:
-        container = get_container()
+        container = container_from_context(context)
         browser_status = "✅ Aktif" if container.browser_service.is_running() else "❌ Kapalı"
         images_dir = container.config.images_dir
         gemini_url = container.config.gemini_url
@@ -52,17 +108,8 @@ async def status_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
         gemini_url = "Bilinmiyor"
         logger.error(f"Status hatası: {e}")
     
-    status_text = f"""
-📊 **Bot Durumu**
-━━━━━━━━━━━━━━━━
-
-🌐 Tarayıcı: {browser_status}
-📁 Klasör: `{images_dir}`
-🔗 Gemini: {gemini_url}
-
-✅ Bot aktif ve fotoğraf bekliyor!
-"""
-    await update.message.reply_text(status_text, parse_mode="Markdown")
+    status_text = _status_text(browser_status, str(images_dir), gemini_url)
+    await update.message.reply_text(status_text, parse_mode=ParseMode.MARKDOWN)
 
 
 async def login_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -71,61 +118,69 @@ async def login_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Chrome'u başlatır ve Gemini sayfasına gider.
     Kullanıcı manuel olarak giriş yapabilir.
     """
-    from ...container import get_container
+    last_login = context.user_data.get('login_started_at')
+    if last_login is not None and time.monotonic() - last_login < LOGIN_COOLDOWN:
+        await update.message.reply_text(
+            "⏳ Chrome zaten açılıyor, lütfen birkaç saniye bekleyin.",
+            parse_mode=ParseMode.MARKDOWN
+        )
+        return
+    context.user_data['login_started_at'] = time.monotonic()
     
-    await update.message.reply_text(
-        "🔐 **Gemini Oturumu Açılıyor...**\n\n"
-        "⏳ Chrome başlatılıyor, lütfen bekleyin...",
-        parse_mode="Markdown"
-    )
+    await update.message.reply_text(LOGIN_OPENING_TEXT, parse_mode=ParseMode.MARKDOWN)
     
     try:
-        container = get_container()
+        container = container_from_context(context)
         
-        # Tarayıcıyı başlat
-        if not container.browser_service.is_running():
-            container.browser_service.start()
-            await asyncio.sleep(2)
-        
-        # Gemini'ye git
-        gemini_url = container.config.gemini_url
-        container.browser_service.navigate_to(gemini_url)
-        await asyncio.sleep(3)
+        async with BROWSER_SESSION_LOCK:
+            # Tarayıcıyı başlat
+            if not container.browser_service.is_running():
+                await run_in_browser_thread(container.browser_service.start)
+            
+            # Gemini'ye git - sabit bekleme yerine sayfa hazır olunca devam
+            gemini_url = container.config.gemini_url
+            await run_in_browser_thread(container.browser_service.navigate_to, gemini_url)
+            await run_in_browser_thread(
+                wait_with_retry,
+                container.browser_service.is_page_ready,
+                timeout=LOGIN_READY_TIMEOUT,
+                interval=0.2,
+                description="Login sayfası",
+            )
         
         # Durum mesajı
-        await update.message.reply_text(
-            "✅ **Chrome Açıldı!**\n\n"
-            "📌 **Yapmanız gereken:**\n"
-            "1️⃣ Açılan Chrome penceresine gidin\n"
-            "2️⃣ Google hesabınızla giriş yapın\n"
-            "3️⃣ Gemini sayfasının yüklendiğinden emin olun\n\n"
-            "⚠️ Giriş yaptıktan sonra Chrome'u **kapatmayın**!\n"
-            "Bot bu oturumu kullanacak.\n\n"
-            "✅ Giriş tamamlandıktan sonra fotoğraf gönderebilirsiniz.",
-            parse_mode="Markdown"
-        )
+        await update.message.reply_text(LOGIN_READY_TEXT, parse_mode=ParseMode.MARKDOWN)
         
         logger.info("Gemini login sayfası açıldı")
         
     except Exception as e:
         logger.error(f"Login hatası: {e}")
         await update.message.reply_text(
-            f"❌ **Hata!**\n\n"
-            f"Chrome açılamadı: `{str(e)}`\n\n"
-            f"🔧 Çözüm: Chrome profilinin doğru yolda olduğundan emin olun.",
-            parse_mode="Markdown"
+            LOGIN_ERROR_TEMPLATE.format_map({"error": e}),
+            parse_mode=ParseMode.MARKDOWN
         )
 
 
+async def prompt_toggle_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Kullanılan prompt'un sonuçla birlikte gönderilmesini aç/kapat"""
+    enabled = not context.chat_data.get(ECHO_PROMPT_KEY, True)
+    context.chat_data[ECHO_PROMPT_KEY] = enabled
+    
+    await update.message.reply_text(
+        "📝 Kullanılan prompt artık gösterilecek."
+        if enabled else
+        "🔕 Kullanılan prompt artık gösterilmeyecek.",
+        parse_mode=ParseMode.MARKDOWN
+    )
+
+
 async def cancel_handler(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """İşlemi iptal et"""
-    from telegram.ext import ConversationHandler
-    
     context.user_data.clear()
     await update.message.reply_text(
         "❌ İşlem iptal edildi.\n\n"
         "🔄 Yeni bir fotoğraf göndererek tekrar başlayabilirsiniz.",
-        parse_mode="Markdown"
+        parse_mode=ParseMode.MARKDOWN
     )
     return ConversationHandler.END
 
@@ -5,83 +5,200 @@ Görsel sayısı alma ve işleme akışı
 DI Pattern: Bağımlılıklar context.bot_data üzerinden enjekte edilir.
 """
 
+import asyncio
 import os
 import logging
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import List, Optional
 
-from telegram import Update
+from telegram import InputMediaDocument, InputMediaPhoto, Update
 from telegram.ext import ContextTypes, ConversationHandler
+from telegram.constants import ParseMode
 
 from ...domain import ImageEntity, ImageCount, ValidationError
-from ...application import ImageProcessRequest, ProgressNotifierService
-from .photo_handlers import WAITING_FOR_COUNT
-
-if TYPE_CHECKING:
-    from ...container import Container
+from ...application import (
+    ImageProcessRequest,
+    ProgressNotifierService,
+    BROWSER_SESSION_LOCK,
+    run_in_browser_thread,
+)
+from .command_handlers import ECHO_PROMPT_KEY
+from ._dependencies import container_from_context
 
 logger = logging.getLogger(__name__)
 
+# Conversation states
+WAITING_FOR_COUNT = 1
+
+# chat_data anahtarı: sohbette devam eden iş var mı
+JOB_RUNNING_KEY = 'job_running'
+
+
+async def _read_image(img_path: str) -> Optional[bytes]:
+    """Görseli thread'de oku (bulunamazsa None)"""
+    try:
+        return await asyncio.to_thread(Path(img_path).read_bytes)
+    except FileNotFoundError:
+        logger.warning(f"Görsel bulunamadı, atlanıyor: {img_path}")
+        return None
+
 
-def _get_container(context: ContextTypes.DEFAULT_TYPE) -> "Container":
+async def _send_generated_images(message, paths: List[str]) -> None:
     """
-    Context'ten container al.
-    DI Pattern: Container bot_data üzerinden enjekte edilir.
+    Görselleri dosya albümü + önizleme albümü olarak gönder.
+    Telegram albümde belge ile fotoğrafı karıştırmaz; bu yüzden iki albüm.
     """
-    container = context.bot_data.get('container')
-    if not container:
-        # Fallback - sadece geçiş dönemi için
-        from ...container import get_container
-        container = get_container()
-        context.bot_data['container'] = container
-    return container
+    total = len(paths)
+    contents = await asyncio.gather(*map(_read_image, paths))
+    images = [
+        (index, img_path, data)
+        for index, (img_path, data) in enumerate(zip(paths, contents), 1)
+        if data is not None
+    ]
+    
+    # Albüm en az 2 öğe ister
+    if len(images) < 2:
+        for index, img_path, data in images:
+            await _send_generated_image(message, img_path, data, index, total)
+        return
+    
+    await message.reply_media_group([
+        InputMediaDocument(
+            media=data,
+            filename=os.path.basename(img_path),
+            caption=f"🎨 Görsel {index}/{total}",
+        )
+        for index, img_path, data in images
+    ])
+    await message.reply_media_group([
+        InputMediaPhoto(
+            media=data,
+            caption=f"👆 Önizleme {index}/{total}",
+        )
+        for index, _, data in images
+    ])
+
+
+async def _send_generated_image(
+    message, img_path: str, data: bytes, index: int, total: int
+) -> None:
+    """Tek görseli dosya + önizleme olarak gönder (sıra korunur)"""
+    await message.reply_document(
+        document=data,
+        filename=os.path.basename(img_path),
+        caption=f"🎨 Görsel {index}/{total}",
+    )
+    await message.reply_photo(
+        photo=data,
+        caption=f"👆 Önizleme {index}/{total}",
+    )
 
 
 async def handle_count(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Görsel sayısını al ve işlemi başlat"""
     text = update.message.text.strip()
     
-    # Value Object ile doğrulama
-    try:
-        image_count = ImageCount.from_string(text)
-        count = int(image_count)
-    except ValueError as e:
+    # Value Object ile doğrulama - geçersiz girdi exception'sız elenir
+    image_count = ImageCount.try_parse(text)
+    if image_count is None:
         await update.message.reply_text(
             "⚠️ **Geçersiz sayı!**\n\n"
             "Lütfen 1-9 arası bir sayı girin.\n\n"
             "_Örnek: 1, 3, 5, 9_",
-            parse_mode="Markdown"
+            parse_mode=ParseMode.MARKDOWN
         )
         return WAITING_FOR_COUNT
     
-    # Dosya yolunu al
-    image_path = context.user_data.get('image_path')
-    if not image_path or not os.path.exists(image_path):
+    return await start_processing(
+        update, context, context.user_data.get('image_path'), int(image_count)
+    )
+
+
+async def start_processing(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    image_path: Optional[str],
+    count: int,
+) -> int:
+    """
+    İşi arka planda başlat ve konuşmayı bitir.
+    Sayı mesajından da, fotoğraf açıklamasından da çağrılır.
+    """
+    if not image_path or not Path(image_path).is_file():
         await update.message.reply_text(
             "❌ **Hata:** Fotoğraf bulunamadı.\n\n"
             "Lütfen tekrar bir fotoğraf gönderin.",
-            parse_mode="Markdown"
+            parse_mode=ParseMode.MARKDOWN
         )
         return ConversationHandler.END
     
-    # Onay mesajı
-    await update.message.reply_text(
-        f"✅ **{count} görsel** oluşturulacak!\n\n"
-        "🚀 İşlem başlatılıyor...",
-        parse_mode="Markdown"
+    if await reject_if_job_running(update, context):
+        return ConversationHandler.END
+    
+    # Uzun iş arka planda sürer; handler hemen döner, konuşma biter.
+    # Fotoğraf bilgisi işe devredildi - yeni fotoğraf yeni akış başlatır.
+    context.user_data.clear()
+    context.chat_data[JOB_RUNNING_KEY] = True
+    context.application.create_task(
+        _run_job(update, context, image_path, count),
+        update=update,
     )
+    return ConversationHandler.END
+
+
+async def reject_if_job_running(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+) -> bool:
+    """
+    Aynı sohbette aynı anda tek iş - yeni istek beklemeye girmez, bilgi verilir.
     
-    # İlerleme mesajı
+    Returns:
+        True eğer sohbette süren iş varsa (istek reddedildi)
+    """
+    if not context.chat_data.get(JOB_RUNNING_KEY):
+        return False
+    
+    await update.message.reply_text(
+        "⏳ **Önceki isteğiniz işleniyor...**\n\n"
+        "Tamamlandıktan sonra yeni fotoğraf gönderebilirsiniz.",
+        parse_mode=ParseMode.MARKDOWN
+    )
+    return True
+
+
+async def _run_job(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    image_path: str,
+    count: int,
+) -> None:
+    """Arka plan işi - bitince sohbetin iş bayrağını kaldır"""
+    try:
+        await _process_request(update, context, image_path, count)
+    except Exception:
+        logger.exception("Arka plan işi başarısız")
+    finally:
+        context.chat_data.pop(JOB_RUNNING_KEY, None)
+
+
+async def _process_request(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    image_path: str,
+    count: int,
+) -> None:
+    """Oturumu kontrol et, iş akışını çalıştır ve sonuçları gönder"""
+    # Onay + ilerleme tek mesajda (ilerleme güncellemeleri bu mesajı düzenler)
+    # Düz metin: durum mesajları sunucuda Markdown olarak ayrıştırılmaz
     status_msg = await update.message.reply_text(
-        "🔄 **Hazırlanıyor...**",
-        parse_mode="Markdown"
+        f"✅ {count} görsel oluşturulacak!\n\n"
+        "🔄 Hazırlanıyor..."
     )
     
-    # Progress callback oluştur
+    # Progress callback oluştur - hatalar (ör. RetryAfter) notifier'da ele alınır
     async def update_callback(text: str):
-        try:
-            await status_msg.edit_text(text, parse_mode="Markdown")
-        except Exception as e:
-            logger.debug(f"Mesaj güncellenemedi: {e}")
+        await status_msg.edit_text(text)
     
     progress_notifier = ProgressNotifierService(
         update_callback=update_callback,
@@ -90,21 +207,23 @@ async def handle_count(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     try:
         # DI Pattern üzerinden container al
-        container = _get_container(context)
+        container = container_from_context(context)
         
         # === OTOMATİK OTURUM KONTROLÜ ===
         try:
-            is_valid, session_msg = container.ai_service.check_session()
+            async with BROWSER_SESSION_LOCK:
+                is_valid, session_msg = await run_in_browser_thread(
+                    container.ai_service.check_session
+                )
             if not is_valid:
                 await update.message.reply_text(
                     "⚠️ **Gemini Oturumu Kapalı!**\n\n"
                     f"📌 Durum: {session_msg}\n\n"
                     "🔐 Lütfen `/login` komutu ile giriş yapın,\n"
                     "ardından tekrar fotoğraf gönderin.",
-                    parse_mode="Markdown"
+                    parse_mode=ParseMode.MARKDOWN
                 )
-                context.user_data.clear()
-                return ConversationHandler.END
+                return
         except Exception as e:
             logger.warning(f"Oturum kontrolü atlandı: {e}")
         
@@ -126,32 +245,20 @@ async def handle_count(update: Update, context: ContextTypes.DEFAULT_TYPE):
         if result.success:
             await progress_notifier.notify_complete(success=True)
             
-            # Görselleri gönder
-            for i, img_path in enumerate(result.generated_image_paths, 1):
-                if os.path.exists(img_path):
-                    with open(img_path, 'rb') as f:
-                        await update.message.reply_document(
-                            document=f,
-                            filename=os.path.basename(img_path),
-                            caption=f"🎨 **Görsel {i}/{len(result.generated_image_paths)}**",
-                            parse_mode="Markdown"
-                        )
-                    
-                    with open(img_path, 'rb') as f:
-                        await update.message.reply_photo(
-                            photo=f,
-                            caption=f"👆 _Önizleme {i}/{len(result.generated_image_paths)}_",
-                            parse_mode="Markdown"
-                        )
+            # Görseller toplu gönderilir (dosyalar ve önizlemeler ayrı albümde)
+            try:
+                await _send_generated_images(update.message, result.generated_image_paths)
+            except Exception as e:
+                logger.error(f"Görseller gönderilemedi: {e}")
             
-            # Prompt'u gönder
-            if result.extracted_prompt:
+            # Prompt'u gönder (/prompt ile kapatılabilir)
+            if result.extracted_prompt and context.chat_data.get(ECHO_PROMPT_KEY, True):
+                # Prompt serbest metin (` ve _ içerebilir) - düz metin gönderilir
                 prompt_display = result.extracted_prompt[:3500]
                 await update.message.reply_text(
-                    f"📝 **Kullanılan Prompt:**\n"
+                    f"📝 Kullanılan Prompt:\n"
                     f"━━━━━━━━━━━━━━━━━━━━━━\n\n"
-                    f"`{prompt_display}`",
-                    parse_mode="Markdown"
+                    f"{prompt_display}"
                 )
         else:
             await progress_notifier.notify_complete(
@@ -162,8 +269,3 @@ async def handle_count(update: Update, context: ContextTypes.DEFAULT_TYPE):
     except Exception as e:
         logger.error(f"Hata: {e}")
         await progress_notifier.notify_complete(success=False, details=str(e))
-    
-    # Temizlik
-    context.user_data.clear()
-    
-    return ConversationHandler.END
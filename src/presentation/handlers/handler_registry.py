@@ -5,17 +5,16 @@ OCP: Yeni handler = yeni decorator, mevcut koda dokunma yok.
 """
 
 import logging
-from typing import Callable, Dict, List, Any, Optional, Union
+from collections import defaultdict
+from itertools import chain
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
-from telegram.ext import (
-    Application,
-    CommandHandler,
-    MessageHandler,
-    ConversationHandler,
-    filters,
-)
+# telegram.ext yalnızca handler oluşturulurken yüklenir (decorator kaydı için gerekmez)
+if TYPE_CHECKING:
+    from telegram.ext import Application, ConversationHandler
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +27,7 @@ class HandlerType(Enum):
     CONVERSATION = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class HandlerConfig:
     """Handler konfigürasyonu"""
     handler_type: HandlerType
@@ -37,9 +36,11 @@ class HandlerConfig:
     filter_obj: Any = None
     priority: int = 0
     group: int = 0
+    # Birleştirilmiş command handler'ın karşıladığı komutlar
+    commands: Tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationConfig:
     """Conversation handler konfigürasyonu"""
     name: str
@@ -48,6 +49,18 @@ class ConversationConfig:
     fallbacks: List[HandlerConfig] = field(default_factory=list)
 
 
+def _command_handler(config: HandlerConfig) -> Any:
+    """Config'ten CommandHandler oluştur (birleşikse tüm komutlarıyla)"""
+    from telegram.ext import CommandHandler
+    return CommandHandler(config.commands or config.name, config.handler_func)
+
+
+def _message_handler(config: HandlerConfig) -> Any:
+    """Config'ten filtreli MessageHandler oluştur"""
+    from telegram.ext import MessageHandler
+    return MessageHandler(config.filter_obj, config.handler_func)
+
+
 class HandlerRegistry:
     """
     Handler Registry - OCP Uyumlu.
@@ -64,9 +77,18 @@ class HandlerRegistry:
     """
     
     _instance: Optional["HandlerRegistry"] = None
+    # (package, dizin mtime) → keşfedilen handler modül isimleri
+    _DISCOVERY_CACHE: Dict[Tuple[str, float], List[str]] = {}
+    
+    # Handler tipi → telegram handler fabrikası (yeni tip = yeni satır)
+    _FACTORIES: Dict[HandlerType, Callable[[HandlerConfig], Any]] = {
+        HandlerType.COMMAND: _command_handler,
+        HandlerType.MESSAGE: _message_handler,
+    }
     
     def __init__(self):
-        self._handlers: List[HandlerConfig] = []
+        # -priority → handler'lar (kayıt sırasıyla); yüksek öncelik önce gelir
+        self._priority_buckets: Dict[int, List[HandlerConfig]] = defaultdict(list)
         self._conversations: List[ConversationConfig] = []
     
     @classmethod
@@ -103,7 +125,7 @@ class HandlerRegistry:
                 priority=priority,
                 group=group,
             )
-            self._handlers.append(config)
+            self._add(config)
             logger.debug(f"Command kaydedildi: /{command_name}")
             return func
         return decorator
@@ -131,7 +153,7 @@ class HandlerRegistry:
                 priority=priority,
                 group=group,
             )
-            self._handlers.append(config)
+            self._add(config)
             logger.debug(f"Message handler kaydedildi: {func.__name__}")
             return func
         return decorator
@@ -151,7 +173,7 @@ class HandlerRegistry:
             priority=priority,
             group=group,
         )
-        self._handlers.append(config)
+        self._add(config)
     
     def register_message_handler(
         self, 
@@ -169,28 +191,33 @@ class HandlerRegistry:
             priority=priority,
             group=group,
         )
-        self._handlers.append(config)
+        self._add(config)
+    
+    def _add(self, config: HandlerConfig) -> None:
+        """Handler'ı öncelik kovasına ekle"""
+        self._priority_buckets[-config.priority].append(config)
+    
+    def _iter_handlers(self) -> Iterator[HandlerConfig]:
+        """Handler'lar öncelik sırasıyla (eşitlerde kayıt sırası)"""
+        return chain.from_iterable(
+            self._priority_buckets[key] for key in sorted(self._priority_buckets)
+        )
     
     def register_conversation(self, config: ConversationConfig) -> None:
         """Conversation handler kaydı"""
         self._conversations.append(config)
         logger.debug(f"Conversation kaydedildi: {config.name}")
     
-    def apply_to_application(self, app: Application) -> None:
+    def apply_to_application(self, app: "Application") -> None:
         """
         Tüm kayıtlı handler'ları application'a ekle.
         
         Args:
             app: Telegram Application instance
         """
-        # Önceliğe göre sırala
-        sorted_handlers = sorted(
-            self._handlers, 
-            key=lambda h: h.priority, 
-            reverse=True
-        )
-        
-        for config in sorted_handlers:
+        # Önceliğe göre - kovalar üzerinden doğrusal geçiş
+        configs = self._merge_command_handlers(self._iter_handlers())
+        for config in configs:
             handler = self._create_handler(config)
             if handler:
                 app.add_handler(handler, group=config.group)
@@ -202,6 +229,55 @@ class HandlerRegistry:
             app.add_handler(conv_handler)
             logger.info(f"Conversation eklendi: {conv_config.name}")
     
+    @staticmethod
+    def _merge_command_handlers(configs: Iterable[HandlerConfig]) -> List[HandlerConfig]:
+        """
+        Aynı grupta art arda gelen command handler'ları tek CommandHandler'da birleştir.
+        
+        PTB her CommandHandler için mesaj metnini ayrı ayrı ayrıştırır; birleşik
+        handler metni bir kez ayrıştırır, komut adını tablodan O(1) ile bulur.
+        Yalnızca arada aynı grubun başka handler'ı olmayan komutlar birleşir;
+        böylece öncelik sırası değişmez.
+        """
+        merged: List[HandlerConfig] = []
+        # merged indeksi → birleşik komut tablosu
+        tables: Dict[int, Dict[str, Callable]] = {}
+        # grup → o gruba eklenen son handler'ın merged indeksi
+        last_in_group: Dict[int, int] = {}
+        
+        for config in configs:
+            last = last_in_group.get(config.group)
+            if config.handler_type == HandlerType.COMMAND and last in tables:
+                # Aynı komut tekrar kaydedildiyse PTB'deki gibi ilki kazanır
+                tables[last].setdefault(config.name.lower(), config.handler_func)
+                continue
+            
+            merged.append(config)
+            last_in_group[config.group] = len(merged) - 1
+            if config.handler_type == HandlerType.COMMAND:
+                tables[len(merged) - 1] = {config.name.lower(): config.handler_func}
+        
+        for index, table in tables.items():
+            if len(table) == 1:
+                continue
+            config = merged[index]
+            
+            async def dispatch(update, context, _table=MappingProxyType(table)):
+                # "/komut@bot arg" → "komut"
+                command = update.effective_message.text[1:].split(maxsplit=1)[0]
+                return await _table[command.split("@", 1)[0].lower()](update, context)
+            
+            merged[index] = HandlerConfig(
+                handler_type=HandlerType.COMMAND,
+                name="|".join(table),
+                handler_func=dispatch,
+                priority=config.priority,
+                group=config.group,
+                commands=tuple(table),
+            )
+        
+        return merged
+    
     def discover_handlers(
         self, 
         package: str = "src.presentation.handlers"
@@ -227,11 +303,19 @@ class HandlerRegistry:
             pkg = importlib.import_module(package)
             pkg_path = Path(pkg.__file__).parent
             
-            for _, module_name, _ in pkgutil.iter_modules([str(pkg_path)]):
-                # __init__ ve registry'yi atla
-                if module_name.startswith('_') or module_name == 'handler_registry':
-                    continue
-                
+            # Dizin değişmediyse modül listesi önbellekten gelir
+            cache_key = (package, pkg_path.stat().st_mtime)
+            module_names = self._DISCOVERY_CACHE.get(cache_key)
+            if module_names is None:
+                module_names = [
+                    module_name
+                    for _, module_name, _ in pkgutil.iter_modules([str(pkg_path)])
+                    # __init__ ve registry'yi atla
+                    if not (module_name.startswith('_') or module_name == 'handler_registry')
+                ]
+                self._DISCOVERY_CACHE[cache_key] = module_names
+            
+            for module_name in module_names:
                 try:
                     importlib.import_module(f"{package}.{module_name}")
                     discovered += 1
@@ -246,31 +330,27 @@ class HandlerRegistry:
         return discovered
     
     def _create_handler(self, config: HandlerConfig) -> Any:
-        """Handler oluştur"""
-        if config.handler_type == HandlerType.COMMAND:
-            return CommandHandler(config.name, config.handler_func)
-        
-        elif config.handler_type == HandlerType.MESSAGE:
-            return MessageHandler(config.filter_obj, config.handler_func)
-        
-        return None
+        """Handler oluştur (tip → fabrika tablosu)"""
+        factory = self._FACTORIES.get(config.handler_type)
+        return factory(config) if factory else None
+    
+    def _build_many(self, configs: Iterable[HandlerConfig]) -> List[Any]:
+        """Config listesinden handler'lar (desteklenmeyen tipler atlanır)"""
+        return [h for h in map(self._create_handler, configs) if h is not None]
     
     def _create_conversation_handler(
         self, 
         config: ConversationConfig
-    ) -> ConversationHandler:
+    ) -> "ConversationHandler":
         """Conversation handler oluştur"""
-        entry_points = [
-            self._create_handler(h) for h in config.entry_points
-        ]
-        
-        states = {}
-        for state, handlers in config.states.items():
-            states[state] = [self._create_handler(h) for h in handlers]
+        from telegram.ext import ConversationHandler
         
-        fallbacks = [
-            self._create_handler(h) for h in config.fallbacks
-        ]
+        entry_points = self._build_many(config.entry_points)
+        states = {
+            state: self._build_many(handlers)
+            for state, handlers in config.states.items()
+        }
+        fallbacks = self._build_many(config.fallbacks)
         
         return ConversationHandler(
             entry_points=entry_points,
@@ -280,11 +360,11 @@ class HandlerRegistry:
     
     def list_handlers(self) -> List[str]:
         """Kayıtlı handler isimlerini listele"""
-        return [h.name for h in self._handlers]
+        return [h.name for h in self._iter_handlers()]
     
     def clear(self) -> None:
         """Registry'yi temizle"""
-        self._handlers.clear()
+        self._priority_buckets.clear()
         self._conversations.clear()
 
 
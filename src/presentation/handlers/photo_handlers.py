@@ -4,17 +4,32 @@ Fotoğraf ve doküman işleme handler'ları
 DRY prensibi: handle_photo ve handle_document birleştirildi
 """
 
+import asyncio
 import os
+import re
 import logging
 from typing import Optional
 
 from telegram import Update
 from telegram.ext import ContextTypes, ConversationHandler
+from telegram.constants import ParseMode
+
+from ...domain import ImageCount
+from ...infrastructure.utils import write_bytes
+from ._dependencies import container_from_context
+from .conversation_handlers import (
+    WAITING_FOR_COUNT,
+    reject_if_job_running,
+    start_processing,
+)
 
 logger = logging.getLogger(__name__)
 
-# Conversation states
-WAITING_FOR_COUNT = 1
+# Dosya adında izin verilmeyen karakterler (yol ayırıcıları dahil)
+_UNSAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9._-]")
+
+# Bot API getFile sınırı - daha büyük dosyalar indirilemez (byte)
+MAX_DOWNLOAD_SIZE = 20 * 1024 * 1024
 
 
 async def _save_image_file(
@@ -22,14 +37,22 @@ async def _save_image_file(
     context: ContextTypes.DEFAULT_TYPE,
     file_id: str,
     filename: str,
-    images_dir: str,
 ) -> str:
     """
     Görsel dosyasını kaydet - ortak fonksiyon (DRY).
     """
+    container = container_from_context(context)
+    # İndirme ve kullanıcının sayı yazma süresi tarayıcı açılışıyla örtüşsün
+    context.application.create_task(_warm_up_browser(container))
+    
+    # images_dir ConfigService'te önbellekli; dizin yolu sabit
+    images_dir = container.config.images_dir
+    
     file = await context.bot.get_file(file_id)
-    file_path = os.path.join(images_dir, filename)
-    await file.download_to_drive(file_path)
+    file_path = f"{images_dir}{os.sep}{filename}"
+    # İndirme ağda, diske yazma thread'de - event loop bloklanmaz
+    data = await file.download_as_bytearray()
+    await asyncio.to_thread(write_bytes, file_path, data)
     
     # Kullanıcı verisine kaydet
     context.user_data['image_path'] = file_path
@@ -38,36 +61,89 @@ async def _save_image_file(
     return file_path
 
 
+async def _warm_up_browser(container) -> None:
+    """Tarayıcıyı önceden başlat - iş gelmezse boşta kapatılır"""
+    try:
+        await container.process_workflow_use_case.warm_up_browser()
+    except Exception as e:
+        logger.warning(f"Tarayıcı ön başlatma başarısız: {e}")
+
+
+def _safe_filename(update: Update, name: str) -> str:
+    """
+    Sohbet + mesaj kimliğiyle çakışmasız, güvenli dosya adı.
+    message_id yalnızca sohbet içinde benzersizdir; kullanıcı adı ../ içerebilir.
+    """
+    safe = _UNSAFE_FILENAME_RE.sub("_", name)[-64:] or "img.jpg"
+    return f"{update.effective_chat.id}_{update.message.message_id}_{safe}"
+
+
+async def _reject_if_too_large(update: Update, file_size: Optional[int]) -> bool:
+    """
+    Boyut Telegram'dan zaten biliniyor - indirilemeyecek dosyayı
+    get_file çağrısından önce reddet.
+    """
+    if not file_size or file_size <= MAX_DOWNLOAD_SIZE:
+        return False
+    
+    mb = 1024 * 1024
+    await update.message.reply_text(
+        f"⚠️ **Hata:** Dosya çok büyük ({file_size // mb} MB). "
+        f"En fazla {MAX_DOWNLOAD_SIZE // mb} MB gönderebilirsiniz.",
+        parse_mode=ParseMode.MARKDOWN
+    )
+    return True
+
+
 async def _ask_for_count(update: Update) -> int:
     """Görsel sayısını sor - ortak mesaj"""
     await update.message.reply_text(
         "📸 **Fotoğraf alındı!**\n\n"
         "🔢 Kaç adet görsel oluşturmak istiyorsunuz?\n\n"
         "_(1-9 arası bir sayı girin)_\n\n"
-        "💡 Örnek: `3` yazarsanız 3 farklı görsel oluşturulur",
-        parse_mode="Markdown"
+        "💡 Örnek: `3` yazarsanız 3 farklı görsel oluşturulur\n"
+        "⚡ Bir dahaki sefere sayıyı fotoğraf açıklamasına yazabilirsiniz",
+        parse_mode=ParseMode.MARKDOWN
     )
     return WAITING_FOR_COUNT
 
 
-async def handle_photo(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Fotoğraf alındığında sayı sor"""
-    logger.info("Fotoğraf alındı, sayı bekleniyor...")
-    
-    from ...container import get_container
-    container = get_container()
+async def _receive_image(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    file_id: str,
+    filename: str,
+) -> int:
+    """Görseli kaydet; açıklamada geçerli sayı varsa işi hemen başlat, yoksa sayı sor"""
+    image_count = ImageCount.try_parse(update.message.caption or "")
     
-    photo = update.message.photo[-1]
-    filename = f"photo_{update.message.message_id}.jpg"
+    # Meşgul sohbette açıklamalı istek indirmeden önce reddedilir (dosya artığı kalmaz)
+    if image_count is not None and await reject_if_job_running(update, context):
+        return ConversationHandler.END
     
-    await _save_image_file(
+    file_path = await _save_image_file(
         update, context,
-        file_id=photo.file_id,
+        file_id=file_id,
         filename=filename,
-        images_dir=container.config.images_dir,
     )
     
-    return await _ask_for_count(update)
+    if image_count is None:
+        return await _ask_for_count(update)
+    
+    return await start_processing(update, context, file_path, int(image_count))
+
+
+async def handle_photo(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Fotoğraf alındığında sayı sor (açıklamada sayı varsa doğrudan başlat)"""
+    logger.info("Fotoğraf alındı")
+    
+    photo = update.message.photo[-1]
+    if await _reject_if_too_large(update, photo.file_size):
+        return ConversationHandler.END
+    
+    filename = _safe_filename(update, "photo.jpg")
+    
+    return await _receive_image(update, context, photo.file_id, filename)
 
 
 async def handle_document(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -77,22 +153,15 @@ async def handle_document(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not doc.mime_type or not doc.mime_type.startswith('image/'):
         await update.message.reply_text(
             "⚠️ **Hata:** Lütfen sadece görüntü dosyası gönderin.",
-            parse_mode="Markdown"
+            parse_mode=ParseMode.MARKDOWN
         )
         return ConversationHandler.END
     
-    logger.info("Doküman alındı, sayı bekleniyor...")
-    
-    from ...container import get_container
-    container = get_container()
+    if await _reject_if_too_large(update, doc.file_size):
+        return ConversationHandler.END
     
-    filename = doc.file_name or f"doc_{update.message.message_id}.jpg"
+    logger.info("Doküman alındı")
     
-    await _save_image_file(
-        update, context,
-        file_id=doc.file_id,
-        filename=filename,
-        images_dir=container.config.images_dir,
-    )
+    filename = _safe_filename(update, doc.file_name or "doc.jpg")
     
-    return await _ask_for_count(update)
+    return await _receive_image(update, context, doc.file_id, filename)
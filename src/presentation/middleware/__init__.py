@@ -4,7 +4,6 @@ Presentation Middleware Package
 
 from .middleware import (
     Middleware,
-    MiddlewareContext,
     MiddlewarePipeline,
     LoggingMiddleware,
     ErrorHandlingMiddleware,
@@ -13,7 +12,6 @@ from .middleware import (
 
 __all__ = [
     'Middleware',
-    'MiddlewareContext',
     'MiddlewarePipeline',
     'LoggingMiddleware',
     'ErrorHandlingMiddleware',
@@ -4,9 +4,8 @@ Request/Response pipeline için middleware sistemi.
 """
 
 import logging
-from typing import Callable, List, Any, Optional
-from dataclasses import dataclass
-from abc import ABC, abstractmethod
+from typing import Callable, List, Any, Optional, Tuple
+from abc import ABC
 from functools import wraps
 
 from telegram import Update
@@ -15,27 +14,26 @@ from telegram.ext import ContextTypes
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class MiddlewareContext:
-    """Middleware context - request boyunca taşınan veri"""
-    update: Update
-    context: ContextTypes.DEFAULT_TYPE
-    data: dict = None
-    
-    def __post_init__(self):
-        if self.data is None:
-            self.data = {}
-
-
 class Middleware(ABC):
-    """Base Middleware - yeni middleware eklemek için bu sınıftan türet"""
+    """
+    Base Middleware - yeni middleware eklemek için bu sınıftan türet.
+    Override edilmeyen before/after pipeline'a hiç eklenmez.
+    """
     
-    @abstractmethod
-    async def before(self, ctx: MiddlewareContext) -> bool:
-        """Handler'dan önce çalışır. False dönerse pipeline durur."""
+    async def before(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
+        """
+        Handler'dan önce çalışır. False dönerse pipeline durur.
+        İstek boyunca paylaşılacak veri için context.user_data kullanılır.
+        """
         return True
     
-    async def after(self, ctx: MiddlewareContext, result: Any, error: Optional[Exception] = None) -> None:
+    async def after(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        result: Any,
+        error: Optional[Exception] = None,
+    ) -> None:
         """Handler'dan sonra çalışır"""
         pass
 
@@ -43,16 +41,30 @@ class Middleware(ABC):
 class LoggingMiddleware(Middleware):
     """Logging middleware - tüm istekleri loglar"""
     
-    async def before(self, ctx: MiddlewareContext) -> bool:
-        user = ctx.update.effective_user
-        chat = ctx.update.effective_chat
-        logger.info(f"[REQUEST] User: {user.id if user else 'N/A'} | Chat: {chat.id if chat else 'N/A'}")
+    async def before(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
+        # INFO kapalıysa kullanıcı/chat bilgisi hiç toplanmaz
+        if not logger.isEnabledFor(logging.INFO):
+            return True
+        
+        user = update.effective_user
+        chat = update.effective_chat
+        logger.info(
+            "[REQUEST] User: %s | Chat: %s",
+            user.id if user else 'N/A',
+            chat.id if chat else 'N/A',
+        )
         return True
     
-    async def after(self, ctx: MiddlewareContext, result: Any, error: Optional[Exception] = None) -> None:
+    async def after(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        result: Any,
+        error: Optional[Exception] = None,
+    ) -> None:
         if error:
-            logger.error(f"[RESPONSE] Error: {error}")
-        else:
+            logger.error("[RESPONSE] Error: %s", error)
+        elif logger.isEnabledFor(logging.DEBUG):
             logger.debug("[RESPONSE] Success")
 
 
@@ -62,15 +74,18 @@ class ErrorHandlingMiddleware(Middleware):
     def __init__(self, error_callback: Optional[Callable] = None):
         self.error_callback = error_callback
     
-    async def before(self, ctx: MiddlewareContext) -> bool:
-        return True
-    
-    async def after(self, ctx: MiddlewareContext, result: Any, error: Optional[Exception] = None) -> None:
+    async def after(
+        self,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        result: Any,
+        error: Optional[Exception] = None,
+    ) -> None:
         if error:
             logger.error(f"Handler hatası: {error}", exc_info=True)
-            if ctx.update.message:
+            if update.message:
                 try:
-                    await ctx.update.message.reply_text("❌ Bir hata oluştu. Lütfen tekrar deneyin.")
+                    await update.message.reply_text("❌ Bir hata oluştu. Lütfen tekrar deneyin.")
                 except Exception as e:
                     logger.error(f"Hata mesajı gönderilemedi: {e}")
 
@@ -80,23 +95,41 @@ class MiddlewarePipeline:
     
     def __init__(self):
         self._middlewares: List[Middleware] = []
+        # Çağrı zinciri add() sırasında hazırlanır (istek başına reversed/lookup yok)
+        self._before: Tuple[Callable, ...] = ()
+        self._after: Tuple[Callable, ...] = ()
     
     def add(self, middleware: Middleware) -> "MiddlewarePipeline":
         """Middleware ekle (fluent interface)"""
         self._middlewares.append(middleware)
+        # Base sınıfın no-op hook'ları zincire alınmaz
+        self._before = tuple(
+            m.before for m in self._middlewares
+            if type(m).before is not Middleware.before
+        )
+        self._after = tuple(
+            m.after for m in reversed(self._middlewares)
+            if type(m).after is not Middleware.after
+        )
         return self
     
     def wrap(self, handler: Callable) -> Callable:
-        """Handler'ı middleware pipeline ile sar (decorator)"""
+        """
+        Handler'ı middleware pipeline ile sar (decorator).
+        Middleware yoksa handler olduğu gibi döner; sonradan eklenenler
+        bu handler'a uygulanmaz.
+        """
+        if not self._middlewares:
+            return handler
+        
         @wraps(handler)
         async def wrapped(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Any:
-            ctx = MiddlewareContext(update=update, context=context)
             result, error = None, None
             
             # Before middlewares
-            for middleware in self._middlewares:
+            for before in self._before:
                 try:
-                    if not await middleware.before(ctx):
+                    if not await before(update, context):
                         return None
                 except Exception as e:
                     error = e
@@ -110,9 +143,9 @@ class MiddlewarePipeline:
                     error = e
             
             # After middlewares (ters sırada)
-            for middleware in reversed(self._middlewares):
+            for after in self._after:
                 try:
-                    await middleware.after(ctx, result, error)
+                    await after(update, context, result, error)
                 except Exception as e:
                     logger.error(f"Middleware after hatası: {e}")
             
@@ -121,5 +154,5 @@ class MiddlewarePipeline:
 
 
 def create_default_pipeline() -> MiddlewarePipeline:
-    """Varsayılan middleware pipeline oluştur"""
+    """Varsayılan middleware pipeline oluştur (her çağrıda yeni, bağımsız örnek)"""
     return MiddlewarePipeline().add(LoggingMiddleware()).add(ErrorHandlingMiddleware())
@@ -0,0 +1,29 @@
+"""
+Process Workflow Tests
+Tarayıcı ön başlatma ve boşta kapatma testleri
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.use_cases.process_workflow import ProcessImageWorkflowUseCase
+
+
+class TestBrowserWarmUp:
+    """warm_up_browser testleri"""
+    
+    @pytest.mark.asyncio
+    async def test_warm_up_without_job_closes_browser_when_idle(self):
+        """Ön başlatılan tarayıcı iş gelmezse boşta kapatılmalı"""
+        browser = MagicMock()
+        browser.is_running.return_value = False
+        use_case = ProcessImageWorkflowUseCase(MagicMock(), browser, MagicMock())
+        use_case.BROWSER_IDLE_TIMEOUT = 0.01
+        
+        await use_case.warm_up_browser()
+        browser.start.assert_called_once()
+        
+        await asyncio.sleep(0.1)
+        browser.stop.assert_called_once()
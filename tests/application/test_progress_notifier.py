@@ -0,0 +1,97 @@
+"""
+Progress Notifier Tests
+İlerleme mesajlarının birleştirilmesi (rate limiting) testleri
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from src.application.services import ProgressNotifierService
+from src.domain import ProcessStatus
+
+
+class TestProgressNotifierService:
+    """ProgressNotifierService testleri"""
+    
+    @pytest.mark.asyncio
+    async def test_rapid_updates_are_coalesced(self):
+        """Aralık içindeki güncellemeler tek mesajda, son durumla gönderilmeli"""
+        callback = AsyncMock()
+        notifier = ProgressNotifierService(update_callback=callback)
+        notifier._min_update_interval = 0.05
+        
+        await notifier.notify_step(ProcessStatus.DOWNLOADING)
+        await notifier.notify_step(ProcessStatus.UPLOADING)
+        await notifier.notify_step(ProcessStatus.ANALYZING, extra_info="son durum")
+        assert callback.await_count == 1
+        
+        await asyncio.sleep(0.1)
+        
+        assert callback.await_count == 2
+        assert "son durum" in callback.await_args.args[0]
+    
+    @pytest.mark.asyncio
+    async def test_complete_cancels_pending_update(self):
+        """Tamamlama mesajı bekleyen ilerleme güncellemesiyle ezilmemeli"""
+        callback = AsyncMock()
+        notifier = ProgressNotifierService(update_callback=callback)
+        notifier._min_update_interval = 0.05
+        
+        await notifier.notify_step(ProcessStatus.DOWNLOADING)
+        await notifier.notify_step(ProcessStatus.GENERATING)
+        await notifier.notify_complete(success=True)
+        
+        await asyncio.sleep(0.1)
+        
+        assert callback.await_count == 2
+        assert "TAMAMLANDI" in callback.await_args.args[0]
+    
+    @pytest.mark.asyncio
+    async def test_complete_waits_for_in_flight_update(self):
+        """Gönderilmekte olan ilerleme mesajı tamamlama mesajından sonra gelmemeli"""
+        sent = []
+        
+        async def slow_callback(text, markdown=False):
+            # İlerleme düzenlemesi ağda yavaş, tamamlama hızlı
+            await asyncio.sleep(0 if "TAMAMLANDI" in text else 0.05)
+            sent.append(text)
+        
+        notifier = ProgressNotifierService(update_callback=slow_callback)
+        
+        progress = asyncio.create_task(notifier.notify_step(ProcessStatus.ANALYZING))
+        await asyncio.sleep(0)
+        await notifier.notify_complete(success=True)
+        await progress
+        
+        assert len(sent) == 2
+        assert "TAMAMLANDI" in sent[-1]
+    
+    @pytest.mark.asyncio
+    async def test_rate_limit_defers_next_update(self):
+        """retry_after süresi dolmadan yeni düzenleme gönderilmemeli"""
+        rate_limited = Exception("Flood control exceeded")
+        rate_limited.retry_after = 0.05
+        callback = AsyncMock(side_effect=[rate_limited, None])
+        notifier = ProgressNotifierService(update_callback=callback)
+        notifier._min_update_interval = 0
+        
+        await notifier.notify_step(ProcessStatus.DOWNLOADING)
+        await notifier.notify_step(ProcessStatus.ANALYZING)
+        assert callback.await_count == 1
+        
+        await asyncio.sleep(0.1)
+        
+        assert callback.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_complete_message_has_single_title(self):
+        """Tamamlama başlığı bir kez, ardından ayırıcı gelmeli"""
+        callback = AsyncMock()
+        notifier = ProgressNotifierService(update_callback=callback)
+        
+        await notifier.notify_complete(success=True)
+        
+        text = callback.await_args.args[0]
+        assert text.count("İŞLEM TAMAMLANDI") == 1
+        assert text.startswith("🎉 İŞLEM TAMAMLANDI!\n" + "━" * 24 + "\n\n")
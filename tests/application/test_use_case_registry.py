@@ -3,13 +3,6 @@ Use Case Registry Tests
 Registry ve auto-discovery testleri
 """
 
-import pytest
-from pathlib import Path
-import sys
-
-# Proje kökünü path'e ekle
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from src.core import UseCaseRegistry, UseCaseMetadata, get_use_case_registry
 
 
@@ -66,7 +59,3 @@ class TestUseCaseRegistry:
         registry2 = get_use_case_registry()
         
         assert registry1 is not registry2
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
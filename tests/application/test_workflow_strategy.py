@@ -5,11 +5,6 @@ Strategy pattern ve workflow orkestrasyon testleri
 
 import pytest
 from unittest.mock import Mock, AsyncMock, MagicMock
-from pathlib import Path
-import sys
-
-# Proje kökünü path'e ekle
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.application.strategies import (
     WorkflowStrategy,
@@ -192,7 +187,3 @@ class TestDirectGenerateStrategy:
         assert result.success
         assert len(result.generated_image_paths) == 2
         assert ai_service.generate_image.call_count == 2
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
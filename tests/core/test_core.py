@@ -4,7 +4,7 @@ Result monad ve plugin registry testleri
 """
 
 import pytest
-from src.core import Result, PluginMetadata
+from src.core import Result, PluginMetadata, PluginRegistry
 
 
 class TestResult:
@@ -102,5 +102,42 @@ class TestPluginMetadata:
         assert not meta.supports("unknown")
 
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+
+def _make_plugin(name: str, priority: int, features=()):
+    """Verilen metadata ile test plugin sınıfı oluştur"""
+    meta = PluginMetadata(name=name, priority=priority, supported_features=set(features))
+    return type(name, (), {"get_metadata": classmethod(lambda cls: meta)})
+
+
+class _TestRegistry(PluginRegistry):
+    def _get_plugin_package(self) -> str:
+        return "tests"
+    
+    def _get_base_class(self):
+        return object
+
+
+class TestPluginRegistry:
+    """PluginRegistry öncelik sıralaması testleri"""
+    
+    def test_get_by_feature_picks_highest_priority(self):
+        """Özelliği destekleyen en öncelikli plugin seçilir"""
+        registry = _TestRegistry()
+        registry.register(_make_plugin("low", 1, {"analyze"}))
+        registry.register(_make_plugin("high", 10, {"generate"}))
+        registry.register(_make_plugin("mid", 5, {"analyze"}))
+        
+        assert type(registry.get_by_feature("analyze")).__name__ == "mid"
+        assert registry.get_by_feature("unknown") is None
+    
+    def test_register_invalidates_priority_order(self):
+        """Yeni kayıt sonrası sıralama yeniden hesaplanır"""
+        registry = _TestRegistry()
+        registry.register(_make_plugin("first", 1, {"analyze"}))
+        assert registry._by_priority() == ["first"]
+        
+        registry.register(_make_plugin("second", 2, {"analyze"}))
+        assert registry._by_priority() == ["second", "first"]
+        
+        registry.clear()
+        assert registry._by_priority() == []
@@ -0,0 +1,41 @@
+"""
+Domain test fixture'ları
+Değişmeyen entity'ler modül başına bir kez oluşturulur.
+"""
+
+import pytest
+
+from src.domain.entities import ImageEntity, ProcessContext, SessionEntity
+
+
+@pytest.fixture(scope="module")
+def session():
+    """Testlerde paylaşılan oturum (testler değiştirmez)"""
+    return SessionEntity(chat_id="123", user_id="456")
+
+
+@pytest.fixture(scope="module")
+def image():
+    """Testlerde paylaşılan orijinal görsel (testler değiştirmez)"""
+    return ImageEntity(path="/tmp/test.png")
+
+
+@pytest.fixture(scope="session")
+def existing_png(tmp_path_factory):
+    """Diskte gerçekten var olan görsel yolu (oturum başına bir kez oluşturulur)"""
+    image_file = tmp_path_factory.mktemp("images") / "real.png"
+    image_file.touch()
+    return str(image_file)
+
+
+@pytest.fixture
+def context_factory(session, image):
+    """Her çağrıda yeni ProcessContext - durum testler arasında taşınmaz"""
+    def create(target_count: int = 1) -> ProcessContext:
+        return ProcessContext(
+            session=session,
+            original_image=image,
+            target_count=target_count,
+        )
+    
+    return create
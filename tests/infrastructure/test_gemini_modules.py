@@ -0,0 +1,54 @@
+"""
+Gemini Modules Tests
+Oturum başına paylaşılan modül kümesi ve kapanışta temizlik testleri
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.ai.gemini import GeminiModules
+from src.infrastructure.browser.selenium_browser import SeleniumBrowserService
+
+
+@pytest.fixture
+def browser():
+    service = SeleniumBrowserService()
+    service.driver = MagicMock(session_id="session-1")
+    yield service
+    GeminiModules.forget("session-1")
+
+
+class TestGeminiModules:
+    """GeminiModules oturum kaydı testleri"""
+    
+    def test_same_settings_share_modules(self, browser, tmp_path):
+        """Aynı oturum ve ayarlar aynı kümeyi döndürür"""
+        first = GeminiModules.for_browser(browser, "https://gemini", str(tmp_path))
+        second = GeminiModules.for_browser(browser, "https://gemini", str(tmp_path))
+        
+        assert first is second
+    
+    def test_settings_share_session_state(self, browser, tmp_path):
+        """Farklı ayarlar ayrı küme alır ama oturumun runner ve ağ logu ortaktır"""
+        first = GeminiModules.for_browser(browser, "https://gemini", str(tmp_path))
+        other = GeminiModules.for_browser(browser, "https://other", str(tmp_path))
+        
+        assert first is not other
+        assert first.navigator._scripts is other.uploader._scripts
+        assert first.prompt_manager._network is other.prompt_manager._network
+    
+    def test_stop_releases_session(self, browser, tmp_path):
+        """Tarayıcı kapanınca oturum kaydı silinir"""
+        GeminiModules.for_browser(browser, "https://gemini", str(tmp_path))
+        
+        browser.stop()
+        
+        assert "session-1" not in GeminiModules._sessions
+    
+    def test_listener_registered_once(self, browser, tmp_path):
+        """Her çağrı dinleyiciyi yeniden eklemez"""
+        GeminiModules.for_browser(browser, "https://gemini", str(tmp_path))
+        GeminiModules.for_browser(browser, "https://gemini", str(tmp_path))
+        
+        assert browser._stop_listeners == [GeminiModules.forget]
@@ -0,0 +1,93 @@
+"""
+Selenium Browser Tests
+Saklanan WebDriver oturumuna bağlanma testleri
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.webdriver.remote.command import Command
+
+from src.infrastructure.ai.gemini import GeminiNetworkLog
+from src.infrastructure.browser import selenium_browser
+from src.infrastructure.browser.selenium_browser import (
+    SeleniumBrowserService,
+    _AttachedChromeDriver,
+)
+
+EXECUTOR = "http://127.0.0.1:9515"
+
+
+def _responses(command, params=None):
+    """chromedriver yanıtları - oturum canlı, performans logu boş"""
+    if command == Command.GET_CURRENT_URL:
+        return {"value": "https://gemini.google.com/app"}
+    return {"value": []}
+
+
+@pytest.fixture
+def session_file(tmp_path):
+    path = tmp_path / "chrome_profile.webdriver_session.json"
+    path.write_text(json.dumps({
+        "session_id": "session-1",
+        "command_executor": EXECUTOR,
+    }), encoding="utf-8")
+    return path
+
+
+class TestAttachedChromeDriver:
+    """Mevcut oturuma bağlanan sürücü testleri"""
+    
+    def test_get_log_uses_goog_log_command(self):
+        """Performans logu webdriver.Chrome ile aynı komutla okunur"""
+        driver = _AttachedChromeDriver(EXECUTOR, "session-1")
+        
+        with patch.object(driver, "execute", return_value={"value": []}) as execute:
+            assert driver.get_log("performance") == []
+        
+        execute.assert_called_once_with(Command.GET_LOG, {"type": "performance"})
+    
+    def test_execute_cdp_cmd(self):
+        """CDP komutları çalışır (capabilities'de tarayıcı adı var)"""
+        driver = _AttachedChromeDriver(EXECUTOR, "session-1")
+        
+        with patch.object(driver, "execute", return_value={"value": {}}) as execute:
+            assert driver.execute_cdp_cmd("Network.enable", {}) == {}
+        
+        execute.assert_called_once_with(
+            "executeCdpCommand", {"cmd": "Network.enable", "params": {}}
+        )
+
+
+class TestPersistedSession:
+    """Saklanan oturumun yeniden kullanımı testleri"""
+    
+    def test_start_attaches_to_persisted_session(self, session_file):
+        """Canlı oturum varsa yeni Chrome açılmaz; ağ logu okunabilir"""
+        service = SeleniumBrowserService(session_file=str(session_file))
+        
+        with patch.object(_AttachedChromeDriver, "execute", side_effect=_responses), \
+             patch.object(selenium_browser.webdriver, "Chrome") as chrome:
+            service.start()
+            
+            assert GeminiNetworkLog(service.driver).poll() is True
+        
+        chrome.assert_not_called()
+        assert service.session_id == "session-1"
+    
+    def test_stale_session_is_closed_before_launch(self, session_file):
+        """Kullanılamayan oturum kapatılır ve yeni Chrome açılır"""
+        service = SeleniumBrowserService(session_file=str(session_file))
+        execute = MagicMock(side_effect=Exception("invalid session id"))
+        
+        with patch.object(_AttachedChromeDriver, "execute", execute), \
+             patch.object(SeleniumBrowserService, "_resolve_driver_path", return_value="chromedriver"), \
+             patch.object(selenium_browser, "Service"), \
+             patch.object(selenium_browser.webdriver, "Chrome") as chrome:
+            service.start()
+        
+        commands = [call.args[0] for call in execute.call_args_list]
+        assert Command.QUIT in commands
+        chrome.assert_called_once()
+        assert service.driver is chrome.return_value
@@ -0,0 +1,3 @@
+"""
+Presentation tests package
+"""
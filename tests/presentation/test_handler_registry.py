@@ -0,0 +1,130 @@
+"""
+Handler Registry Tests
+Handler sırası ve dispatch davranışı testleri
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from telegram.ext import CommandHandler, MessageHandler, filters
+
+from src.presentation.handlers.handler_registry import ConversationConfig, HandlerRegistry
+
+
+class _RecordingApp:
+    """add_handler çağrılarını sırasıyla kaydeden sahte Application"""
+    
+    def __init__(self):
+        self.handlers = []
+    
+    def add_handler(self, handler, group=0):
+        self.handlers.append((handler, group))
+
+
+async def _first(update, context):
+    pass
+
+
+async def _second(update, context):
+    pass
+
+
+@pytest.fixture
+def registry():
+    return HandlerRegistry()
+
+
+class TestMessageHandlers:
+    """Message handler kayıt testleri"""
+    
+    def test_same_filter_handlers_stay_separate_in_order(self, registry):
+        """Aynı filtreli handler'lar birleştirilmez; PTB'de ilk eşleşen çalışır"""
+        text_filter = filters.TEXT
+        registry.register_message_handler(_first, text_filter)
+        registry.register_message_handler(_second, text_filter)
+        
+        app = _RecordingApp()
+        registry.apply_to_application(app)
+        
+        handlers = [handler for handler, _ in app.handlers]
+        assert all(isinstance(h, MessageHandler) for h in handlers)
+        assert [h.callback for h in handlers] == [_first, _second]
+
+
+class TestCommandHandlers:
+    """Command handler birleştirme testleri"""
+    
+    def test_adjacent_commands_share_one_handler(self, registry):
+        """Art arda gelen komutlar tek handler'da, doğru fonksiyona yönlenir"""
+        registry.register_command("alpha", _first)
+        registry.register_command("beta", _second)
+        
+        app = _RecordingApp()
+        registry.apply_to_application(app)
+        
+        assert len(app.handlers) == 1
+        handler, _ = app.handlers[0]
+        assert isinstance(handler, CommandHandler)
+        assert handler.commands == frozenset({"alpha", "beta"})
+    
+    @pytest.mark.asyncio
+    async def test_merged_handler_dispatches_by_command(self, registry):
+        """Birleşik handler komut adına göre (bot adı ve büyük harf yok sayılır) çağırır"""
+        alpha, beta = AsyncMock(), AsyncMock()
+        registry.register_command("alpha", alpha)
+        registry.register_command("beta", beta)
+        
+        app = _RecordingApp()
+        registry.apply_to_application(app)
+        handler, _ = app.handlers[0]
+        
+        update = SimpleNamespace(effective_message=SimpleNamespace(text="/Beta@my_bot 3"))
+        await handler.callback(update, None)
+        
+        beta.assert_awaited_once_with(update, None)
+        alpha.assert_not_awaited()
+    
+    def test_priority_order_is_preserved_around_message_handler(self, registry):
+        """Aradaki message handler varsa komutlar birleşmez, sıra korunur"""
+        registry.register_command("alpha", _first, priority=10)
+        registry.register_message_handler(_second, filters.TEXT, priority=5)
+        registry.register_command("beta", _first, priority=0)
+        
+        app = _RecordingApp()
+        registry.apply_to_application(app)
+        
+        handlers = [handler for handler, _ in app.handlers]
+        assert [type(h) for h in handlers] == [CommandHandler, MessageHandler, CommandHandler]
+        assert handlers[0].commands == frozenset({"alpha"})
+        assert handlers[2].commands == frozenset({"beta"})
+    
+    def test_other_group_does_not_split_commands(self, registry):
+        """Başka gruptaki handler aynı grubun komut sırasını etkilemez"""
+        registry.register_command("alpha", _first, priority=10)
+        registry.register_message_handler(_second, filters.TEXT, priority=5, group=1)
+        registry.register_command("beta", _first, priority=0)
+        
+        app = _RecordingApp()
+        registry.apply_to_application(app)
+        
+        group_zero = [handler for handler, group in app.handlers if group == 0]
+        assert len(group_zero) == 1
+        assert group_zero[0].commands == frozenset({"alpha", "beta"})
+
+
+class TestConversationConfig:
+    """ConversationConfig varsayılan değer testleri"""
+    
+    def test_defaults_are_mutable_and_independent(self):
+        """Varsayılan listeler/sözlük değiştirilebilir ve örnekler arasında paylaşılmaz"""
+        first = ConversationConfig(name="first")
+        second = ConversationConfig(name="second")
+        
+        first.entry_points.append("entry")
+        first.states[1] = ["state"]
+        first.fallbacks.append("fallback")
+        
+        assert second.entry_points == []
+        assert second.states == {}
+        assert second.fallbacks == []